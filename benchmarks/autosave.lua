@@ -0,0 +1,178 @@
+-- In-memory DataStore, clock, Heartbeat and Players stand-ins, plus the
+-- 30-second save-everyone loop that init.server.luau ran before
+-- InventorySaveScheduler, so both can be driven through the same simulated
+-- session. Loaded by run_benchmarks.py through lupa; plain Lua, no Roblox globals.
+
+local WRITE_WINDOW = 60
+
+warn = warn or function() end
+task = {
+    spawn = function(fn, ...)
+        fn(...)
+    end,
+    wait = function() end,
+}
+
+local function newSignal()
+    local signal = { handlers = {} }
+
+    function signal:Connect(handler)
+        local connection = {}
+        function connection.Disconnect()
+            signal.handlers[connection] = nil
+        end
+        self.handlers[connection] = handler
+        return connection
+    end
+
+    function signal:Fire(...)
+        for _, handler in pairs(self.handlers) do
+            handler(...)
+        end
+    end
+
+    return signal
+end
+
+-- Deterministic LCG so both implementations see identical sessions.
+local function newRandom(seed)
+    local state = seed
+    return function()
+        state = (state * 1103515245 + 12345) % 2147483648
+        return state / 2147483648
+    end
+end
+
+-- SetAsync with the Roblox write limit (60 + 10 * players per minute, over a
+-- sliding window): requests beyond it are rejected as throttled.
+local function newDataStore(clock, players)
+    local store = { data = {}, requests = {}, throttled = 0, writes = 0, perSecond = {} }
+
+    function store:SetAsync(key, value)
+        local now = clock()
+        local recent = {}
+        for _, at in ipairs(self.requests) do
+            if now - at < WRITE_WINDOW then
+                table.insert(recent, at)
+            end
+        end
+        self.requests = recent
+        if #recent >= 60 + 10 * #players:GetPlayers() then
+            self.throttled = self.throttled + 1
+            error("DataStore request was throttled")
+        end
+        table.insert(self.requests, now)
+        self.writes = self.writes + 1
+        local second = math.floor(now)
+        self.perSecond[second] = (self.perSecond[second] or 0) + 1
+        self.data[key] = value
+    end
+
+    function store:peakPerSecond()
+        local peak = 0
+        for _, writes in pairs(self.perSecond) do
+            peak = math.max(peak, writes)
+        end
+        return peak
+    end
+
+    return store
+end
+
+-- The original saving: SetAsync after every inventory action, plus every
+-- player in one frame every 30 s.
+local function legacyAutosave(players, heartbeat, clock, save)
+    local lastSave = clock()
+    heartbeat:Connect(function()
+        if clock() - lastSave >= 30 then
+            lastSave = clock()
+            for _, player in ipairs(players:GetPlayers()) do
+                save(player)
+            end
+        end
+    end)
+    return {
+        markDirty = function(_, userId)
+            save(players.list[userId])
+        end,
+    }
+end
+
+-- Simulates `minutes` of play at 10 Heartbeats per second; each player changes
+-- their inventory with probability `activity` per second. Returns the number
+-- of writes, throttled requests, the busiest second's writes during play and whether every
+-- player's last change reached the store once everyone left.
+-- `InventorySaveScheduler` is the module table, or nil for the legacy loop.
+local function scenario(InventorySaveScheduler, playerCount, minutes, activity, seed)
+    local now = 0
+    local function clock()
+        return now
+    end
+    local random = newRandom(seed)
+    local heartbeat = newSignal()
+    local players = { list = {} }
+    function players:GetPlayers()
+        return self.list
+    end
+    for index = 1, playerCount do
+        players.list[index] = { UserId = index, Name = "Player" .. index, version = 0 }
+    end
+    local store = newDataStore(clock, players)
+
+    local function save(player)
+        local ok = pcall(store.SetAsync, store, tostring(player.UserId), player.version)
+        return ok
+    end
+
+    local saver
+    if InventorySaveScheduler then
+        saver = InventorySaveScheduler.new({
+            save = save,
+            clock = clock,
+            random = random,
+            heartbeat = heartbeat,
+            players = players,
+        })
+        for _, player in ipairs(players.list) do
+            saver:track(player.UserId, player)
+        end
+    else
+        saver = legacyAutosave(players, heartbeat, clock, save)
+    end
+
+    return function()
+        for frame = 1, minutes * 600 do
+            now = frame / 10
+            if frame % 10 == 0 then
+                for _, player in ipairs(players.list) do
+                    if random() < activity then
+                        player.version = player.version + 1
+                        saver:markDirty(player.UserId)
+                    end
+                end
+            end
+            heartbeat:Fire(0.1)
+        end
+        local peak = store:peakPerSecond()
+        -- Everyone leaves: the scheduler flushes, the old PlayerRemoving saved unconditionally.
+        if InventorySaveScheduler then
+            saver:flushAll()
+        else
+            for _, player in ipairs(players.list) do
+                save(player)
+            end
+        end
+
+        local persisted = true
+        for _, player in ipairs(players.list) do
+            if player.version > 0 and store.data[tostring(player.UserId)] ~= player.version then
+                persisted = false
+            end
+        end
+        return store.writes, store.throttled, peak, persisted
+    end
+end
+
+return {
+    scenario = scenario,
+}
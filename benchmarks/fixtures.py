@@ -0,0 +1,184 @@
+"""
+Synthetic inputs for the tools benchmarks.
+
+Every generator is deterministic (seeded) and sized by a `scale` factor, so
+1x roughly matches the real project data and 10x / 100x show how each
+function grows. Nothing here reads the real data files.
+"""
+
+import random
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from PIL import Image
+
+# Sizes at 1x, matched to the current project data.
+MANIFEST_ENTRIES = 300
+NOOKIPEDIA_ITEMS = 200
+NOOKIPEDIA_RECIPES = 80
+XLSX_ROWS_PER_SHEET = 80
+STORED_INVENTORIES = 50
+
+_WORDS = (
+    "apple", "cherry", "pear", "peach", "orange", "wooden", "iron", "golden", "stone", "bamboo",
+    "shell", "star", "maple", "cedar", "round", "striped", "tiny", "royal", "retro", "garden",
+    "chair", "table", "lamp", "rug", "wall", "shovel", "net", "rod", "fossil", "tulip",
+    "rose", "lily", "bass", "moth", "beetle", "crab", "box", "sofa", "bed", "clock",
+)
+_CATEGORIES = ("Housewares", "Miscellaneous", "Wall-Mounted", "Ceiling Decor", "Interior Structures")
+_SOURCES = ("Nook's Cranny", "Nook Shopping", "Crafting", "Tom Nook", "Redd's Co-Op", "any villager")
+_THEMES = ("Fancy", "Party", "Harmonious", "Facility", "Child's room", "Living room", "Expensive")
+_LOCATIONS = ("River", "Pond", "Sea", "Pier", "River (Clifftop)", "Flying", "On flowers", "Underground", "On trees (any kind)")
+_TIMES = ("All day", "4 AM – 9 PM", "9 AM – 4 PM", "4 PM – 9 AM", "9 PM – 4 AM", "8 AM – 5 PM & 7 PM – 4 AM", "NA")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _names(rng: random.Random, count: int) -> List[str]:
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+        if name in seen:
+            name = f"{name} {len(names)}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def sprite_manifest(scale: int, seed: int = 0) -> str:
+    """SpriteManifest.luau text with category comments and one entry per line."""
+    rng = random.Random(seed)
+    lines = ["return {"]
+    for index, name in enumerate(_names(rng, MANIFEST_ENTRIES * scale), 1):
+        if index % 25 == 1:
+            lines.append("")
+            lines.append(f"    -- {rng.choice(_CATEGORIES)}")
+        key = name.replace(" ", "_")
+        lines.append(f'    {key} = {{ name = "{name.title()}", spriteIndex = {index} }},')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def nookipedia_payload(scale: int, seed: int = 0) -> Dict:
+    """nookipedia_items.json-shaped furniture and recipes."""
+    rng = random.Random(seed)
+    furniture = []
+    for name in _names(rng, NOOKIPEDIA_ITEMS * scale):
+        furniture.append({
+            "name": name,
+            "category": rng.choice(_CATEGORIES),
+            "item_series": rng.choice((None, "Mario", "Cute", "Rattan")),
+            "item_set": None,
+            "tag": rng.choice(("Chair", "Table", "Lamp", None)),
+            "sell": rng.randint(10, 5000),
+            "buy": [{"price": rng.randint(100, 20000), "currency": "Bells"}],
+            "availability": [{"from": rng.choice(_SOURCES)} for _ in range(rng.randint(1, 2))],
+            "themes": rng.sample(_THEMES, rng.randint(0, 2)),
+            "variations": [{"variation": str(v)} for v in range(rng.randint(0, 4))],
+        })
+    recipes = []
+    for name in _names(rng, NOOKIPEDIA_RECIPES * scale):
+        recipes.append({
+            "name": name,
+            "sell": rng.randint(10, 5000),
+            "materials": [{"name": rng.choice(_WORDS), "count": rng.randint(1, 10)} for _ in range(rng.randint(1, 4))],
+            "availability": [{"from": rng.choice(_SOURCES)}],
+        })
+    return {"furniture": furniture, "recipes": recipes}
+
+
+def items_payload(scale: int, seed: int = 0) -> Dict:
+    """data/items.json-shaped payload, as build_items_dataset produces it."""
+    rng = random.Random(seed)
+    source = nookipedia_payload(scale, seed)
+    items = []
+    for entry in source["furniture"]:
+        slug = entry["name"].replace(" ", "-")
+        items.append({
+            "id": slug,
+            "name": entry["name"],
+            "category": entry["category"],
+            "series": entry["item_series"],
+            "set": None,
+            "tag": entry["tag"],
+            "sell": entry["sell"],
+            "buy": entry["buy"][0]["price"],
+            "source": [offer["from"] for offer in entry["availability"]],
+            "themes": entry["themes"],
+        })
+    recipes = []
+    for entry in source["recipes"]:
+        slug = entry["name"].replace(" ", "-")
+        recipes.append({
+            "id": slug,
+            "itemId": slug,
+            "name": entry["name"],
+            "sell": entry["sell"],
+            "station": rng.choice(("workbench", "cooking")),
+            "time": rng.randint(4, 14),
+            "materials": [{"itemId": m["name"], "name": m["name"], "count": m["count"]} for m in entry["materials"]],
+            "source": [offer["from"] for offer in entry["availability"]],
+        })
+    return {"items": items, "recipes": recipes, "meta": {"source": "Nookipedia", "itemsSampled": len(items), "recipesSampled": len(recipes)}}
+
+
+def stored_inventories(scale: int, seed: int = 0) -> List[Dict]:
+    """DataStore values as savePlayerInventory wrote them before the packed format."""
+    rng = random.Random(seed)
+    ids = [name.replace(" ", "_") for name in _names(rng, 120)]
+    records = []
+    for _ in range(STORED_INVENTORIES * scale):
+        level = rng.randint(1, 4)
+        max_slots = level * 10
+        slots = []
+        legacy = []
+        for index in range(1, max_slots + 1):
+            if rng.random() < 0.7:
+                item_id = rng.choice(ids)
+                count = rng.choice((1, 1, 1, rng.randint(2, 99)))
+                slots.append({"itemId": item_id, "count": count})
+                legacy.append({"slot": index, "itemId": item_id, "amount": count, "data": None})
+            else:
+                slots.append({"itemId": "", "count": 0})
+        records.append({
+            "slots": slots,
+            "maxSlots": max_slots,
+            "inventoryLevel": level,
+            "legacyPayload": {"capacity": max_slots, "version": "2024.01", "inventory": legacy},
+        })
+    return records
+
+
+def acnh_workbook(path: Path, scale: int, seed: int = 0) -> Path:
+    """docs/acnh.xlsx-shaped workbook with Fish and Insects sheets (needs openpyxl)."""
+    from openpyxl import Workbook
+
+    rng = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    header = ["Name", "Sell", "Where/How", "Description"] + [f"NH {month}" for month in _MONTHS]
+    for sheet_name in ("Fish", "Insects"):
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(header)
+        for name in _names(rng, XLSX_ROWS_PER_SHEET * scale):
+            months = [rng.choice(_TIMES) for _ in _MONTHS]
+            sheet.append([name, rng.randint(10, 15000), rng.choice(_LOCATIONS), f"A {name}."] + months)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(path)
+    return path
+
+
+def sprite_sheet(path: Path, scale: int, columns: int = 21, tile: int = 34, padding: int = 9, seed: int = 0) -> Path:
+    """RGBA grid sheet; `scale` multiplies the number of rows."""
+    rng = np.random.default_rng(seed)
+    rows = 24 * scale
+    pitch = tile + padding
+    sheet = np.zeros((6 + rows * pitch, 6 + columns * pitch, 4), dtype=np.uint8)
+    for row in range(rows):
+        for col in range(columns):
+            y, x = 4 + row * pitch, 6 + col * pitch
+            sheet[y:y + tile, x:x + tile, :3] = rng.integers(0, 255, 3, dtype=np.uint8)
+            sheet[y:y + tile, x:x + tile, 3] = 255
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(sheet, "RGBA").save(path)
+    return path
@@ -0,0 +1,126 @@
+-- Loads the shared inventory modules InventoryCodec depends on, with a
+-- `script` stand-in for their require(script.Parent.X) calls, and drives the
+-- codec over a batch of stored inventories as PlayerAdded would on joins.
+-- DataStores keep values as JSON text and GetAsync decodes it on every read,
+-- so the stored values are JSON here too and are decoded by a small JSON
+-- reader standing in for GetAsync's.
+-- Loaded by run_benchmarks.py through lupa; plain Lua, no Roblox globals.
+
+typeof = typeof or type
+table.clone = table.clone or function(value)
+    local copy = {}
+    for key, val in pairs(value) do
+        copy[key] = val
+    end
+    return copy
+end
+
+-- `sources` maps InventoryConstants, InventorySchemas, InventoryAdapters and
+-- InventoryCodec to their source text; returns the InventoryCodec table.
+local function loadCodec(sources)
+    local loaded = {}
+    local parent = {}
+    local function requireModule(name)
+        if loaded[name] == nil then
+            local env = setmetatable({
+                script = { Parent = parent },
+                require = function(module)
+                    return requireModule(module)
+                end,
+            }, { __index = _G })
+            loaded[name] = assert(load(sources[name], name, "t", env))()
+        end
+        return loaded[name]
+    end
+    for name in pairs(sources) do
+        parent[name] = name
+    end
+    return requireModule("InventoryCodec")
+end
+
+local ESCAPES = { b = "\b", f = "\f", n = "\n", r = "\r", t = "\t" }
+
+-- Decodes one JSON value starting at `position`; returns it and the next position.
+local function readJson(text, position)
+    position = string.find(text, "%S", position)
+    local char = string.sub(text, position, position)
+    if char == "{" then
+        local object = {}
+        position = string.find(text, "%S", position + 1)
+        if string.sub(text, position, position) == "}" then
+            return object, position + 1
+        end
+        while true do
+            local key, value
+            key, position = readJson(text, position)
+            position = string.find(text, ":", position, true)
+            value, position = readJson(text, position + 1)
+            object[key] = value
+            position = string.find(text, "%S", position)
+            if string.sub(text, position, position) == "}" then
+                return object, position + 1
+            end
+            position = position + 1
+        end
+    elseif char == "[" then
+        local array = {}
+        position = string.find(text, "%S", position + 1)
+        if string.sub(text, position, position) == "]" then
+            return array, position + 1
+        end
+        while true do
+            local value
+            value, position = readJson(text, position)
+            array[#array + 1] = value
+            position = string.find(text, "%S", position)
+            if string.sub(text, position, position) == "]" then
+                return array, position + 1
+            end
+            position = position + 1
+        end
+    elseif char == '"' then
+        local parts = {}
+        local start = position + 1
+        while true do
+            local stop = string.find(text, '["\\]', start)
+            table.insert(parts, string.sub(text, start, stop - 1))
+            if string.sub(text, stop, stop) == '"' then
+                return table.concat(parts), stop + 1
+            end
+            local escape = string.sub(text, stop + 1, stop + 1)
+            if escape == "u" then
+                table.insert(parts, utf8.char(tonumber(string.sub(text, stop + 2, stop + 5), 16)))
+                start = stop + 6
+            else
+                table.insert(parts, ESCAPES[escape] or escape)
+                start = stop + 2
+            end
+        end
+    elseif string.sub(text, position, position + 3) == "true" then
+        return true, position + 4
+    elseif string.sub(text, position, position + 4) == "false" then
+        return false, position + 5
+    elseif string.sub(text, position, position + 3) == "null" then
+        return nil, position + 4
+    end
+    local number = string.match(text, "^-?[%d.eE+-]+", position)
+    return tonumber(number), position + #number
+end
+
+-- Decodes and migrates every stored JSON value; returns the number of filled slots.
+local function loadAll(codec, stored)
+    local filled = 0
+    for _, json in ipairs(stored) do
+        local state = assert(codec.migrate((readJson(json, 1))))
+        for _ in pairs(state.slots) do
+            filled = filled + 1
+        end
+    end
+    return filled
+end
+
+return {
+    readJson = readJson,
+    loadCodec = loadCodec,
+    loadAll = loadAll,
+}
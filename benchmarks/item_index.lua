@@ -0,0 +1,170 @@
+-- A server inventory driven by craft requests: check a recipe's materials,
+-- consume them, and restock random slots between requests. The material
+-- checks run either as the full-slot scans init.server.luau used before
+-- InventoryItemIndex, or through the index kept current on every slot change.
+-- Loaded by run_benchmarks.py through lupa; plain Lua, no Roblox globals.
+
+table.clone = table.clone or function(value)
+    local copy = {}
+    for key, val in pairs(value) do
+        copy[key] = val
+    end
+    return copy
+end
+
+-- The original totalCountForItem / consumeCraftingMaterials scans.
+local function legacyInventory(slots, maxSlots)
+    local inventory = { slots = slots, maxSlots = maxSlots }
+
+    function inventory.markSlotDirty() end
+
+    function inventory.total(itemId)
+        local total = 0
+        for index = 1, maxSlots do
+            local slot = slots[index]
+            if slot and slot.itemId == itemId then
+                total = total + slot.count
+            end
+        end
+        return total
+    end
+
+    function inventory.consume(itemId, remaining)
+        for index = 1, maxSlots do
+            local slot = slots[index]
+            if slot and slot.itemId == itemId then
+                local toRemove = math.min(slot.count, remaining)
+                slot.count = slot.count - toRemove
+                remaining = remaining - toRemove
+                if slot.count <= 0 then
+                    slots[index] = nil
+                end
+                if remaining <= 0 then
+                    break
+                end
+            end
+        end
+    end
+
+    return inventory
+end
+
+local function indexedInventory(InventoryItemIndex, slots, maxSlots)
+    local inventory = { slots = slots, maxSlots = maxSlots }
+    local itemIndex = InventoryItemIndex.new(slots, maxSlots)
+    inventory.itemIndex = itemIndex
+
+    function inventory.markSlotDirty(index)
+        itemIndex:refresh(index, slots[index])
+    end
+
+    function inventory.total(itemId)
+        return itemIndex:total(itemId)
+    end
+
+    function inventory.consume(itemId, remaining)
+        for _, index in ipairs(table.clone(itemIndex:slotsFor(itemId))) do
+            local slot = slots[index]
+            local toRemove = math.min(slot.count, remaining)
+            slot.count = slot.count - toRemove
+            remaining = remaining - toRemove
+            if slot.count <= 0 then
+                slots[index] = nil
+            end
+            inventory.markSlotDirty(index)
+            if remaining <= 0 then
+                break
+            end
+        end
+    end
+
+    return inventory
+end
+
+-- Builds the starting slots and `requests` craft requests for a `maxSlots`
+-- inventory holding `itemKinds` different items; recipes need `materials` of
+-- them each. Every request carries the restock to apply if its materials are
+-- missing, so running the workload draws no random numbers.
+local function prepare(maxSlots, itemKinds, materials, requests, seed)
+    local state = seed
+    local function random(limit)
+        state = (state * 1103515245 + 12345) % 2147483648
+        return state % limit + 1
+    end
+    local itemIds = {}
+    for kind = 1, itemKinds do
+        itemIds[kind] = "item_" .. kind
+    end
+
+    local initial = {}
+    for index = 1, maxSlots do
+        initial[index] = { itemId = itemIds[random(itemKinds)], count = random(20) }
+    end
+
+    local steps = {}
+    for request = 1, requests do
+        local recipe = {}
+        for position = 1, materials do
+            recipe[position] = { itemId = itemIds[random(itemKinds)], count = random(3) }
+        end
+        steps[request] = {
+            recipe = recipe,
+            restock = { index = random(maxSlots), itemId = itemIds[random(itemKinds)], count = random(20) },
+        }
+    end
+
+    return { maxSlots = maxSlots, initial = initial, steps = steps }
+end
+
+-- Runs a prepared workload from fresh copies of its starting slots.
+-- `InventoryItemIndex` is the module table, or nil for the legacy scans.
+-- Returns crafts completed, a checksum of the final slots, the slots, and
+-- the index (nil for the legacy scans).
+local function scenario(InventoryItemIndex, workload)
+    local maxSlots = workload.maxSlots
+    local slots = {}
+    for index, slot in ipairs(workload.initial) do
+        slots[index] = table.clone(slot)
+    end
+    local inventory
+    if InventoryItemIndex then
+        inventory = indexedInventory(InventoryItemIndex, slots, maxSlots)
+    else
+        inventory = legacyInventory(slots, maxSlots)
+    end
+
+    local crafted = 0
+    for _, step in ipairs(workload.steps) do
+        local recipe = step.recipe
+        local hasMaterials = true
+        for _, requirement in ipairs(recipe) do
+            if inventory.total(requirement.itemId) < requirement.count then
+                hasMaterials = false
+                break
+            end
+        end
+
+        if hasMaterials then
+            for _, requirement in ipairs(recipe) do
+                inventory.consume(requirement.itemId, requirement.count)
+            end
+            crafted = crafted + 1
+        else
+            local restock = step.restock
+            slots[restock.index] = { itemId = restock.itemId, count = restock.count }
+            inventory.markSlotDirty(restock.index)
+        end
+    end
+
+    local checksum = 0
+    for index = 1, maxSlots do
+        local slot = slots[index]
+        checksum = (checksum * 31 + (slot and slot.count * index or 0)) % 1000000007
+    end
+    return crafted, checksum, slots, inventory.itemIndex
+end
+
+return {
+    prepare = prepare,
+    scenario = scenario,
+}
@@ -0,0 +1,65 @@
+-- Stand-ins for the Roblox globals ItemDataFetcher needs at require time, so
+-- the module can be loaded with synthetic ItemsData and ItemSearchIndex
+-- modules and its search driven keystroke by keystroke.
+-- Loaded by run_benchmarks.py through lupa; plain Lua, no Roblox globals.
+
+typeof = type
+
+local frozen = setmetatable({}, { __mode = "k" })
+table.freeze = function(value)
+    frozen[value] = true
+    return value
+end
+table.isfrozen = function(value)
+    return frozen[value] == true
+end
+table.clone = function(value)
+    local copy = {}
+    for key, val in pairs(value) do
+        copy[key] = val
+    end
+    return copy
+end
+
+-- `fetcherSource` is ItemDataFetcher.luau; `modules` maps the data module
+-- names to their already-evaluated tables.
+local function loadFetcher(fetcherSource, modules)
+    local function folder()
+        return {
+            WaitForChild = function(_, name)
+                if name == "data" then
+                    return folder()
+                end
+                return name
+            end,
+        }
+    end
+    local env = setmetatable({
+        require = function(name)
+            return modules[name]
+        end,
+        game = {
+            GetService = function()
+                return { WaitForChild = function() return folder() end }
+            end,
+        },
+    }, { __index = _G })
+    return assert(load(fetcherSource, "ItemDataFetcher", "t", env))()
+end
+
+-- Types every query one character at a time, as a search box would, and
+-- returns the total number of ids returned.
+local function typeQueries(fetcher, queries, limit)
+    local total = 0
+    for _, query in ipairs(queries) do
+        for length = 1, #query do
+            total = total + #fetcher.searchItemIds(string.sub(query, 1, length), limit)
+        end
+    end
+    return total
+end
+
+return {
+    loadFetcher = loadFetcher,
+    typeQueries = typeQueries,
+}
@@ -0,0 +1,163 @@
+-- Stand-ins for Players, RunService.Heartbeat and Vector3, plus the
+-- per-item Heartbeat loop that createDroppedItem used before
+-- WorldItemProximity, so both can be driven with the same players and items.
+-- Loaded by run_benchmarks.py through lupa; plain Lua, no Roblox globals.
+
+local Vector3 = {}
+Vector3.__index = function(self, key)
+    if key == "Magnitude" then
+        return math.sqrt(self.X * self.X + self.Y * self.Y + self.Z * self.Z)
+    end
+    return Vector3[key]
+end
+Vector3.__sub = function(a, b)
+    return Vector3.new(a.X - b.X, a.Y - b.Y, a.Z - b.Z)
+end
+
+function Vector3.new(x, y, z)
+    return setmetatable({ X = x, Y = y, Z = z }, Vector3)
+end
+
+local function newSignal()
+    local signal = { handlers = {} }
+
+    function signal:Connect(handler)
+        local connection = { connected = true }
+        function connection.Disconnect()
+            connection.connected = false
+            signal.handlers[connection] = nil
+        end
+        self.handlers[connection] = handler
+        return connection
+    end
+
+    function signal:Fire(...)
+        local snapshot = {}
+        for connection, handler in pairs(self.handlers) do
+            snapshot[#snapshot + 1] = { connection, handler }
+        end
+        for _, pair in ipairs(snapshot) do
+            if pair[1].connected then
+                pair[2](...)
+            end
+        end
+    end
+
+    return signal
+end
+
+-- Deterministic LCG so both implementations see identical worlds.
+local function newRandom(seed)
+    local state = seed
+    return function()
+        state = (state * 1103515245 + 12345) % 2147483648
+        return state / 2147483648
+    end
+end
+
+local function newPlayers(count, size, random)
+    local list = {}
+    for index = 1, count do
+        local rootPart = { Position = Vector3.new(random() * size, 2, random() * size) }
+        local character = {}
+        function character:FindFirstChild(name)
+            if name == "HumanoidRootPart" then
+                return rootPart
+            end
+            return nil
+        end
+        list[index] = {
+            Name = "Player" .. index,
+            UserId = index,
+            Character = character,
+            rootPart = rootPart,
+            heading = random() * 2 * math.pi,
+        }
+    end
+
+    local players = { list = list }
+    function players:GetPlayers()
+        return self.list
+    end
+    return players
+end
+
+local function walk(players, size, speed)
+    for _, player in ipairs(players.list) do
+        local position = player.rootPart.Position
+        local x = position.X + math.cos(player.heading) * speed
+        local z = position.Z + math.sin(player.heading) * speed
+        if x < 0 or x > size or z < 0 or z > size then
+            player.heading = player.heading + math.pi / 2
+            x = math.min(math.max(x, 0), size)
+            z = math.min(math.max(z, 0), size)
+        end
+        player.rootPart.Position = Vector3.new(x, position.Y, z)
+    end
+end
+
+-- The original createDroppedItem proximity check: one Heartbeat handler per item.
+local function legacyTracker(players, heartbeat, radius)
+    local tracker = {}
+    function tracker:track(id, worldPosition, onPlayerNear)
+        local proximityConnection
+        proximityConnection = heartbeat:Connect(function()
+            for _, otherPlayer in ipairs(players:GetPlayers()) do
+                local character = otherPlayer.Character
+                local rootPart = character and character:FindFirstChild("HumanoidRootPart")
+                if rootPart then
+                    local distance = (rootPart.Position - worldPosition).Magnitude
+                    if distance <= radius then
+                        onPlayerNear(otherPlayer, id)
+                        if proximityConnection then
+                            proximityConnection:Disconnect()
+                            proximityConnection = nil
+                        end
+                        return
+                    end
+                end
+            end
+        end)
+    end
+    return tracker
+end
+
+-- Builds a world and returns a function that simulates `frames` Heartbeats and
+-- returns the number of pickups and a checksum of who picked up what.
+-- `WorldItemProximity` is the module table, or nil for the legacy loop.
+local function scenario(WorldItemProximity, itemCount, playerCount, frames, seed)
+    local SIZE = 512
+    local RADIUS = 8
+    local random = newRandom(seed)
+    local heartbeat = newSignal()
+    local players = newPlayers(playerCount, SIZE, random)
+    local pickups, checksum = 0, 0
+
+    local tracker
+    if WorldItemProximity then
+        tracker = WorldItemProximity.new({ radius = RADIUS, players = players, heartbeat = heartbeat })
+    else
+        tracker = legacyTracker(players, heartbeat, RADIUS)
+    end
+
+    local function onPlayerNear(player, id)
+        pickups = pickups + 1
+        checksum = (checksum + id * 7919 + player.UserId) % 1000000007
+    end
+    for id = 1, itemCount do
+        tracker:track(id, Vector3.new(random() * SIZE, 0.5, random() * SIZE), onPlayerNear)
+    end
+
+    return function()
+        for _ = 1, frames do
+            walk(players, SIZE, 0.5)
+            heartbeat:Fire(1 / 60)
+        end
+        return pickups, checksum
+    end
+end
+
+return {
+    Vector3 = Vector3,
+    scenario = scenario,
+}
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Tools Pipeline Benchmarks
+Times and memory-profiles the hot functions of the data/sprite tools on
+synthetic inputs (see fixtures.py) at several scales, so slow rebuilds show
+up as a failing comparison instead of someone noticing later.
+
+Each case is timed with time.perf_counter over several runs (min and median
+are recorded) and then run once more under tracemalloc for its peak
+allocation. Cases whose timed work runs inside lupa record no peak, since
+tracemalloc only sees Python allocations. Results are keyed "<case>@<scale>x".
+
+Correctness of the code being timed is covered by tests/, not by the cases.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 1,10,100] [--case NAME ...]
+        [--save [PATH]] [--compare [PATH]] [--threshold 0.25]
+
+--save writes the results into the baseline (default
+benchmarks/baseline.json), replacing only the entries that were run, so
+`--case NAME --save` records a new case without touching the others.
+--compare exits non-zero when any case is slower or allocates more than the
+baseline by more than --threshold (a fraction).
+Baselines are only comparable on the same machine and Python version; the
+runner warns when they differ. Every timed run is paired with a fixed
+pure-Python reference workload run just before it, and comparisons use the
+median case/reference ratio, so a machine that is slower today (CPU
+scaling, a busy host) does not read as a regression.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE = Path(__file__).parent / "baseline.json"
+sys.path.insert(0, str(ROOT / "tools"))
+sys.path.insert(0, str(ROOT / "gold mine of info" / "scripts"))
+
+import fixtures  # noqa: E402
+
+# Stop repeating a case once it has used this much wall time (it always runs at least once).
+TIME_BUDGET = 2.0
+DEFAULT_REPEAT = 7
+
+# Differences below these floors are noise, whatever the ratio.
+MIN_TIME_DELTA = 0.002
+MIN_MEMORY_DELTA_KIB = 64.0
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[int, Path], Callable[[], object]]
+    max_scale: int
+    description: str
+    memory: bool
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, max_scale: int = 100, memory: bool = True):
+    """Register a benchmark. `setup(scale, workdir)` builds inputs and returns the callable to time.
+
+    Pass memory=False when the timed work allocates outside Python (lupa), so
+    no tracemalloc peak is recorded for it.
+    """
+    def decorator(setup):
+        CASES[name] = Case(name, setup, max_scale, (setup.__doc__ or "").strip(), memory)
+        return setup
+    return decorator
+
+
+@case("parse_manifest")
+def bench_parse_manifest(scale: int, workdir: Path):
+    """reorganize_sprite_manifest.parse_manifest on SpriteManifest.luau text."""
+    from reorganize_sprite_manifest import parse_manifest
+
+    content = fixtures.sprite_manifest(scale)
+    return lambda: parse_manifest(content)
+
+
+# Unplaced "other" entries each probe upward from index 300, so this is
+# quadratic in the manifest size; 100x takes minutes.
+@case("reorganize_manifest", max_scale=10)
+def bench_reorganize_manifest(scale: int, workdir: Path):
+    """reorganize_sprite_manifest.reorganize_manifest (includes copying its input, which it mutates)."""
+    from reorganize_sprite_manifest import parse_manifest, reorganize_manifest
+
+    entries = parse_manifest(fixtures.sprite_manifest(scale))
+    return lambda: reorganize_manifest([dict(entry) for entry in entries])
+
+
+@case("to_lua")
+def bench_to_lua(scale: int, workdir: Path):
+    """build_items_dataset.to_lua on an items.json payload."""
+    from build_items_dataset import to_lua
+
+    payload = fixtures.items_payload(scale)
+    return lambda: to_lua(payload)
+
+
+@case("pack_value")
+def bench_pack_value(scale: int, workdir: Path):
+    """pack_luau_data.pack_value on an items.json payload."""
+    from pack_luau_data import pack_value
+
+    payload = fixtures.items_payload(scale)
+    return lambda: pack_value(payload)
+
+
+@case("collect_items")
+def bench_collect_items(scale: int, workdir: Path):
+    """import_acnh.collect_items on a Fish/Insects workbook."""
+    import import_acnh
+
+    workbook = fixtures.acnh_workbook(workdir / f"acnh_{scale}x.xlsx", scale)
+
+    def run():
+        import_acnh.WORKBOOK_PATH = workbook
+        return import_acnh.collect_items()
+    return run
+
+
+@case("analyze_spritesheet")
+def bench_analyze_spritesheet(scale: int, workdir: Path):
+    """SpriteSheetAnalyzer.analyze_spritesheet matching a manifest against Nookipedia and items.json."""
+    import analyze_spritesheet
+    from reorganize_sprite_manifest import parse_manifest
+
+    # Only the sheet's header is read, so one small sheet serves every scale.
+    sheet = fixtures.sprite_sheet(workdir / "sheet_1x.png", 1)
+    analyzer = analyze_spritesheet.SpriteSheetAnalyzer()
+    for entry in parse_manifest(fixtures.sprite_manifest(scale)):
+        analyzer.sprite_manifest[entry["key"]] = {"name": entry["name"], "spriteIndex": entry["spriteIndex"]}
+    for item in fixtures.nookipedia_payload(scale)["furniture"]:
+        analyzer.nookipedia_data[analyzer.slugify(item["name"])] = item
+    for item in fixtures.items_payload(scale)["items"]:
+        analyzer.items_data[item["id"]] = item
+
+    def run():
+        analyze_spritesheet.SPRITESHEET = sheet
+        analyzer.output = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyzer.analyze_spritesheet()
+        return analyzer.output
+    return run
+
+
+# Sheets grow with the row count; 100x would be a ~100k px tall image.
+@case("calibrate", max_scale=10)
+def bench_calibrate(scale: int, workdir: Path):
+    """calibrate_sprites.calibrate fitting the grid of a sprite sheet."""
+    from PIL import Image
+    from calibrate_sprites import calibrate
+
+    sheet = fixtures.sprite_sheet(workdir / f"sheet_{scale}x.png", scale)
+
+    def run():
+        with Image.open(sheet) as image:
+            return calibrate(image, 21, 24 * scale)
+    return run
+
+
+PROXIMITY_PLAYERS = 12
+PROXIMITY_FRAMES = 30
+
+
+def proximity_scenario(use_grid: bool, scale: int):
+    """Fresh WorldItemProximity (or legacy per-item loop) world run under lupa."""
+    import lupa
+
+    lua = lupa.LuaRuntime()
+    lua.execute("warn = function(...) print(...) end")
+    harness = lua.execute((Path(__file__).parent / "proximity.lua").read_text(encoding="utf-8"))
+    module = lua.execute((ROOT / "src" / "server" / "WorldItemProximity.luau").read_text(encoding="utf-8")) if use_grid else None
+    items = 500 * scale
+
+    def run():
+        pickups, checksum = harness.scenario(module, items, PROXIMITY_PLAYERS, PROXIMITY_FRAMES, 1234)()
+        return pickups, checksum
+    return run
+
+
+# The per-item loop is O(items x players) per frame; 100x is 50k Heartbeat handlers.
+@case("proximity_legacy", max_scale=10, memory=False)
+def bench_proximity_legacy(scale: int, workdir: Path):
+    """Dropped-item pickup with one Heartbeat handler per item (the pre-grid createDroppedItem)."""
+    return proximity_scenario(False, scale)
+
+
+@case("proximity_grid", memory=False)
+def bench_proximity_grid(scale: int, workdir: Path):
+    """WorldItemProximity spatial hash pickup."""
+    return proximity_scenario(True, scale)
+
+
+@case("search_index")
+def bench_search_index(scale: int, workdir: Path):
+    """item_search_index.build_search_index on an items.json payload."""
+    from item_search_index import build_search_index
+
+    items = fixtures.items_payload(scale)["items"]
+    return lambda: build_search_index(items)
+
+
+SEARCH_QUERIES = 20
+
+
+@case("item_search", memory=False)
+def bench_item_search(scale: int, workdir: Path):
+    """ItemDataFetcher.searchItemIds typed one keystroke at a time."""
+    import random
+
+    import lupa
+    from item_search_index import build_search_index
+    from pack_luau_data import pack_value
+
+    payload = fixtures.items_payload(scale)
+    index = build_search_index(payload["items"])
+    rng = random.Random(scale)
+    queries = [rng.choice(index["names"])[:rng.randint(3, 10)] for _ in range(SEARCH_QUERIES)]
+
+    lua = lupa.LuaRuntime()
+    harness = lua.execute((Path(__file__).parent / "item_search.lua").read_text(encoding="utf-8"))
+    modules = lua.table_from({
+        "ItemsData": lua.execute(pack_value(payload)),
+        "ItemSearchIndex": lua.execute(pack_value(index)),
+        "SpriteManifest": lua.table(),
+        "DIYIconIndex": lua.table(),
+        "SpriteUVs": lua.table_from({"aliases": lua.table()}),
+    })
+    fetcher = harness.loadFetcher((ROOT / "src" / "shared" / "ItemDataFetcher.luau").read_text(encoding="utf-8"), modules)
+    lua_queries = lua.table_from(queries)
+    return lambda: harness.typeQueries(fetcher, lua_queries, 50)
+
+
+AUTOSAVE_PLAYERS = 50
+AUTOSAVE_ACTIVITY = 0.2
+
+
+def autosave_scenario(use_scheduler: bool, scale: int):
+    """Fresh InventorySaveScheduler (or legacy 30 s loop) session run under lupa."""
+    import lupa
+
+    lua = lupa.LuaRuntime()
+    harness = lua.execute((Path(__file__).parent / "autosave.lua").read_text(encoding="utf-8"))
+    module = lua.execute((ROOT / "src" / "server" / "InventorySaveScheduler.luau").read_text(encoding="utf-8")) if use_scheduler else None
+
+    def run():
+        return tuple(harness.scenario(module, AUTOSAVE_PLAYERS, 2 * scale, AUTOSAVE_ACTIVITY, 99)())
+    return run
+
+
+@case("autosave_legacy", max_scale=10, memory=False)
+def bench_autosave_legacy(scale: int, workdir: Path):
+    """Saving after every action and every player every 30 s in one frame (the pre-scheduler autosave)."""
+    return autosave_scenario(False, scale)
+
+
+@case("autosave_scheduler", max_scale=10, memory=False)
+def bench_autosave_scheduler(scale: int, workdir: Path):
+    """InventorySaveScheduler over a simulated session."""
+    return autosave_scenario(True, scale)
+
+
+INVENTORY_MODULES = ("InventoryConstants", "InventorySchemas", "InventoryAdapters", "InventoryCodec")
+
+
+def inventory_load_scenario(packed: bool, scale: int):
+    """GetAsync's JSON decode plus InventoryCodec.migrate over stored inventories (old tables, or blobs) under lupa."""
+    import lupa
+    from inventory_codec import encode_inventory, migrate
+
+    records = fixtures.stored_inventories(scale)
+    stored = [encode_inventory(migrate(record)[0]) for record in records] if packed else records
+
+    lua = lupa.LuaRuntime()
+    harness = lua.execute((Path(__file__).parent / "inventory_codec.lua").read_text(encoding="utf-8"))
+    folder = ROOT / "src" / "shared" / "inventory"
+    codec = harness.loadCodec(lua.table_from({name: (folder / f"{name}.luau").read_text(encoding="utf-8") for name in INVENTORY_MODULES}))
+    lua_stored = lua.table_from([json.dumps(value, separators=(",", ":")) for value in stored])
+    return lambda: harness.loadAll(codec, lua_stored)
+
+
+@case("inventory_load_tables", memory=False)
+def bench_inventory_load_tables(scale: int, workdir: Path):
+    """Reading the pre-blob { slots, maxSlots, inventoryLevel, legacyPayload } DataStore tables on join."""
+    return inventory_load_scenario(False, scale)
+
+
+@case("inventory_load_packed", memory=False)
+def bench_inventory_load_packed(scale: int, workdir: Path):
+    """Reading InventoryCodec blobs on join."""
+    return inventory_load_scenario(True, scale)
+
+
+STORE_SLOTS = 40
+STORE_MOVES = 100
+
+
+def state_store_scenario(legacy: bool, scale: int):
+    """Fresh InventoryStateStore driven by slot swaps under lupa (legacy: the full-copy updateSlot)."""
+    import lupa
+
+    lua = lupa.LuaRuntime()
+    harness = lua.execute((Path(__file__).parent / "state_store.lua").read_text(encoding="utf-8"))
+    folder = ROOT / "src" / "shared" / "inventory"
+    sources = {name: (folder / f"{name}.luau").read_text(encoding="utf-8") for name in INVENTORY_MODULES + ("InventoryValidation", "init")}
+    # InventoryTypes only declares Luau types, which plain Lua cannot parse.
+    sources["InventoryTypes"] = "return {}"
+    sources["InventoryStateStore"] = (ROOT / "src" / "client" / "inventory" / "InventoryStateStore.luau").read_text(encoding="utf-8")
+    store, domain = harness.loadStore(lua.table_from(sources))
+
+    def run():
+        return tuple(harness.scenario(store, domain, legacy, STORE_SLOTS, STORE_MOVES * scale, 7))
+    return run
+
+
+@case("state_store_legacy", max_scale=10, memory=False)
+def bench_state_store_legacy(scale: int, workdir: Path):
+    """Slot swaps through the pre-copy-on-write updateSlot (two full snapshot copies and a full validation per slot)."""
+    return state_store_scenario(True, scale)
+
+
+@case("state_store_cow", memory=False)
+def bench_state_store_cow(scale: int, workdir: Path):
+    """Slot swaps through batched copy-on-write updateSlot."""
+    return state_store_scenario(False, scale)
+
+
+INDEX_SLOTS = 40
+INDEX_ITEM_KINDS = 12
+INDEX_MATERIALS = 5
+INDEX_REQUESTS = 2000
+
+
+def item_index_scenario(indexed: bool, scale: int):
+    """Craft requests, generated before timing, replayed against one inventory under lupa through InventoryItemIndex or the legacy slot scans."""
+    import lupa
+
+    lua = lupa.LuaRuntime()
+    harness = lua.execute((Path(__file__).parent / "item_index.lua").read_text(encoding="utf-8"))
+    module = lua.execute((ROOT / "src" / "server" / "InventoryItemIndex.luau").read_text(encoding="utf-8")) if indexed else None
+    workload = harness.prepare(INDEX_SLOTS, INDEX_ITEM_KINDS, INDEX_MATERIALS, INDEX_REQUESTS * scale, 5)
+
+    def run():
+        crafted, checksum, _, _ = harness.scenario(module, workload)
+        return crafted, checksum
+    return run
+
+
+@case("item_index_legacy", memory=False)
+def bench_item_index_legacy(scale: int, workdir: Path):
+    """Material checks and consumption by scanning every slot per material (the pre-index server)."""
+    return item_index_scenario(False, scale)
+
+
+@case("item_index", memory=False)
+def bench_item_index(scale: int, workdir: Path):
+    """Material checks and consumption through InventoryItemIndex."""
+    return item_index_scenario(True, scale)
+
+
+def reference_workload() -> int:
+    """Fixed mix of dict, string and sort work that the tools spend their time on."""
+    table = {}
+    for i in range(20000):
+        key = f"item_{i % 997}_{i}"
+        table[key] = key.replace("_", "-").upper()
+    return len(sorted(table.values()))
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure(func: Callable[[], object], repeat: int, memory: bool = True) -> Dict[str, float]:
+    times: List[float] = []
+    references: List[float] = []
+    spent = 0.0
+    while len(times) < repeat and (not times or spent < TIME_BUDGET):
+        references.append(timed(reference_workload))
+        times.append(timed(func))
+        spent += times[-1]
+
+    result = {
+        "min_s": round(min(times), 6),
+        "median_s": round(statistics.median(times), 6),
+        "relative": round(statistics.median(t / r for t, r in zip(times, references)), 4),
+        "runs": len(times),
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_kib"] = round(peak / 1024, 1)
+    return result
+
+
+def format_peak(result: Dict[str, float], width: int) -> str:
+    return f"{result['peak_kib']:>{width}.1f} KiB" if "peak_kib" in result else f"{'-':>{width}}    "
+
+
+def run_cases(names: Sequence[str], scales: Sequence[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="tools-bench-") as tmp:
+        workdir = Path(tmp)
+        for name in names:
+            bench = CASES[name]
+            for scale in scales:
+                key = f"{name}@{scale}x"
+                if scale > bench.max_scale:
+                    print(f"   {key:<28} skipped (max scale {bench.max_scale}x)")
+                    continue
+                try:
+                    func = bench.setup(scale, workdir)
+                except ImportError as exc:
+                    print(f"⚠️  {key:<28} skipped ({exc})")
+                    break
+                result = measure(func, repeat, bench.memory)
+                results[key] = result
+                print(f"   {key:<28} {result['min_s'] * 1000:>10.2f} ms  {result['median_s'] * 1000:>10.2f} ms  {format_peak(result, 10)}")
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict, threshold: float) -> List[str]:
+    """Return a line per regression beyond `threshold` (and the noise floors)."""
+    regressions = []
+    previous = baseline.get("results", {})
+    print(f"\n{'Case':<28} {'Time':>10} {'vs base':>9} {'Peak':>10} {'vs base':>9}")
+    for key, result in results.items():
+        base = previous.get(key)
+        if base is None:
+            print(f"{key:<28} {'(new)':>10}")
+            continue
+
+        time_ratio = result["relative"] / base["relative"] if base["relative"] else 1.0
+        expected = result["min_s"] / time_ratio
+        if time_ratio > 1 + threshold and result["min_s"] - expected > MIN_TIME_DELTA:
+            regressions.append(f"{key}: {expected * 1000:.2f} ms expected -> {result['min_s'] * 1000:.2f} ms ({time_ratio:.2f}x)")
+
+        if "peak_kib" not in result or "peak_kib" not in base:
+            print(f"{key:<28} {result['min_s'] * 1000:>8.2f}ms {time_ratio:>8.2f}x {'-':>10} {'-':>9}")
+            continue
+        memory_ratio = result["peak_kib"] / base["peak_kib"] if base["peak_kib"] else 1.0
+        print(f"{key:<28} {result['min_s'] * 1000:>8.2f}ms {time_ratio:>8.2f}x {result['peak_kib']:>8.0f}Ki {memory_ratio:>8.2f}x")
+        if memory_ratio > 1 + threshold and result["peak_kib"] - base["peak_kib"] > MIN_MEMORY_DELTA_KIB:
+            regressions.append(f"{key}: peak {base['peak_kib']:.0f} KiB -> {result['peak_kib']:.0f} KiB ({memory_ratio:.2f}x)")
+
+    cases = {key.split("@")[0] for key in results}
+    missing = sorted(key for key in set(previous) - set(results) if key.split("@")[0] in cases)
+    if missing:
+        print(f"\n⚠️  Not run this time: {', '.join(missing)}")
+    return regressions
+
+
+def parse_scales(text: str) -> Tuple[int, ...]:
+    try:
+        scales = tuple(int(part) for part in text.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid scale list: {text!r}")
+    if not scales or min(scales) < 1:
+        raise argparse.ArgumentTypeError("scales must be positive integers")
+    return scales
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the tools pipeline on synthetic inputs.")
+    parser.add_argument("--scales", type=parse_scales, default=(1, 10, 100), help="Comma-separated input scales (default: 1,10,100).")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="Only run this case (repeatable).")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Timed runs per case, within a {TIME_BUDGET:.0f}s budget.")
+    parser.add_argument("--save", nargs="?", type=Path, const=BASELINE, help="Write results as the baseline (default: benchmarks/baseline.json).")
+    parser.add_argument("--compare", nargs="?", type=Path, const=BASELINE, help="Compare against a baseline and fail on regressions.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown/growth as a fraction (default: 0.25).")
+    parser.add_argument("--list", action="store_true", help="List the benchmark cases and exit.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, bench in CASES.items():
+            print(f"{name:<22} {bench.description}")
+        return 0
+
+    baseline = None
+    if args.compare:
+        if not args.compare.exists():
+            print(f"❌ Error: {args.compare} not found; create it with --save")
+            return 1
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+
+    names = args.case or list(CASES)
+    print(f"📋 {len(names)} cases at {', '.join(f'{scale}x' for scale in args.scales)}")
+    print(f"   {'Case':<28} {'Min':>13} {'Median':>13} {'Peak':>14}")
+    results = run_cases(names, args.scales, max(1, args.repeat))
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        saved = json.loads(args.save.read_text(encoding="utf-8")).get("results", {}) if args.save.exists() else {}
+        saved.update(results)
+        payload = {"environment": environment(), "results": saved}
+        args.save.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"\n💾 {len(results)} result(s) saved to: {args.save}")
+
+    if baseline is None:
+        return 0
+
+    if baseline.get("environment") != environment():
+        print(f"\n⚠️  Baseline was recorded on {baseline.get('environment')}; timings may not be comparable.")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+-- Loads the shared inventory package and the client InventoryStateStore with
+-- stand-ins for game, Instance and the require(script.X) calls, then drives
+-- drag-and-drop style slot moves through the store. The pre-copy-on-write
+-- updateSlot is reproduced below so both can run on the same moves.
+-- Loaded by run_benchmarks.py through lupa; plain Lua, no Roblox globals.
+
+typeof = typeof or type
+warn = warn or function() end
+table.clone = table.clone or function(value)
+    local copy = {}
+    for key, val in pairs(value) do
+        copy[key] = val
+    end
+    return copy
+end
+
+local function newBindableEvent()
+    local handlers = {}
+    local event = { Event = {} }
+    function event.Event:Connect(handler)
+        table.insert(handlers, handler)
+        return { Disconnect = function() end }
+    end
+    function event:Fire(...)
+        for _, handler in ipairs(handlers) do
+            handler(...)
+        end
+    end
+    function event:Destroy()
+        handlers = {}
+    end
+    return event
+end
+
+-- `sources` maps the inventory package's module names (and "init") plus
+-- "InventoryStateStore" to their source text; returns the store class.
+local function loadStore(sources)
+    local loaded = {}
+    local package = {}
+    local function requireModule(name)
+        if loaded[name] == nil then
+            local env = setmetatable({
+                script = setmetatable({ Parent = package }, { __index = package }),
+                require = requireModule,
+            }, { __index = _G })
+            loaded[name] = assert(load(sources[name], name, "t", env))()
+        end
+        return loaded[name]
+    end
+    for name in pairs(sources) do
+        package[name] = name
+    end
+
+    local shared = {
+        WaitForChild = function(_, name)
+            assert(name == "inventory")
+            return "init"
+        end,
+    }
+    local env = setmetatable({
+        game = {
+            GetService = function()
+                return { WaitForChild = function() return shared end }
+            end,
+        },
+        Instance = { new = newBindableEvent },
+        require = requireModule,
+    }, { __index = _G })
+    local store = assert(load(sources.InventoryStateStore, "InventoryStateStore", "t", env))()
+    return store, requireModule("init")
+end
+
+-- updateSlot as it was: copy the snapshot, replace the slot, validate and copy
+-- it again in setSnapshot, then fire.
+local function legacyUpdateSlot(store, domain, index, stack)
+    local snapshot = domain.Schemas.cloneSnapshot(store.snapshot)
+    if stack then
+        snapshot.slots[index] = domain.Schemas.createSlotFromStack(index, stack)
+    else
+        snapshot.slots[index] = domain.Schemas.createEmptySlot(index)
+    end
+    assert(domain.Validation.validateSnapshot(snapshot))
+    store.snapshot = domain.Schemas.cloneSnapshot(snapshot)
+    store._event:Fire(store.snapshot)
+end
+
+local function readStack(snapshot, index)
+    local stack = snapshot.slots[index].stack
+    return stack and { id = stack.id, count = stack.count } or nil
+end
+
+-- A full store of `maxSlots`, then `moves` swaps between pseudo-random slots
+-- (two slot updates each, batched unless `legacy`). Returns the number of
+-- change events and a checksum of the final slot contents.
+local function scenario(Store, domain, legacy, maxSlots, moves, seed)
+    local store = Store.new({ maxSlots = maxSlots })
+    for index = 1, maxSlots do
+        store:updateSlot(index, { id = "item_" .. index, count = index })
+    end
+    local events = 0
+    store:onChanged(function()
+        events = events + 1
+    end)
+
+    local state = seed
+    local function pick()
+        state = (state * 1103515245 + 12345) % 2147483648
+        return state % maxSlots + 1
+    end
+
+    for _ = 1, moves do
+        local from, to = pick(), pick()
+        local fromStack = readStack(store.snapshot, from)
+        local toStack = readStack(store.snapshot, to)
+        if legacy then
+            legacyUpdateSlot(store, domain, to, fromStack)
+            legacyUpdateSlot(store, domain, from, toStack)
+        else
+            store:batch(function()
+                store:updateSlot(to, fromStack)
+                store:updateSlot(from, toStack)
+            end)
+        end
+    end
+
+    local checksum = 0
+    for index, slot in ipairs(store.snapshot.slots) do
+        checksum = (checksum * 31 + index * (slot.stack and slot.stack.count or 0)) % 1000000007
+    end
+    return events, checksum
+end
+
+return {
+    loadStore = loadStore,
+    scenario = scenario,
+}
@@ -1,45 +1,486 @@
+#!/usr/bin/env python3
+"""
+Strip Luau type annotations from sources.
+
+Files are tokenized once with luau_lexer, so strings, long brackets, comments
+and interpolated strings are never touched. Annotations are then removed in
+a single forward pass over the significant tokens:
+
+    local x: T = ...          ->  local x = ...
+    function f<T>(a: T): R    ->  function f(a)
+    for i: number = 1, n      ->  for i = 1, n
+    value :: T                ->  value
+    `{value :: T}`            ->  `{value}`
+    [export] type X<T> = ...  ->  (removed)
+
+The expressions of interpolated strings are lexed and stripped on their own,
+so casts inside `{...}` are removed while the literal text is left alone.
+
+Newlines inside removed spans are kept, so line numbers do not move; a
+SourceMap maps output offsets back to the original file. Files known to be
+clean are skipped via a cache keyed on mtime/size/content hash, and the rest
+are processed in parallel.
+
+Usage:
+    python fix_annotations.py [src] [--check] [--maps DIR] [--no-cache] [--jobs N]
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
 import os
-import re
-
-def remove_type_annotations(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Remove type annotations in function definitions
-    # Example: function name(param: Type) -> function name(param)
-    content = re.sub(r'function ([^(]+)\(([^)]*?):\s*[^,)]+([,)])', r'function \1(\2\3', content)
-    content = re.sub(r'([,\(]\s*)([a-zA-Z0-9_]+)\s*:\s*[a-zA-Z0-9_.]+(\s*[,\)])', r'\1\2\3', content)
-    
-    # Remove type casting with ::
-    # Example: local x = y :: Type -> local x = y
-    content = re.sub(r'(=\s*[^:;]+)\s*::\s*[a-zA-Z0-9_\[\]{}?|.]+', r'\1', content)
-    
-    # Remove type annotations in variable declarations
-    # Example: local x: number = 5 -> local x = 5
-    content = re.sub(r'local\s+([a-zA-Z0-9_]+)\s*:\s*[a-zA-Z0-9_\[\]{}?|.]+(\s*=)', r'local \1\2', content)
-    
-    # Remove function return type annotations
-    # Example: function x(): number -> function x()
-    content = re.sub(r'function ([^(]+\([^)]*\)):\s*[a-zA-Z0-9_\[\]{}?|.]+', r'function \1', content)
-    
-    # Remove type and export type declarations
-    # Example: type X = ... or export type X = ...
-    content = re.sub(r'(local\s+)?type\s+[^=]+=\s*[^;]+;?', '', content)
-    content = re.sub(r'export\s+type\s+[^=]+=\s*[^;]+;?', '', content)
-    
-    # Write the fixed content back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Fixed type annotations in {file_path}")
-
-def process_directory(directory):
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.luau'):
-                fix_file = os.path.join(root, file)
-                remove_type_annotations(fix_file)
-
-# Process the source code directory
-process_directory('./src')
-print("Done fixing type annotations")
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# The Luau lexer is shared with tools/require_graph.py and tools/pack_luau_data.py.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools"))
+from luau_lexer import INTERP, KEYWORD, NAME, NUMBER, OP, STRING, TRIVIA, LexError, Token, interp_expressions, tokenize  # noqa: E402
+
+LUAU_EXTENSIONS = {".luau", ".lua"}
+
+CACHE_NAME = ".luau_annotation_cache.json"
+CACHE_VERSION = 1
+
+# Below this many files the process pool costs more than it saves.
+POOL_THRESHOLD = 32
+
+_OPENERS = {"(": ")", "{": "}", "[": "]", "<": ">"}
+_CLOSERS = {")", "}", "]", ">"}
+
+# Tokens after which a new statement may begin (used to recognise `type X = ...`).
+_STATEMENT_END_KEYWORDS = {"end", "do", "then", "else", "repeat", "break", "continue", "true", "false", "nil"}
+_STATEMENT_END_OPS = {")", "]", "}", ";"}
+
+
+class StripError(ValueError):
+    def __init__(self, message: str, line: int):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+class SourceMap:
+    """Maps offsets in stripped output back to offsets in the original source."""
+
+    def __init__(self, segments: Sequence[Tuple[int, int]]):
+        # (output_start, original_start) for each contiguous run.
+        self.segments = list(segments)
+        self._outputs = [out for out, _ in self.segments]
+
+    def original_offset(self, offset: int) -> int:
+        index = bisect.bisect_right(self._outputs, offset) - 1
+        if index < 0:
+            return offset
+        out, original = self.segments[index]
+        return original + (offset - out)
+
+    def to_json(self) -> Dict:
+        return {"version": 1, "segments": self.segments}
+
+
+class _Parser:
+    """Finds annotation spans over the significant tokens of one file."""
+
+    def __init__(self, tokens: Sequence[Token]):
+        self.toks = [token for token in tokens if token.kind not in TRIVIA]
+        self.spans: List[Tuple[int, int]] = []
+
+    # -- token helpers -------------------------------------------------------
+
+    def at(self, k: int) -> Optional[Token]:
+        return self.toks[k] if k < len(self.toks) else None
+
+    def is_op(self, k: int, *texts: str) -> bool:
+        token = self.at(k)
+        return token is not None and token.kind == OP and token.text in texts
+
+    def is_name(self, k: int) -> bool:
+        token = self.at(k)
+        return token is not None and token.kind == NAME
+
+    def fail(self, k: int, message: str) -> StripError:
+        token = self.at(k) or self.toks[-1]
+        return StripError(message, token.line)
+
+    def remove(self, first: int, after: int) -> None:
+        """Record removal of significant tokens [first, after)."""
+        self.spans.append((self.toks[first].start, self.toks[after - 1].end))
+
+    # -- type grammar ----------------------------------------------------------
+
+    def split_closer(self, k: int) -> None:
+        """Split `>=` at k into `>` and `=`; the lexer cannot tell a generic closer from a comparison."""
+        token = self.toks[k]
+        self.toks[k:k + 1] = [
+            token._replace(text=">"),
+            token._replace(text="=", start=token.start + 1),
+        ]
+
+    def skip_balanced(self, k: int) -> int:
+        stack = [_OPENERS[self.toks[k].text]]
+        k += 1
+        while stack:
+            token = self.at(k)
+            if token is None:
+                raise self.fail(k, "unbalanced brackets in type")
+            if token.kind == OP and token.text == ">=" and stack[-1] == ">":
+                # `Map<K, Array<V>>= {}`: the last `>` closes the generic list.
+                self.split_closer(k)
+                token = self.toks[k]
+            if token.kind == OP:
+                if token.text in _OPENERS:
+                    stack.append(_OPENERS[token.text])
+                elif token.text in _CLOSERS:
+                    if token.text != stack.pop():
+                        raise self.fail(k, f"mismatched {token.text!r} in type")
+            k += 1
+        return k
+
+    def skip_type(self, k: int) -> int:
+        if self.is_op(k, "|", "&"):
+            k += 1
+        k = self.skip_simple_type(k)
+        while self.is_op(k, "|", "&"):
+            k = self.skip_simple_type(k + 1)
+        return k
+
+    def skip_simple_type(self, k: int) -> int:
+        token = self.at(k)
+        if token is None:
+            raise self.fail(k, "expected type")
+
+        if token.kind == OP and token.text == "...":
+            # Variadic pack: `...T` or a bare `...` inside a pack.
+            k += 1
+            if self.starts_type(k):
+                k = self.skip_simple_type(k)
+            return k
+        if token.kind == OP and token.text == "(":
+            k = self.skip_balanced(k)
+            if self.is_op(k, "->"):
+                k = self.skip_type(k + 1)
+        elif token.kind == OP and token.text == "<":
+            # Generic function type: <T>(T) -> T
+            k = self.skip_balanced(k)
+            if not self.is_op(k, "("):
+                raise self.fail(k, "expected '(' after generic parameters")
+            k = self.skip_balanced(k)
+            if not self.is_op(k, "->"):
+                raise self.fail(k, "expected '->' in function type")
+            k = self.skip_type(k + 1)
+        elif token.kind == OP and token.text == "{":
+            k = self.skip_balanced(k)
+        elif token.kind == NAME and token.text == "typeof" and self.is_op(k + 1, "("):
+            k = self.skip_balanced(k + 1)
+        elif token.kind == NAME:
+            k += 1
+            while self.is_op(k, ".") and self.is_name(k + 1):
+                k += 2
+            if self.is_op(k, "<"):
+                k = self.skip_balanced(k)
+            if self.is_op(k, "..."):
+                k += 1
+        elif token.kind == STRING or (token.kind == KEYWORD and token.text in ("nil", "true", "false")):
+            k += 1
+        else:
+            raise self.fail(k, f"unexpected {token.text!r} in type")
+
+        while self.is_op(k, "?"):
+            k += 1
+        return k
+
+    def starts_type(self, k: int) -> bool:
+        token = self.at(k)
+        if token is None:
+            return False
+        if token.kind in (NAME, STRING):
+            return True
+        if token.kind == KEYWORD:
+            return token.text in ("nil", "true", "false")
+        return token.kind == OP and token.text in ("(", "{", "<")
+
+    def strip_annotation(self, k: int) -> int:
+        """Remove `: Type` starting at the ':' token at k."""
+        after = self.skip_type(k + 1)
+        self.remove(k, after)
+        return after
+
+    # -- statements ------------------------------------------------------------
+
+    def starts_statement(self, k: int) -> bool:
+        if k == 0:
+            return True
+        prev = self.toks[k - 1]
+        if prev.kind in (NAME, NUMBER, STRING, INTERP):
+            return True
+        if prev.kind == KEYWORD:
+            return prev.text in _STATEMENT_END_KEYWORDS
+        return prev.kind == OP and prev.text in _STATEMENT_END_OPS
+
+    def type_statement(self, k: int) -> Optional[int]:
+        """If a type alias starts at k (`type` or `export type`), remove it."""
+        first = k
+        if self.toks[k].text == "export":
+            k += 1
+        if not (self.is_name(k) and self.toks[k].text == "type" and self.is_name(k + 1)):
+            return None
+        if not self.is_op(k + 2, "=", "<") or not self.starts_statement(first):
+            return None
+
+        k += 2
+        if self.is_op(k, "<"):
+            k = self.skip_balanced(k)
+        if not self.is_op(k, "="):
+            raise self.fail(k, "expected '=' in type alias")
+        after = self.skip_type(k + 1)
+        self.remove(first, after)
+        return after
+
+    def binding_list(self, k: int) -> int:
+        """Strip annotations from `a: T, b: U` bindings (local and for)."""
+        while self.is_name(k):
+            k += 1
+            if self.is_op(k, ":"):
+                k = self.strip_annotation(k)
+            if not self.is_op(k, ","):
+                break
+            k += 1
+        return k
+
+    def function_header(self, k: int) -> int:
+        """Strip generics, parameter and return annotations after `function` at k."""
+        k += 1
+        if self.is_name(k):
+            k += 1
+            while self.is_op(k, ".", ":") and self.is_name(k + 1):
+                k += 2
+        if self.is_op(k, "<"):
+            after = self.skip_balanced(k)
+            self.remove(k, after)
+            k = after
+        if not self.is_op(k, "("):
+            raise self.fail(k, "expected '(' after function name")
+
+        k += 1
+        while not self.is_op(k, ")"):
+            if self.is_name(k) or self.is_op(k, "..."):
+                k += 1
+                if self.is_op(k, ":"):
+                    k = self.strip_annotation(k)
+            if self.is_op(k, ","):
+                k += 1
+            elif not self.is_op(k, ")"):
+                raise self.fail(k, "unexpected token in parameter list")
+        k += 1
+
+        if self.is_op(k, ":"):
+            k = self.strip_annotation(k)
+        return k
+
+    def interp(self, token: Token) -> None:
+        """Strip annotations inside the {expressions} of an interpolated string."""
+        for first, last in interp_expressions(token.text):
+            offset = token.start + first
+            try:
+                inner = tokenize(token.text[first:last])
+            except LexError as exc:
+                raise StripError(str(exc), token.line) from exc
+            inner = [t._replace(start=t.start + offset, line=t.line + token.line - 1) for t in inner]
+            self.spans.extend(_Parser(inner).run())
+
+    def run(self) -> List[Tuple[int, int]]:
+        k = 0
+        toks = self.toks
+        while k < len(toks):
+            token = toks[k]
+            if token.kind == INTERP:
+                self.interp(token)
+            elif token.kind == KEYWORD:
+                if token.text == "function":
+                    k = self.function_header(k)
+                    continue
+                if token.text in ("local", "for") and self.is_name(k + 1):
+                    k = self.binding_list(k + 1)
+                    continue
+            elif token.kind == NAME and token.text in ("type", "export"):
+                after = self.type_statement(k)
+                if after is not None:
+                    k = after
+                    continue
+            elif token.kind == OP and token.text == "::":
+                k = self.strip_annotation(k)
+                continue
+            k += 1
+        return self.spans
+
+
+def strip_annotations(source: str) -> Tuple[str, SourceMap]:
+    """Return the source without type annotations and a map back to the original."""
+    try:
+        tokens = tokenize(source)
+    except LexError as exc:
+        raise StripError(str(exc), exc.line) from exc
+    spans = _Parser(tokens).run()
+
+    out: List[str] = []
+    segments: List[Tuple[int, int]] = []
+    written = 0
+    cursor = 0
+    for start, end in spans:
+        if source.startswith("::", start):
+            # `value :: T` -> `value`, not `value `.
+            while start > cursor and source[start - 1] in " \t":
+                start -= 1
+        if start > cursor:
+            segments.append((written, cursor))
+            out.append(source[cursor:start])
+            written += start - cursor
+        # Keep line numbers stable across removed multi-line types.
+        newlines = source.count("\n", start, end)
+        if newlines:
+            segments.append((written, start))
+            out.append("\n" * newlines)
+            written += newlines
+        cursor = end
+    if cursor < len(source):
+        segments.append((written, cursor))
+        out.append(source[cursor:])
+
+    return "".join(out), SourceMap(segments)
+
+
+def remove_type_annotations(file_path, write=True, maps_dir=None, relative=None):
+    """Strip one file in place. Returns (changed, sha1 of the resulting content).
+
+    The source map goes to maps_dir/<relative>.map.json, mirroring the source
+    tree so files that share a name (every init.luau) keep separate maps;
+    `relative` defaults to the file name.
+    """
+    path = Path(file_path)
+    raw = path.read_bytes()
+    original = raw.decode("utf-8")
+    stripped, source_map = strip_annotations(original)
+
+    if stripped == original:
+        return False, hashlib.sha1(raw).hexdigest()
+
+    encoded = stripped.encode("utf-8")
+    if write:
+        path.write_bytes(encoded)
+    if maps_dir is not None:
+        map_path = Path(maps_dir) / ((relative or path.name) + ".map.json")
+        map_path.parent.mkdir(parents=True, exist_ok=True)
+        map_path.write_text(json.dumps({"file": str(path), **source_map.to_json()}), encoding="utf-8")
+    return True, hashlib.sha1(encoded).hexdigest()
+
+
+def _strip_job(job: Tuple[str, bool, Optional[str], str]) -> Tuple[str, Optional[bool], str]:
+    path, write, maps_dir, relative = job
+    try:
+        changed, digest = remove_type_annotations(path, write, maps_dir, relative)
+    except StripError as exc:
+        return path, None, str(exc)
+    return path, changed, digest
+
+
+def iter_source_files(root: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in LUAU_EXTENSIONS:
+                    yield Path(entry.path), entry.stat()
+
+
+def load_cache(path: Path) -> Dict[str, Dict]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != CACHE_VERSION:
+        return {}
+    return payload.get("files", {})
+
+
+def save_cache(path: Path, files: Dict[str, Dict]) -> None:
+    path.write_text(json.dumps({"version": CACHE_VERSION, "files": files}, separators=(",", ":")), encoding="utf-8")
+
+
+def process_directory(directory, check=False, maps_dir=None, use_cache=True, jobs=None):
+    """Strip every Luau file under `directory`. Returns (changed, failed) path lists."""
+    root = Path(directory).resolve()
+    cache_path = root.parent / CACHE_NAME
+    cache = load_cache(cache_path) if use_cache else {}
+    fresh: Dict[str, Dict] = {}
+
+    pending = []
+    cached = 0
+    for path, stat in iter_source_files(root):
+        key = str(path.relative_to(root))
+        entry = cache.get(key)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            fresh[key] = entry
+            cached += 1
+            continue
+        if entry and entry["size"] == stat.st_size and hashlib.sha1(path.read_bytes()).hexdigest() == entry["hash"]:
+            fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": entry["hash"]}
+            cached += 1
+            continue
+        pending.append(key)
+
+    if maps_dir is not None:
+        Path(maps_dir).mkdir(parents=True, exist_ok=True)
+    work = [(str(root / key), not check, None if maps_dir is None else str(maps_dir), key) for key in pending]
+    if len(work) < POOL_THRESHOLD or jobs == 1:
+        results = [_strip_job(job) for job in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_strip_job, work, chunksize=max(1, len(work) // (4 * (jobs or os.cpu_count() or 1)))))
+
+    changed_files = []
+    failed_files = []
+    for path, changed, detail in results:
+        key = str(Path(path).relative_to(root))
+        if changed is None:
+            failed_files.append((key, detail))
+            continue
+        if changed:
+            changed_files.append(key)
+        if not changed or not check:
+            stat = os.stat(path)
+            fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": detail}
+
+    if use_cache:
+        save_cache(cache_path, fresh)
+    print(f"{len(pending)} files checked, {cached} cached")
+    return changed_files, failed_files
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Strip Luau type annotations.")
+    parser.add_argument("directory", nargs="?", default="./src", help="Source tree to process (default: ./src).")
+    parser.add_argument("--check", action="store_true", help="Report files with annotations without writing.")
+    parser.add_argument("--maps", type=Path, default=None, help="Write <path>.map.json source maps into this directory, mirroring the source tree.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the cache.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count).")
+    args = parser.parse_args(argv)
+
+    changed, failed = process_directory(args.directory, args.check, args.maps, not args.no_cache, args.jobs)
+
+    for path in sorted(changed):
+        print(f"{'Has' if args.check else 'Fixed'} type annotations in {path}")
+    for path, message in sorted(failed):
+        print(f"⚠️  Skipped {path}: {message}")
+
+    print("Done fixing type annotations" if not args.check else "Done checking type annotations")
+    if failed:
+        return 1
+    return 1 if args.check and changed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,10 +11,13 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from luau_index import TokenIndex, run_rules
+
 class GameFinalizer:
     def __init__(self):
-        self.project_root = Path(__file__).parent
+        self.project_root = Path(__file__).resolve().parents[1]
         self.src_dir = self.project_root / "src"
+        self.indexed_files = None
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
     def print_header(self, text):
@@ -66,35 +69,32 @@ class GameFinalizer:
     def validate_lua_syntax(self):
         """Check for common Lua syntax issues"""
         print("🔍 Validating Lua syntax...")
-        
+
+        # One lexing pass over src/**/*.{lua,luau}, cached by content hash;
+        # every registered rule visits the same token stream.
+        index = TokenIndex(self.src_dir)
         issues = []
-        
-        # Check for Color3 arithmetic (common error)
-        lua_files = list(self.src_dir.rglob("*.luau"))
-        
-        for lua_file in lua_files:
-            try:
-                with open(lua_file, 'r') as f:
-                    content = f.read()
-                    # Check for Color3 arithmetic errors
-                    if "Color3.fromRGB" in content and " + Color3.new" in content:
-                        lines = content.split('\n')
-                        for i, line in enumerate(lines, 1):
-                            if " + Color3.new" in line and "Color3.fromRGB" in line:
-                                issues.append(f"  {lua_file.name}:{i} - Possible Color3 arithmetic")
-                                
-            except Exception as e:
-                pass
-                
+        warnings = []
+        for finding in run_rules(index):
+            (issues if finding.severity == "error" else warnings).append(finding)
+        self.indexed_files = index.lexed + index.cached
+
+        if warnings:
+            counts = {}
+            for finding in warnings:
+                counts[finding.rule] = counts.get(finding.rule, 0) + 1
+            summary = ", ".join(f"{rule}: {count}" for rule, count in sorted(counts.items()))
+            print(f"  ⚠️  {len(warnings)} warnings ({summary})")
+
         if issues:
             print(f"  ⚠️  Found {len(issues)} potential issues:")
             for issue in issues[:5]:
-                print(issue)
+                print(f"  {issue.format()}")
         else:
             print("  ✅ No obvious Lua syntax issues found")
-            
+
         return len(issues) == 0
-        
+
     def check_game_ready(self):
         """Run all checks"""
         self.print_header("🎮 GAME READINESS CHECK")
@@ -166,7 +166,7 @@ class GameFinalizer:
             "project": "ACNH Roblox",
             "status": "READY FOR FINAL TESTING",
             "checks": self.check_game_ready(),
-            "file_count": len(list(self.src_dir.rglob("*.luau"))),
+            "file_count": self.indexed_files,
         }
         
         print(json.dumps(report, indent=2))
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Shared token index and rule runner for Luau sources.
+
+Every .lua/.luau file under a source tree is lexed once with luau_lexer and
+its significant tokens are cached on disk, keyed by path and validated by
+mtime/size with a content-hash fallback, so repeat runs only lex files that
+actually changed. Checks are written as Rule visitors over those tokens and
+findings are yielded file by file as soon as each file is available.
+
+Usage:
+    python luau_index.py [src] [--rule NAME ...] [--no-cache]
+"""
+
+import abc
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# The Luau lexer is shared with tools/require_graph.py and tools/pack_luau_data.py.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools"))
+from luau_lexer import KEYWORD, NAME, OP, LexError, Token, significant, tokenize  # noqa: E402
+
+LUAU_EXTENSIONS = {".luau", ".lua"}
+
+CACHE_NAME = ".luau_token_index.pickle"
+CACHE_VERSION = 1
+
+# Below this many files the process pool costs more than it saves.
+POOL_THRESHOLD = 32
+
+
+class Finding(NamedTuple):
+    rule: str
+    severity: str  # "error" or "warning"
+    path: str
+    line: int
+    message: str
+
+    def format(self) -> str:
+        return f"{self.path}:{self.line} - {self.message}"
+
+
+class SourceFile(NamedTuple):
+    path: str  # relative to the indexed root
+    tokens: List[Token]  # significant tokens only
+    error: Optional[str]  # lex error, when the file could not be tokenized
+
+
+def _lex_job(path: str) -> Tuple[str, str, Optional[List[Token]], Optional[str]]:
+    raw = Path(path).read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    try:
+        return path, digest, significant(tokenize(raw.decode("utf-8"))), None
+    except (LexError, UnicodeDecodeError) as exc:
+        return path, digest, None, str(exc)
+
+
+class TokenIndex:
+    """Significant tokens for every Luau file under `root`, cached between runs."""
+
+    def __init__(self, root: Path, use_cache: bool = True, jobs: Optional[int] = None):
+        self.root = Path(root).resolve()
+        self.cache_path = self.root.parent / CACHE_NAME
+        self.use_cache = use_cache
+        self.jobs = jobs
+        self.lexed = 0
+        self.cached = 0
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.use_cache:
+            return {}
+        try:
+            with open(self.cache_path, "rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return {}
+        return payload.get("files", {})
+
+    def _save_cache(self, files: Dict[str, Dict]) -> None:
+        if not self.use_cache:
+            return
+        with open(self.cache_path, "wb") as handle:
+            pickle.dump({"version": CACHE_VERSION, "files": files}, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _iter_paths(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        stack = [self.root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in LUAU_EXTENSIONS:
+                        yield Path(entry.path), entry.stat()
+
+    def files(self) -> Iterator[SourceFile]:
+        """Yield every file, cached ones first, then freshly lexed ones as they finish."""
+        cache = self._load_cache()
+        fresh: Dict[str, Dict] = {}
+        pending: List[Tuple[str, os.stat_result]] = []
+        self.lexed = self.cached = 0
+
+        for path, stat in self._iter_paths():
+            key = str(path.relative_to(self.root))
+            entry = cache.get(key)
+            if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                hit = entry
+            elif entry and entry["size"] == stat.st_size and hashlib.sha1(path.read_bytes()).hexdigest() == entry["hash"]:
+                hit = dict(entry, mtime=stat.st_mtime_ns)
+            else:
+                pending.append((key, stat))
+                continue
+            fresh[key] = hit
+            self.cached += 1
+            yield SourceFile(key, hit["tokens"], hit["error"])
+
+        work = [str(self.root / key) for key, _ in pending]
+        stats = dict(pending)
+        if len(work) < POOL_THRESHOLD or self.jobs == 1:
+            results: Iterable = map(_lex_job, work)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=self.jobs)
+            results = pool.map(_lex_job, work, chunksize=max(1, len(work) // (4 * (self.jobs or os.cpu_count() or 1))))
+        try:
+            for path, digest, tokens, error in results:
+                key = str(Path(path).relative_to(self.root))
+                stat = stats[key]
+                fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": digest, "tokens": tokens or [], "error": error}
+                self.lexed += 1
+                yield SourceFile(key, tokens or [], error)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self._save_cache(fresh)
+
+
+class Rule(abc.ABC):
+    """Base class for token visitors. Subclasses set `name`/`severity` and implement visit()."""
+
+    name = ""
+    severity = "warning"
+    description = ""
+
+    @abc.abstractmethod
+    def visit(self, source: SourceFile) -> Iterator[Finding]:
+        """Yield the findings for one lexed file."""
+
+    def finding(self, source: SourceFile, token: Token, message: str) -> Finding:
+        return Finding(self.name, self.severity, source.path, token.line, message)
+
+
+RULES: Dict[str, Callable[[], Rule]] = {}
+
+
+def register_rule(cls):
+    """Class decorator that makes a Rule available by name."""
+    RULES[cls.name] = cls
+    return cls
+
+
+def _is(token: Optional[Token], kind: str, *texts: str) -> bool:
+    return token is not None and token.kind == kind and (not texts or token.text in texts)
+
+
+def _skip_call(tokens: Sequence[Token], k: int) -> int:
+    """Given '(' at k, return the index after its matching ')'."""
+    depth = 0
+    while k < len(tokens):
+        if tokens[k].kind == OP:
+            if tokens[k].text in ("(", "[", "{"):
+                depth += 1
+            elif tokens[k].text in (")", "]", "}"):
+                depth -= 1
+                if depth == 0:
+                    return k + 1
+        k += 1
+    return k
+
+
+def _local_names(tokens: Sequence[Token]) -> Set[str]:
+    """Names the file declares with `local` or `local function` (shadowing globals)."""
+    names = set()
+    for k, token in enumerate(tokens):
+        if _is(token, KEYWORD, "local"):
+            k += 1
+            if _is(tokens[k] if k < len(tokens) else None, KEYWORD, "function"):
+                k += 1
+            while k < len(tokens) and tokens[k].kind == NAME:
+                names.add(tokens[k].text)
+                k += 1
+                if not _is(tokens[k] if k < len(tokens) else None, OP, ","):
+                    break
+                k += 1
+    return names
+
+
+ARITHMETIC = ("+", "-", "*", "/", "//", "%", "^")
+COLOR3_CONSTRUCTORS = ("new", "fromRGB", "fromHSV", "fromHex")
+
+
+@register_rule
+class Color3ArithmeticRule(Rule):
+    name = "color3-arithmetic"
+    severity = "error"
+    description = "Arithmetic on Color3 values errors at runtime; use :Lerp or component math."
+
+    def visit(self, source: SourceFile) -> Iterator[Finding]:
+        tokens = source.tokens
+        for k, token in enumerate(tokens):
+            if not (_is(token, NAME, "Color3") and k + 3 < len(tokens)):
+                continue
+            if not (_is(tokens[k + 1], OP, ".") and _is(tokens[k + 2], NAME, *COLOR3_CONSTRUCTORS) and _is(tokens[k + 3], OP, "(")):
+                continue
+            after = _skip_call(tokens, k + 3)
+            before = tokens[k - 1] if k else None
+            following = tokens[after] if after < len(tokens) else None
+            if _is(before, OP, *ARITHMETIC) or _is(following, OP, *ARITHMETIC):
+                yield self.finding(source, token, f"Color3.{tokens[k + 2].text}(...) used in arithmetic")
+
+
+@register_rule
+class DeprecatedTimingRule(Rule):
+    name = "deprecated-timing"
+    description = "Global tick()/wait()/delay()/spawn() are deprecated; use os.clock() and the task library."
+
+    REPLACEMENTS = {"tick": "os.clock()", "wait": "task.wait()", "delay": "task.delay()", "spawn": "task.spawn()"}
+
+    def visit(self, source: SourceFile) -> Iterator[Finding]:
+        tokens = source.tokens
+        shadowed = _local_names(tokens)
+        for k, token in enumerate(tokens):
+            if token.kind != NAME or token.text not in self.REPLACEMENTS or token.text in shadowed:
+                continue
+            if k and _is(tokens[k - 1], OP, ".", ":"):
+                continue
+            if k + 1 < len(tokens) and _is(tokens[k + 1], OP, "("):
+                yield self.finding(source, token, f"{token.text}() is deprecated; use {self.REPLACEMENTS[token.text]}")
+
+
+@register_rule
+class GlobalTableRule(Rule):
+    name = "global-table"
+    description = "_G couples scripts through untyped global state; prefer ModuleScripts."
+
+    def visit(self, source: SourceFile) -> Iterator[Finding]:
+        for token in source.tokens:
+            if _is(token, NAME, "_G"):
+                yield self.finding(source, token, "_G global state access")
+
+
+def run_rules(index: TokenIndex, rules: Optional[Sequence[Rule]] = None) -> Iterator[Finding]:
+    """Yield findings file by file; lex errors are reported as `lex-error` findings."""
+    active = list(rules) if rules is not None else [factory() for factory in RULES.values()]
+    for source in index.files():
+        if source.error:
+            yield Finding("lex-error", "error", source.path, 0, source.error)
+            continue
+        for rule in active:
+            yield from rule.visit(source)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run token-level checks over Luau sources.")
+    parser.add_argument("directory", nargs="?", default="./src", help="Source tree to index (default: ./src).")
+    parser.add_argument("--rule", action="append", choices=sorted(RULES), help="Only run the named rule (repeatable).")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the token cache.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for lexing (default: CPU count).")
+    args = parser.parse_args(argv)
+
+    index = TokenIndex(Path(args.directory), use_cache=not args.no_cache, jobs=args.jobs)
+    rules = [RULES[name]() for name in args.rule] if args.rule else None
+
+    errors = 0
+    for finding in run_rules(index, rules):
+        marker = "❌" if finding.severity == "error" else "⚠️ "
+        print(f"{marker} [{finding.rule}] {finding.format()}")
+        errors += finding.severity == "error"
+
+    print(f"Indexed {index.lexed + index.cached} files ({index.lexed} lexed, {index.cached} cached)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
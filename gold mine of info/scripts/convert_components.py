@@ -1,122 +1,898 @@
 #!/usr/bin/env python3
 """
-Component Converter - Converts .rbxmx files to Luau code
+Component Converter - Compiles .rbxmx GUI templates into Luau constructors
 Allows you to reuse your GUI components as Luau modules
+
+Each template under referenceRBXMXfiles/ is streamed with iterparse (elements
+are discarded as soon as their Item closes, so memory stays bounded by tree
+depth rather than file size) and compiled into straight-line Luau that builds
+the exact Instance tree: every property is assigned while the instance is
+still detached, children are parented bottom-up, and the root is parented to
+the live DataModel last. That is the engine's fast path and lets callers drop
+Clone() of large stored templates.
+
+With --lazy only the root shells are built up front: every top-level panel
+becomes its own constructor that runs on the first Show() that needs it, and
+repeated siblings (plus the lone template under a list/grid layout) become
+row constructors backed by a pool.
+
+Usage:
+    python "gold mine of info/scripts/convert_components.py" [files...] [--output DIR] [--lazy]
 """
 
-import os
-import xml.etree.ElementTree as ET
+import argparse
+import base64
 import re
+import struct
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 
-def convert_rbxmx_to_luau(rbxmx_path, output_path):
-    """Convert a .rbxmx file to Luau code"""
-    
-    print(f"Converting {rbxmx_path} to {output_path}")
-    
-    # Parse the XML file
-    tree = ET.parse(rbxmx_path)
-    root = tree.getroot()
-    
-    # Generate Luau code
-    luau_code = generate_luau_code(root, os.path.basename(rbxmx_path))
-    
-    # Write to output file
-    with open(output_path, 'w') as f:
-        f.write(luau_code)
-    
-    print(f"✅ Converted {rbxmx_path} to {output_path}")
+ROOT = Path(__file__).resolve().parents[2]
+INPUT_DIR = ROOT / "referenceRBXMXfiles"
+OUTPUT_DIR = ROOT / "src" / "shared" / "Components" / "Generated"
+
+# Serialized properties that are not settable from scripts, or that exporters
+# (the Figma plugin in particular) write even though the class has no such member.
+IGNORED_PROPERTIES = {
+    "Capabilities",
+    "DefinesCapabilities",
+    "SourceAssetId",
+    "LocalizationMatchIdentifier",
+    "LocalizationMatchedSourceText",
+    "Type",
+    "EffectRadius",
+}
+
+CLASS_IGNORED_PROPERTIES = {
+    # Studio beta members that are serialized but not yet scriptable.
+    "UIStroke": {"ZIndex", "BorderOffset", "BorderStrokePosition", "StrokeSizingMode"},
+}
+
+# token values -> Enum item names for readable output. Tokens not listed here
+# are emitted as their integer value, which the engine coerces on assignment.
+ENUM_TOKENS: Dict[str, Tuple[str, Dict[int, str]]] = {
+    "ApplyStrokeMode": ("ApplyStrokeMode", {0: "Contextual", 1: "Border"}),
+    "AspectType": ("AspectType", {0: "FitWithinMaxSize", 1: "ScaleWithParentSize"}),
+    "AutomaticCanvasSize": ("AutomaticSize", {0: "None", 1: "X", 2: "Y", 3: "XY"}),
+    "AutomaticSize": ("AutomaticSize", {0: "None", 1: "X", 2: "Y", 3: "XY"}),
+    "BorderMode": ("BorderMode", {0: "Outline", 1: "Middle", 2: "Inset"}),
+    "DominantAxis": ("DominantAxis", {0: "Width", 1: "Height"}),
+    "ElasticBehavior": ("ElasticBehavior", {0: "WhenScrollable", 1: "Always", 2: "Never"}),
+    "FillDirection": ("FillDirection", {0: "Horizontal", 1: "Vertical"}),
+    "HorizontalAlignment": ("HorizontalAlignment", {0: "Center", 1: "Left", 2: "Right"}),
+    "HorizontalFlex": ("UIFlexAlignment", {0: "None", 1: "Fill", 2: "SpaceAround", 3: "SpaceBetween", 4: "SpaceEvenly"}),
+    "HorizontalScrollBarInset": ("ScrollBarInset", {0: "None", 1: "ScrollBar", 2: "Always"}),
+    "ItemLineAlignment": ("ItemLineAlignment", {0: "Automatic", 1: "Start", 2: "Center", 3: "End", 4: "Stretch"}),
+    "LineJoinMode": ("LineJoinMode", {0: "Round", 1: "Bevel", 2: "Miter"}),
+    "ResampleMode": ("ResamplerMode", {0: "Default", 1: "Pixelated"}),
+    "SafeAreaCompatibility": ("SafeAreaCompatibility", {0: "None", 1: "FullscreenExtension"}),
+    "ScaleType": ("ScaleType", {0: "Stretch", 1: "Slice", 2: "Tile", 3: "Fit", 4: "Crop"}),
+    "ScreenInsets": ("ScreenInsets", {0: "None", 1: "DeviceSafeInsets", 2: "CoreUISafeInsets", 3: "TopbarSafeInsets"}),
+    "ScrollingDirection": ("ScrollingDirection", {1: "X", 2: "Y", 4: "XY"}),
+    "SelectionBehaviorDown": ("SelectionBehavior", {0: "Escape", 1: "Stop"}),
+    "SelectionBehaviorLeft": ("SelectionBehavior", {0: "Escape", 1: "Stop"}),
+    "SelectionBehaviorRight": ("SelectionBehavior", {0: "Escape", 1: "Stop"}),
+    "SelectionBehaviorUp": ("SelectionBehavior", {0: "Escape", 1: "Stop"}),
+    "SizeConstraint": ("SizeConstraint", {0: "RelativeXY", 1: "RelativeXX", 2: "RelativeYY"}),
+    "SortOrder": ("SortOrder", {0: "Name", 1: "Custom", 2: "LayoutOrder"}),
+    "StartCorner": ("StartCorner", {0: "TopLeft", 1: "TopRight", 2: "BottomLeft", 3: "BottomRight"}),
+    "TextDirection": ("TextDirection", {0: "Auto", 1: "LeftToRight", 2: "RightToLeft"}),
+    "TextTruncate": ("TextTruncate", {0: "None", 1: "AtEnd", 2: "SplitWord"}),
+    "TextXAlignment": ("TextXAlignment", {0: "Left", 1: "Right", 2: "Center"}),
+    "TextYAlignment": ("TextYAlignment", {0: "Top", 1: "Center", 2: "Bottom"}),
+    "VerticalAlignment": ("VerticalAlignment", {0: "Center", 1: "Top", 2: "Bottom"}),
+    "VerticalFlex": ("UIFlexAlignment", {0: "None", 1: "Fill", 2: "SpaceAround", 3: "SpaceBetween", 4: "SpaceEvenly"}),
+    "VerticalScrollBarInset": ("ScrollBarInset", {0: "None", 1: "ScrollBar", 2: "Always"}),
+    "VerticalScrollBarPosition": ("VerticalScrollBarPosition", {0: "Right", 1: "Left"}),
+    "ZIndexBehavior": ("ZIndexBehavior", {0: "Global", 1: "Sibling"}),
+}
+
+# Top-level children of these classes become lazily built panels, and the same
+# classes under a list/grid layout become pooled row templates.
+GUI_OBJECT_CLASSES = {
+    "Frame", "ScrollingFrame", "CanvasGroup", "ImageLabel", "ImageButton",
+    "TextLabel", "TextButton", "TextBox", "ViewportFrame", "VideoFrame",
+}
+LAYOUT_CLASSES = {"UIListLayout", "UIGridLayout", "UITableLayout", "UIPageLayout"}
+ROW_POOL_LIMIT = 64
+
+FONT_WEIGHTS = {
+    100: "Thin", 200: "ExtraLight", 300: "Light", 400: "Regular", 500: "Medium",
+    600: "SemiBold", 700: "Bold", 800: "ExtraBold", 900: "Heavy",
+}
+
+# Attribute value types in the AttributesSerialize blob that map to Luau literals.
+_ATTR_STRING = 0x02
+_ATTR_BOOL = 0x03
+_ATTR_FLOAT = 0x05
+_ATTR_DOUBLE = 0x06
+
+
+def lua_string(value: str) -> str:
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace("\"", "\\\"")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+    escaped = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", lambda m: f"\\{ord(m.group()):03d}", escaped)
+    return f'"{escaped}"'
+
+
+def lua_number(text: Optional[str]) -> str:
+    """Format a serialized float with the shortest digits that survive float32."""
+    raw = (text or "0").strip()
+    lowered = raw.lower()
+    if lowered in ("inf", "+inf"):
+        return "math.huge"
+    if lowered == "-inf":
+        return "-math.huge"
+    if lowered == "nan":
+        return "0 / 0"
+
+    value = float(raw)
+    if value == int(value) and abs(value) < 2 ** 53:
+        return str(int(value))
+    target = struct.pack("<f", value)
+    for precision in range(1, 10):
+        candidate = f"{value:.{precision}g}"
+        if struct.pack("<f", float(candidate)) == target:
+            return candidate
+    return repr(value)
+
+
+def _child_number(element: ET.Element, tag: str) -> str:
+    return lua_number(element.findtext(tag))
+
+
+def _content_url(element: ET.Element) -> Optional[str]:
+    for tag in ("url", "uri"):
+        url = element.findtext(tag)
+        if url is not None:
+            return url.strip()
+    if element.find("null") is not None:
+        return None
+    text = (element.text or "").strip()
+    return text or None
+
+
+def encode_property(element: ET.Element) -> Optional[str]:
+    """Return the Luau literal for one serialized property, or None to skip it."""
+    tag = element.tag
+    name = element.get("name")
+    text = element.text or ""
+
+    if tag == "bool":
+        return "true" if text.strip() == "true" else "false"
+    if tag in ("int", "int64"):
+        return str(int(text.strip() or 0))
+    if tag in ("float", "double"):
+        return lua_number(text)
+    if tag in ("string", "ProtectedString"):
+        return lua_string(text)
+    if tag == "token":
+        value = int(text.strip() or 0)
+        enum = ENUM_TOKENS.get(name)
+        if enum and value in enum[1]:
+            return f"Enum.{enum[0]}.{enum[1][value]}"
+        return str(value)
+    if tag == "Vector2":
+        return f"Vector2.new({_child_number(element, 'X')}, {_child_number(element, 'Y')})"
+    if tag == "UDim":
+        return f"UDim.new({_child_number(element, 'S')}, {_child_number(element, 'O')})"
+    if tag == "UDim2":
+        return "UDim2.new({}, {}, {}, {})".format(
+            _child_number(element, "XS"),
+            _child_number(element, "XO"),
+            _child_number(element, "YS"),
+            _child_number(element, "YO"),
+        )
+    if tag == "Color3":
+        components = [_child_number(element, c) for c in ("R", "G", "B")]
+        if element.find("R") is None and text.strip():
+            # Packed 0xAARRGGBB form written by older Studio builds.
+            packed = int(text.strip())
+            return f"Color3.fromRGB({(packed >> 16) & 255}, {(packed >> 8) & 255}, {packed & 255})"
+        return f"Color3.new({', '.join(components)})"
+    if tag == "Color3uint8":
+        packed = int(text.strip() or 0)
+        return f"Color3.fromRGB({(packed >> 16) & 255}, {(packed >> 8) & 255}, {packed & 255})"
+    if tag == "Rect2D":
+        lo = element.find("min")
+        hi = element.find("max")
+        if lo is None or hi is None:
+            return None
+        return "Rect.new({}, {}, {}, {})".format(
+            _child_number(lo, "X"), _child_number(lo, "Y"), _child_number(hi, "X"), _child_number(hi, "Y")
+        )
+    if tag == "Content":
+        url = _content_url(element)
+        if not url or url == "rbxassetid://":
+            return None
+        return lua_string(url)
+    if tag == "Font":
+        family = _content_url(element.find("Family")) if element.find("Family") is not None else None
+        if not family:
+            return None
+        weight = FONT_WEIGHTS.get(int(element.findtext("Weight") or 400), "Regular")
+        style = (element.findtext("Style") or "Normal").strip()
+        return f"Font.new({lua_string(family)}, Enum.FontWeight.{weight}, Enum.FontStyle.{style})"
+
+    # Ref, SecurityCapabilities, BinaryString and friends have no literal form.
+    return None
+
+
+def decode_attributes(blob: str) -> List[Tuple[str, str]]:
+    """Decode an AttributesSerialize payload into (name, Luau literal) pairs."""
+    try:
+        data = base64.b64decode(blob)
+    except ValueError:
+        return []
+    if len(data) < 4:
+        return []
+
+    def read_string(offset: int) -> Tuple[str, int]:
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        return data[offset:offset + length].decode("utf-8"), offset + length
+
+    attributes = []
+    (count,) = struct.unpack_from("<I", data, 0)
+    offset = 4
+    for _ in range(count):
+        name, offset = read_string(offset)
+        kind = data[offset]
+        offset += 1
+        if kind == _ATTR_STRING:
+            value, offset = read_string(offset)
+            attributes.append((name, lua_string(value)))
+        elif kind == _ATTR_BOOL:
+            attributes.append((name, "true" if data[offset] else "false"))
+            offset += 1
+        elif kind == _ATTR_FLOAT:
+            attributes.append((name, lua_number(repr(struct.unpack_from("<f", data, offset)[0]))))
+            offset += 4
+        elif kind == _ATTR_DOUBLE:
+            attributes.append((name, repr(struct.unpack_from("<d", data, offset)[0])))
+            offset += 8
+        else:
+            # Remaining attribute types have variable layouts; stop rather than misread.
+            print(f"⚠️  Unsupported attribute type 0x{kind:02x} on '{name}', skipping the rest")
+            break
+    return attributes
+
+
+def collect_properties(class_name: str, properties: ET.Element) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Return (property assignments, extra statements) for one Properties block.
+
+    Name comes first so errors in Studio point at a recognizable instance;
+    attributes and tags become SetAttribute/AddTag calls.
+    """
+    ignored = IGNORED_PROPERTIES | CLASS_IGNORED_PROPERTIES.get(class_name, set())
+    assignments: List[Tuple[str, str]] = []
+    extras: List[str] = []
+    name_literal = None
+
+    for element in properties:
+        prop = element.get("name")
+        if prop in ignored:
+            continue
+        if element.tag == "BinaryString":
+            payload = (element.text or "").strip()
+            if prop == "AttributesSerialize" and payload:
+                for attr_name, literal in decode_attributes(payload):
+                    extras.append(f":SetAttribute({lua_string(attr_name)}, {literal})")
+            elif prop == "Tags" and payload:
+                for tag in base64.b64decode(payload).decode("utf-8").split("\0"):
+                    if tag:
+                        extras.append(f":AddTag({lua_string(tag)})")
+            continue
+
+        literal = encode_property(element)
+        if literal is None:
+            continue
+        if prop == "Name":
+            name_literal = literal
+        else:
+            assignments.append((prop, literal))
+
+    if name_literal is not None:
+        assignments.insert(0, ("Name", name_literal))
+    return assignments, extras
+
+
+class _Node:
+    """One compiled Item: its class, literal assignments and compiled children."""
+
+    __slots__ = ("class_name", "name", "assignments", "extras", "children")
+
+    def __init__(self, class_name: str):
+        self.class_name = class_name
+        self.name = class_name
+        self.assignments: List[Tuple[str, str]] = []
+        self.extras: List[str] = []
+        self.children: List["_Node"] = []
+
+    def count(self) -> int:
+        return 1 + sum(child.count() for child in self.children)
+
+    def visible(self) -> bool:
+        return dict(self.assignments).get("Visible", "true") == "true"
 
-def generate_luau_code(root, filename):
-    """Generate Luau code from XML root"""
-    
-    component_name = filename.replace('.rbxmx', '').replace('.rbxm', '')
-    class_name = component_name.title().replace('_', '')
-    
-    luau_code = f"""--[[
-    {class_name} - Generated from {filename}
-    Reusable GUI component for Animal Crossing game
-]]
 
-local TweenService = game:GetService("TweenService")
+def compile_rbxmx(rbxmx_path: Path) -> List[_Node]:
+    """Stream a template and compile its top-level Items.
 
-local {class_name} = {{}}
-{class_name}.__index = {class_name}
+    Only the compiled literals are kept; each XML element is cleared and
+    detached from its parent as soon as it closes.
+    """
+    roots: List[_Node] = []
+    nodes: List[_Node] = []
+    elements: List[ET.Element] = []
+
+    for event, element in ET.iterparse(str(rbxmx_path), events=("start", "end")):
+        if event == "start":
+            elements.append(element)
+            if element.tag == "Item":
+                nodes.append(_Node(element.get("class") or "Folder"))
+            continue
+
+        elements.pop()
+        if element.tag == "Properties" and nodes:
+            node = nodes[-1]
+            node.assignments, node.extras = collect_properties(node.class_name, element)
+            if node.assignments and node.assignments[0][0] == "Name":
+                node.name = node.assignments[0][1][1:-1]
+            element.clear()
+        elif element.tag == "Item":
+            node = nodes.pop()
+            (nodes[-1].children if nodes else roots).append(node)
+            element.clear()
+            if elements:
+                elements[-1].remove(element)
+
+    return roots
+
+
+class _Function:
+    """Body of one generated constructor. Locals are reused per tree depth."""
+
+    def __init__(self, name: str, comment: str):
+        self.name = name
+        self.comment = comment
+        self.lines: List[str] = []
+        self.max_depth = 1
+
+    def render(self) -> List[str]:
+        variables = ", ".join(f"d{depth}" for depth in range(1, self.max_depth + 1))
+        out = [f"-- {self.comment}", f"local function {self.name}()", f"    local {variables}"]
+        out.extend(f"    {line}" for line in self.lines)
+        out.append("    return d1")
+        out.append("end")
+        return out
+
+
+class _Row:
+    __slots__ = ("key", "function")
+
+    def __init__(self, key: str, function: _Function):
+        self.key = key
+        self.function = function
+
+
+# Properties re-applied at every call site so identical rows share one constructor.
+# Root properties that differ between the repeated siblings are added per group.
+ROW_CALL_SITE_PROPERTIES = ("Name", "LayoutOrder")
+
+# Row node id -> (shared constructor, root properties re-applied at its call site).
+_RowPlan = Dict[int, Tuple[_Row, Tuple[str, ...]]]
+
+
+def _emit(fn: _Function, node: _Node, depth: int, rows: _RowPlan, skip=(), skip_root: Sequence[str] = ()) -> None:
+    """Append the statements that build `node` into d{depth}; children parent bottom-up."""
+    var = f"d{depth}"
+    fn.max_depth = max(fn.max_depth, depth)
+    fn.lines.append(f"{var} = Instance.new({lua_string(node.class_name)})")
+    for prop, literal in node.assignments:
+        if prop not in skip_root:
+            fn.lines.append(f"{var}.{prop} = {literal}")
+    for extra in node.extras:
+        fn.lines.append(f"{var}{extra}")
+
+    child_var = f"d{depth + 1}"
+    for child in node.children:
+        if id(child) in skip:
+            continue
+        planned = rows.get(id(child))
+        if planned is not None:
+            row, call_site = planned
+            fn.max_depth = max(fn.max_depth, depth + 1)
+            fn.lines.append(f"{child_var} = {row.function.name}()")
+            for prop, literal in child.assignments:
+                if prop in call_site:
+                    fn.lines.append(f"{child_var}.{prop} = {literal}")
+        else:
+            _emit(fn, child, depth + 1, rows)
+        # Parent last, bottom-up: the subtree is complete before it is attached.
+        fn.lines.append(f"{child_var}.Parent = {var}")
+
+
+def _is_panel(node: _Node) -> bool:
+    return node.class_name in GUI_OBJECT_CLASSES
+
+
+def _structure(node: _Node) -> Tuple:
+    """Class and named child tree of `node`, ignoring property values."""
+    return (node.class_name, tuple((child.name, _structure(child)) for child in node.children))
+
+
+def _row_groups(node: _Node) -> List[List[_Node]]:
+    """Group the GuiObject children of `node` that should share a row constructor.
+
+    Siblings with the same name, class and structure repeat, so each such set
+    of two or more is a group. A lone GuiObject under a list/grid layout is the
+    template the layout lays out copies of, so it is a group of its own.
+    Distinct singletons (a stats bar's MilesCount and BellsCount) are not rows.
+    """
+    gui_children = [child for child in node.children if child.class_name in GUI_OBJECT_CLASSES]
+    by_structure: Dict[Tuple, List[_Node]] = {}
+    for child in gui_children:
+        by_structure.setdefault((child.name, _structure(child)), []).append(child)
+
+    groups = [group for group in by_structure.values() if len(group) > 1]
+    has_layout = any(child.class_name in LAYOUT_CLASSES for child in node.children)
+    if has_layout and len(gui_children) == 1:
+        groups.append(gui_children)
+    return groups
+
+
+def _plan_rows(roots: Sequence[_Node]) -> Tuple[_RowPlan, List[_Row]]:
+    """Turn repeated GuiObject siblings into shared, poolable row constructors."""
+    rows: _RowPlan = {}
+    ordered: List[_Row] = []
+    by_body: Dict[str, _Row] = {}
+    keys = set()
+
+    def visit(node: _Node, depth: int) -> None:
+        # Direct children of a root are panels, never rows.
+        groups = _row_groups(node) if depth > 1 else []
+        for group in groups:
+            literals = [dict(member.assignments) for member in group]
+            varying = {prop for values in literals for prop in values if any(other.get(prop) != values[prop] for other in literals)}
+            call_site = ROW_CALL_SITE_PROPERTIES + tuple(sorted(varying - set(ROW_CALL_SITE_PROPERTIES)))
+            for child in group:
+                fn = _Function("", "")
+                _emit(fn, child, 1, rows, skip_root=call_site)
+                body = "\n".join(fn.lines)
+                row = by_body.get(body)
+                if row is None:
+                    key = child.name
+                    suffix = 2
+                    while key in keys:
+                        key = f"{child.name}#{suffix}"
+                        suffix += 1
+                    keys.add(key)
+                    fn.name = f"row{len(ordered) + 1}"
+                    fn.comment = f"Row {child.class_name} \"{key}\" ({child.count()} instances)"
+                    row = _Row(key, fn)
+                    by_body[body] = row
+                    ordered.append(row)
+                rows[id(child)] = (row, call_site)
+
+        for child in node.children:
+            if id(child) not in rows:
+                visit(child, depth + 1)
+
+    for root in roots:
+        visit(root, 1)
+    return rows, ordered
+
+
+def _module_header(class_name: str, filename: str, total: int, lazy: bool) -> List[str]:
+    lines = [
+        "--[[",
+        f"    {class_name} - Generated from {filename} by convert_components.py",
+        "    Do not edit by hand; re-run the converter after changing the template.",
+        "",
+        f"    {class_name}.build() returns fresh, unparented roots ({total} instances)",
+        "    and replaces template:Clone(). Every property is set before Parent,",
+        "    children are attached bottom-up and roots are parented last.",
+    ]
+    if lazy:
+        lines += [
+            "",
+            "    Lazy mode: .new() only builds root shells. Each top-level panel is",
+            "    constructed the first time Show() needs it, and repeated rows are",
+            "    served from a pool via AcquireRow/ReleaseRow.",
+        ]
+    lines += ["]]", "", f"local {class_name} = {{}}", f"{class_name}.__index = {class_name}", ""]
+    return lines
+
+
+_SHARED_RUNTIME = """local function setShown(root, shown)
+    if root:IsA("LayerCollector") then
+        root.Enabled = shown
+    elseif root:IsA("GuiObject") then
+        root.Visible = shown
+    end
+end
+"""
+
+
+def _eager_module(class_name: str, roots: Sequence[_Node]) -> List[str]:
+    lines: List[str] = []
+    builders = []
+    for index, root in enumerate(roots, start=1):
+        fn = _Function(f"build{index}", f"{root.class_name} \"{root.name}\" ({root.count()} instances)")
+        _emit(fn, root, 1, {})
+        lines.extend(fn.render())
+        lines.append("")
+        builders.append((root, fn))
+
+    lines.append("local BUILDERS = {")
+    for root, fn in builders:
+        lines.append(f"    {{ name = {lua_string(root.name)}, build = {fn.name} }},")
+    lines.append("}")
+    lines.append("")
+    lines.append(_SHARED_RUNTIME)
+    lines.append(f"""-- Build every root without parenting it.
+function {class_name}.build()
+    local roots = table.create(#BUILDERS)
+    for index, builder in ipairs(BUILDERS) do
+        roots[index] = builder.build()
+    end
+    return roots
+end
 
 function {class_name}.new(parent)
     local self = setmetatable({{}}, {class_name})
     self._parent = parent
+    self._roots = {{}}
     self._gui = nil
-    
+
     self:_createGUI()
-    
+
     return self
 end
 
 function {class_name}:_createGUI()
-    -- Create ScreenGui
-    local screenGui = Instance.new("ScreenGui")
-    screenGui.Name = "{class_name}GUI"
-    screenGui.ResetOnSpawn = false
-    screenGui.Parent = self._parent
-    
-    -- TODO: Add your GUI elements here
-    -- This is a placeholder - you'll need to manually convert the XML elements
-    
-    self._gui = screenGui
+    for index, root in ipairs({class_name}.build()) do
+        root.Parent = self._parent
+        self._roots[index] = root
+    end
+
+    self._gui = self._roots[1]
     print("[{class_name}] GUI created")
 end
 
+-- Look up a generated root by its template name.
+function {class_name}:GetRoot(name)
+    for _, root in ipairs(self._roots) do
+        if root.Name == name then
+            return root
+        end
+    end
+    return nil
+end
+
 function {class_name}:Show()
-    if self._gui then
-        self._gui.Enabled = true
-        print("[{class_name}] Shown")
+    for _, root in ipairs(self._roots) do
+        setShown(root, true)
     end
 end
 
 function {class_name}:Hide()
-    if self._gui then
-        self._gui.Enabled = false
-        print("[{class_name}] Hidden")
+    for _, root in ipairs(self._roots) do
+        setShown(root, false)
     end
 end
 
 function {class_name}:Destroy()
-    if self._gui then
-        self._gui:Destroy()
-        self._gui = nil
-        print("[{class_name}] Destroyed")
+    for _, root in ipairs(self._roots) do
+        root:Destroy()
+    end
+    self._roots = {{}}
+    self._gui = nil
+    print("[{class_name}] Destroyed")
+end""")
+    return lines
+
+
+def _lazy_module(class_name: str, roots: Sequence[_Node]) -> List[str]:
+    rows, ordered_rows = _plan_rows(roots)
+    lines: List[str] = []
+    for row in ordered_rows:
+        lines.extend(row.function.render())
+        lines.append("")
+
+    shells = []
+    panel_specs: List[List[Tuple[_Node, _Function]]] = []
+    for index, root in enumerate(roots, start=1):
+        panels = []
+        for position, child in enumerate(root.children, start=1):
+            if _is_panel(child):
+                fn = _Function(
+                    f"panel{index}_{position}",
+                    f"Panel {child.class_name} \"{child.name}\" ({child.count()} instances)",
+                )
+                _emit(fn, child, 1, rows)
+                lines.extend(fn.render())
+                lines.append("")
+                panels.append((child, fn))
+        panel_specs.append(panels)
+
+        skip = {id(child) for child, _ in panels}
+        eager = root.count() - sum(child.count() for child, _ in panels)
+        shell = _Function(f"build{index}", f"{root.class_name} \"{root.name}\" shell ({eager} of {root.count()} instances)")
+        _emit(shell, root, 1, rows, skip=skip)
+        lines.extend(shell.render())
+        lines.append("")
+        shells.append((root, shell))
+
+    lines.append("local BUILDERS = {")
+    for (root, shell), panels in zip(shells, panel_specs):
+        lines.append(f"    {{ name = {lua_string(root.name)}, build = {shell.name}, panels = {{")
+        for child, fn in panels:
+            visible = "true" if child.visible() else "false"
+            lines.append(f"        {{ name = {lua_string(child.name)}, build = {fn.name}, visible = {visible} }},")
+        lines.append("    } },")
+    lines.append("}")
+    lines.append("")
+
+    lines.append("local ROWS = {")
+    for row in ordered_rows:
+        lines.append(f"    [{lua_string(row.key)}] = {row.function.name},")
+    lines.append("}")
+    lines.append("")
+    lines.append("-- Released rows kept per key; extras are destroyed.")
+    lines.append(f"local ROW_POOL_LIMIT = {ROW_POOL_LIMIT}")
+    lines.append("")
+    lines.append(_SHARED_RUNTIME)
+    lines.append(f"""-- Build every root, including all panels, without parenting it.
+function {class_name}.build()
+    local roots = table.create(#BUILDERS)
+    for index, builder in ipairs(BUILDERS) do
+        local root = builder.build()
+        for _, panel in ipairs(builder.panels) do
+            panel.build().Parent = root
+        end
+        roots[index] = root
     end
+    return roots
 end
 
-return {class_name}
-"""
-    
-    return luau_code
+function {class_name}.new(parent)
+    local self = setmetatable({{}}, {class_name})
+    self._parent = parent
+    self._roots = {{}}
+    self._panels = {{}}
+    self._pools = {{}}
+    self._rowKeys = setmetatable({{}}, {{ __mode = "k" }})
+    self._gui = nil
+
+    self:_createGUI()
+
+    return self
+end
+
+function {class_name}:_createGUI()
+    for index, builder in ipairs(BUILDERS) do
+        local root = builder.build()
+        root.Parent = self._parent
+        self._roots[index] = root
+        self._panels[index] = {{}}
+    end
+
+    self._gui = self._roots[1]
+    print("[{class_name}] GUI shell created")
+end
+
+function {class_name}:_materialize(rootIndex, panelIndex)
+    local built = self._panels[rootIndex]
+    local panel = built[panelIndex]
+    if not panel then
+        panel = BUILDERS[rootIndex].panels[panelIndex].build()
+        panel.Parent = self._roots[rootIndex]
+        built[panelIndex] = panel
+    end
+    return panel
+end
+
+function {class_name}:_findPanel(name)
+    for rootIndex, builder in ipairs(BUILDERS) do
+        for panelIndex, spec in ipairs(builder.panels) do
+            if spec.name == name or builder.name .. "/" .. spec.name == name then
+                return rootIndex, panelIndex
+            end
+        end
+    end
+    return nil, nil
+end
+
+-- Look up a generated root by its template name.
+function {class_name}:GetRoot(name)
+    for _, root in ipairs(self._roots) do
+        if root.Name == name then
+            return root
+        end
+    end
+    return nil
+end
+
+-- Return a top-level panel by name ("Panel" or "Root/Panel"), constructing
+-- it on first use.
+function {class_name}:GetPanel(name)
+    local rootIndex, panelIndex = self:_findPanel(name)
+    if not rootIndex then
+        return nil
+    end
+    return self:_materialize(rootIndex, panelIndex)
+end
+
+-- Show everything, or a single panel by name. Panels are built the first
+-- time they become visible; with no name only panels visible in the
+-- template are built.
+function {class_name}:Show(panelName)
+    if panelName then
+        local rootIndex, panelIndex = self:_findPanel(panelName)
+        if not rootIndex then
+            warn("[{class_name}] Unknown panel: " .. tostring(panelName))
+            return
+        end
+        self:_materialize(rootIndex, panelIndex).Visible = true
+        setShown(self._roots[rootIndex], true)
+        return
+    end
 
-def main():
+    for rootIndex, root in ipairs(self._roots) do
+        for panelIndex, spec in ipairs(BUILDERS[rootIndex].panels) do
+            if spec.visible then
+                self:_materialize(rootIndex, panelIndex)
+            end
+        end
+        setShown(root, true)
+    end
+end
+
+-- Hide everything, or a single panel by name. Built panels are kept for
+-- the next Show().
+function {class_name}:Hide(panelName)
+    if panelName then
+        local rootIndex, panelIndex = self:_findPanel(panelName)
+        local panel = rootIndex and self._panels[rootIndex][panelIndex]
+        if panel then
+            panel.Visible = false
+        end
+        return
+    end
+
+    for _, root in ipairs(self._roots) do
+        setShown(root, false)
+    end
+end
+
+-- Take a list row built from the template, reusing a released one if possible.
+function {class_name}:AcquireRow(key)
+    local pool = self._pools[key]
+    local row = pool and table.remove(pool)
+    if not row then
+        local build = ROWS[key]
+        if not build then
+            warn("[{class_name}] Unknown row template: " .. tostring(key))
+            return nil
+        end
+        row = build()
+        self._rowKeys[row] = key
+    end
+    return row
+end
+
+function {class_name}:ReleaseRow(row)
+    local key = self._rowKeys[row]
+    if not key then
+        row:Destroy()
+        return
+    end
+
+    row.Parent = nil
+    local pool = self._pools[key]
+    if not pool then
+        pool = {{}}
+        self._pools[key] = pool
+    end
+    if #pool < ROW_POOL_LIMIT then
+        table.insert(pool, row)
+    else
+        self._rowKeys[row] = nil
+        row:Destroy()
+    end
+end
+
+function {class_name}:Destroy()
+    for _, root in ipairs(self._roots) do
+        root:Destroy()
+    end
+    for _, pool in pairs(self._pools) do
+        for _, row in ipairs(pool) do
+            row:Destroy()
+        end
+    end
+    self._roots = {{}}
+    self._panels = {{}}
+    self._pools = {{}}
+    self._gui = nil
+    print("[{class_name}] Destroyed")
+end""")
+    return lines
+
+
+def component_name(filename: str) -> str:
+    stem = Path(filename).stem
+    parts = [part for part in re.split(r"[^0-9A-Za-z]+", stem) if part]
+    name = "".join(part[0].upper() + part[1:] for part in parts) or "Component"
+    if name[0].isdigit():
+        name = f"Gui{name}"
+    return name
+
+
+def generate_luau_code(rbxmx_path: Path, lazy: bool = False) -> str:
+    """Generate a Luau component module from an .rbxmx template."""
+    filename = Path(rbxmx_path).name
+    class_name = component_name(filename)
+    roots = compile_rbxmx(Path(rbxmx_path))
+    total = sum(root.count() for root in roots)
+
+    lines = _module_header(class_name, filename, total, lazy)
+    lines += _lazy_module(class_name, roots) if lazy else _eager_module(class_name, roots)
+    lines.append("")
+    lines.append(f"return {class_name}")
+    return "\n".join(lines) + "\n"
+
+
+def convert_rbxmx_to_luau(rbxmx_path, output_path, lazy=False):
+    """Convert a .rbxmx file to Luau code"""
+
+    print(f"Converting {rbxmx_path} to {output_path}{' (lazy)' if lazy else ''}")
+
+    luau_code = generate_luau_code(Path(rbxmx_path), lazy)
+    Path(output_path).write_text(luau_code, encoding="utf-8")
+
+    print(f"✅ Converted {rbxmx_path} to {output_path}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
     """Main conversion function"""
-    
-    # Define input and output paths
-    input_files = [
-        "hi.rbxmx",
-        "test.rbxm"
-    ]
-    
-    output_dir = "src/shared/Components/Generated"
-    
+
+    parser = argparse.ArgumentParser(description="Compile .rbxmx GUI templates into Luau constructors.")
+    parser.add_argument("files", nargs="*", type=Path, help=f"Templates to convert (default: {INPUT_DIR.name}/*.rbxmx).")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="Directory for generated modules.")
+    parser.add_argument("--lazy", action="store_true", help="Defer each top-level panel until first Show() and pool list rows.")
+    args = parser.parse_args(argv)
+
+    input_files = args.files or sorted(INPUT_DIR.glob("*.rbxmx"))
+    if not input_files:
+        print(f"⚠️  No .rbxmx files found in {INPUT_DIR}")
+        return 1
+
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-    
+    args.output.mkdir(parents=True, exist_ok=True)
+
     # Convert each file
+    failures = 0
     for input_file in input_files:
-        if os.path.exists(input_file):
-            output_file = os.path.join(output_dir, f"{input_file.replace('.rbxmx', '').replace('.rbxm', '')}.luau")
-            convert_rbxmx_to_luau(input_file, output_file)
-        else:
+        if not input_file.exists():
             print(f"⚠️  File not found: {input_file}")
-    
+            failures += 1
+            continue
+        output_file = args.output / f"{component_name(input_file.name)}.luau"
+        convert_rbxmx_to_luau(input_file, output_file, args.lazy)
+
     print("\n🎉 Component conversion complete!")
-    print("Generated components are in src/shared/Components/Generated/")
+    print(f"Generated components are in {args.output}")
+    return 1 if failures else 0
+
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -4,25 +4,44 @@
 The script performs a light-weight normalization pass over all tracked Luau
 files so Studio can load the project without issues caused by mixed line
 endings or stray trailing whitespace.
+
+Files already known to be clean are skipped using a cache keyed on path,
+mtime and size (falling back to a content hash when only the mtime moved),
+and the remaining files are normalized in a process pool. Pass ``--check``
+to report files that need fixes without rewriting them.
 """
 
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 LUAU_EXTENSIONS = {".luau", ".lua"}
 
+CACHE_PATH = REPO_ROOT / ".luau_lint_cache.json"
+CACHE_VERSION = 1
 
-def iter_source_files(root: Path):
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.suffix.lower() in LUAU_EXTENSIONS:
-            yield path
+# Below this many files the process pool costs more than it saves.
+POOL_THRESHOLD = 32
+
+
+def iter_source_files(root: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in LUAU_EXTENSIONS:
+                    yield Path(entry.path), entry.stat()
 
 
-def lint_file(path: Path) -> bool:
-    original = path.read_text(encoding="utf-8")
+def normalize(original: str) -> str:
     # Normalize line endings and strip trailing whitespace on each line.
     normalized_lines = [line.rstrip() for line in original.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
 
@@ -30,27 +49,103 @@ def lint_file(path: Path) -> bool:
     new_content = "\n".join(normalized_lines)
     if not new_content.endswith("\n"):
         new_content += "\n"
+    return new_content
+
+
+def lint_file(path: Path, write: bool = True) -> Tuple[bool, str]:
+    """Normalize one file. Returns (needed_changes, sha1 of the clean content)."""
+    raw = path.read_bytes()
+    original = raw.decode("utf-8")
+    new_content = normalize(original)
 
     if new_content == original:
-        return False
+        return False, hashlib.sha1(raw).hexdigest()
+
+    encoded = new_content.encode("utf-8")
+    if write:
+        path.write_bytes(encoded)
+    return True, hashlib.sha1(encoded).hexdigest()
+
 
-    path.write_text(new_content, encoding="utf-8")
-    return True
+def _lint_job(job: Tuple[str, bool]) -> Tuple[str, bool, str]:
+    path, write = job
+    changed, digest = lint_file(Path(path), write)
+    return path, changed, digest
 
 
-def main() -> None:
+def load_cache() -> Dict[str, Dict]:
+    try:
+        payload = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != CACHE_VERSION:
+        return {}
+    return payload.get("files", {})
+
+
+def save_cache(files: Dict[str, Dict]) -> None:
+    CACHE_PATH.write_text(json.dumps({"version": CACHE_VERSION, "files": files}, separators=(",", ":")), encoding="utf-8")
+
+
+def plan(root: Path, cache: Dict[str, Dict], fresh: Dict[str, Dict]) -> List[str]:
+    """Return files that must be linted; clean cache hits are copied into `fresh`."""
+    pending = []
+    for path, stat in iter_source_files(root):
+        key = str(path.relative_to(REPO_ROOT))
+        entry = cache.get(key)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            fresh[key] = entry
+            continue
+        if entry and entry["size"] == stat.st_size:
+            # Touched but possibly unchanged (checkout, save without edits): hash before normalizing.
+            if hashlib.sha1(path.read_bytes()).hexdigest() == entry["hash"]:
+                fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": entry["hash"]}
+                continue
+        pending.append(key)
+    return pending
+
+
+def run(keys: Sequence[str], write: bool, jobs: Optional[int]) -> List[Tuple[str, bool, str]]:
+    work = [(str(REPO_ROOT / key), write) for key in keys]
+    if len(work) < POOL_THRESHOLD or jobs == 1:
+        return [_lint_job(job) for job in work]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_lint_job, work, chunksize=max(1, len(work) // (4 * (jobs or os.cpu_count() or 1)))))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Normalize Luau sources under src/.")
+    parser.add_argument("--check", action="store_true", help="Report files that need fixes without writing.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the lint cache.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count).")
+    args = parser.parse_args(argv)
+
+    cache = {} if args.no_cache else load_cache()
+    fresh: Dict[str, Dict] = {}
+    pending = plan(REPO_ROOT / "src", cache, fresh)
+    cached = len(fresh)
+
     changed_files = []
-    for source in iter_source_files(REPO_ROOT / "src"):
-        if lint_file(source):
-            changed_files.append(source.relative_to(REPO_ROOT))
+    for path, changed, digest in run(pending, not args.check, args.jobs):
+        key = str(Path(path).relative_to(REPO_ROOT))
+        if changed:
+            changed_files.append(key)
+        if not changed or not args.check:
+            stat = os.stat(path)
+            fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": digest}
+
+    if not args.no_cache:
+        save_cache(fresh)
 
     if not changed_files:
-        print("No files required lint fixes.")
-    else:
-        print("Linted files:")
-        for path in changed_files:
-            print(f" - {path}")
+        print(f"No files required lint fixes. ({len(pending)} checked, {cached} cached)")
+        return 0
+
+    print("Files needing lint fixes:" if args.check else "Linted files:")
+    for path in sorted(changed_files):
+        print(f" - {path}")
+    return 1 if args.check else 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
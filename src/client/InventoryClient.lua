@@ -3,6 +3,8 @@ local RunService = game:GetService("RunService")
 local Players = game:GetService("Players")
 local ReplicatedStorage = game:GetService("ReplicatedStorage")
 
+local InventoryStateStore = require(script.Parent:WaitForChild("inventory")).StateStore
+
 local InventoryClient = {}
 InventoryClient.__index = InventoryClient
 InventoryClient.MAX_SLOTS = 20  -- Constant for maximum inventory slots
@@ -30,7 +32,7 @@ function InventoryClient.new()
 
     self.inventoryRemote = ReplicatedStorage:WaitForChild("InventoryEvent")
 
-    self.displayItems = self.itemDataFetcher.getDisplayItemMap()
+    self.displayItems = self.itemDataFetcher.peekDisplayItemMap()
 
     self.inventoryGui = nil
     self.inventoryFrame = nil
@@ -42,6 +44,8 @@ function InventoryClient.new()
     self.maxSlots = 10  -- Start with level 1 (10 slots)
     self.inventoryLevel = 1  -- Track inventory level
     self.slotState = {}
+    self.stateStore = InventoryStateStore.new()  -- Tracks the server sync version
+    self.resyncPending = false  -- Set while a requested full sync is on its way
     self.drag = nil
     self.pendingData = nil
 
@@ -95,8 +99,9 @@ function InventoryClient:updateItemIcon(icon, itemDefinition)
         icon.ScaleType = Enum.ScaleType.Fit
     end
 
-    -- Apply sprite
-    local success = self.spriteConfig.applySprite(icon, itemDefinition.spriteIndex)
+    -- Apply sprite (precomputed rect by id, grid index as the fallback)
+    local success = self.spriteConfig.applyItemIcon(icon, itemDefinition.id)
+        or self.spriteConfig.applySprite(icon, itemDefinition.spriteIndex)
     if not success then
         -- If sprite application failed, clear the icon
         icon.Image = ""
@@ -557,6 +562,38 @@ function InventoryClient:populateFromServer(payload)
     print("[POPULATE DEBUG] ✅ Population complete. Level", inventoryLevel, "with", maxSlots, "slots refreshed.", wasDragging and "(drag in progress)" or "")
 end
 
+-- Apply an "InventoryDelta": only the slots it lists are updated and redrawn.
+function InventoryClient:applyInventoryDelta(delta)
+    local changes = (delta and delta.changes) or {}
+
+    if not self.inventoryItems or not self.slotTemplate then
+        -- GUI not built yet: keep the stored full payload current instead
+        local pending = self.pendingData
+        if pending and pending.slots then
+            for _, change in ipairs(changes) do
+                pending.slots[tostring(change.index)] = nil
+                pending.slots[change.index] = { itemId = change.itemId, count = change.count }
+            end
+        end
+        return
+    end
+
+    for _, change in ipairs(changes) do
+        local index = change.index
+        if type(index) == "number" and index >= 1 and index <= self.maxSlots then
+            if change.itemId and change.itemId ~= "" and change.count and change.count > 0 then
+                self.slotState[index] = {
+                    itemId = change.itemId,
+                    count = change.count,
+                }
+            else
+                self.slotState[index] = nil
+            end
+            self:refreshSlot(index)
+        end
+    end
+end
+
 function InventoryClient:requestInventory()
     if self.inventoryRemote then
         self.inventoryRemote:FireServer("RequestInventory")
@@ -566,7 +603,21 @@ end
 function InventoryClient:setupRemoteHandling()
     self:trackConnection(self.inventoryRemote.OnClientEvent:Connect(function(action, data)
         if action == "SyncInventory" then
+            self.resyncPending = false
+            self.stateStore:applySync(data)
             self:populateFromServer(data)
+        elseif action == "InventoryDelta" then
+            if self.resyncPending then
+                -- The full snapshot on its way supersedes this delta
+                return
+            end
+            if self.stateStore:applyDelta(data) then
+                self:applyInventoryDelta(data)
+            else
+                -- Missed an update; ask for a full snapshot once and wait for it
+                self.resyncPending = true
+                self:requestInventory()
+            end
         end
     end))
 
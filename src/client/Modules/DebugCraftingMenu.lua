@@ -63,17 +63,8 @@ function CraftingMenu:Init(parent)
 end
 
 function CraftingMenu:loadRecipes()
-    self.allRecipes = self.itemDataFetcher.getCraftableItems() or {}
-    
-    -- Sort by station type, then by name
-    table.sort(self.allRecipes, function(a, b)
-        local stationA = a.station or "workbench"
-        local stationB = b.station or "workbench"
-        if stationA ~= stationB then
-            return stationA < stationB
-        end
-        return (a.name or a.id) < (b.name or b.id)
-    end)
+    -- Shared, pre-sorted by station type, then by name
+    self.allRecipes = self.itemDataFetcher.peekCraftableItemsByStation() or {}
 end
 
 function CraftingMenu:getStationIcon(stationType)
@@ -371,7 +362,7 @@ function CraftingMenu:createRecipeListItem(recipe, index)
     icon.Parent = iconFrame
     
     -- Try DIY icon first, fall back to item sprite
-    local itemData = self.itemDataFetcher.getItem(recipe.id or recipe.itemId)
+    local itemData = self.itemDataFetcher.peekItem(recipe.id or recipe.itemId)
     local spriteIndex = itemData and itemData.spriteIndex or (recipe.result and recipe.result.spriteIndex)
     local success = false
     if recipe.diyIconIndex then
@@ -513,7 +504,7 @@ function CraftingMenu:showRecipePreview(recipe, selectedListItem)
     icon.Parent = iconFrame
     
     -- Apply DIY icon or item sprite
-    local itemData = self.itemDataFetcher.getItem(recipe.id or recipe.itemId)
+    local itemData = self.itemDataFetcher.peekItem(recipe.id or recipe.itemId)
     local spriteIndex = itemData and itemData.spriteIndex or (recipe.result and recipe.result.spriteIndex)
     local success = false
     if recipe.diyIconIndex then
@@ -569,7 +560,7 @@ function CraftingMenu:showRecipePreview(recipe, selectedListItem)
     -- Materials list (properly aligned)
     if recipe.materials and #recipe.materials > 0 then
         for _, mat in ipairs(recipe.materials) do
-            local matItem = self.itemDataFetcher.getItem(mat.itemId)
+            local matItem = self.itemDataFetcher.peekItem(mat.itemId)
             if matItem then
                 -- Material row container
                 local matRow = Instance.new("Frame")
@@ -743,7 +734,7 @@ function CraftingMenu:createRecipeCard(recipe, index)
     stationPadding.Parent = stationLabel
     
     -- Result item icon in center - properly sized
-    local itemData = self.itemDataFetcher.getItem(recipe.id or recipe.itemId)
+    local itemData = self.itemDataFetcher.peekItem(recipe.id or recipe.itemId)
     local spriteIndex = itemData and itemData.spriteIndex or (recipe.result and recipe.result.spriteIndex)
     if spriteIndex or recipe.diyIconIndex then
         local iconFrame = Instance.new("Frame")
@@ -854,7 +845,7 @@ function CraftingMenu:createRecipeCard(recipe, index)
     
     if recipe.materials and #recipe.materials > 0 then
         for _, mat in ipairs(recipe.materials) do
-            local matItem = self.itemDataFetcher.getItem(mat.itemId)
+            local matItem = self.itemDataFetcher.peekItem(mat.itemId)
             if matItem then
                 -- Clickable material button - smaller size
                 local matButton = Instance.new("TextButton")
@@ -908,7 +899,7 @@ function CraftingMenu:createRecipeCard(recipe, index)
                 -- Click handler: navigate to recipe if it exists
                 matButton.MouseButton1Click:Connect(function()
                     -- Check if this material has a recipe
-                    local materialRecipe = selfRef.itemDataFetcher.getCraftingRecipe(mat.itemId)
+                    local materialRecipe = selfRef.itemDataFetcher.peekCraftingRecipe(mat.itemId)
                     if materialRecipe then
                         -- Scroll to and highlight the recipe
                         print("[DebugCraftingMenu] Material", mat.itemId, "has recipe, scrolling...")
@@ -86,7 +86,7 @@ function ItemBrowser:Hide()
 end
 
 function ItemBrowser:loadAllItems()
-    local allItems = self.itemDataFetcher.getAllItems()
+    local allItems = self.itemDataFetcher.peekAllItems()
     
     -- Create a map of items by spriteIndex and also by id for quick lookup
     local itemsBySpriteIndex = {}
@@ -323,7 +323,8 @@ function ItemBrowser:createItemButton(item)
         spriteImage.ZIndex = 6
 
         -- Use the SpriteConfig to apply the sprite properly
-        local success = self.spriteConfig.applySprite(spriteImage, item.spriteIndex)
+        local success = self.spriteConfig.applyItemIcon(spriteImage, item.id)
+            or self.spriteConfig.applySprite(spriteImage, item.spriteIndex)
         if not success then
             -- Clear sprite if application failed
             spriteImage.Image = ""
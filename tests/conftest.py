@@ -0,0 +1,41 @@
+"""
+Shared fixtures for the tests.
+
+Luau modules that avoid Luau-only syntax are run under lupa with the same
+stand-ins the benchmark harnesses in benchmarks/ use, so the tests and the
+benchmarks drive the exact sources that ship.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+
+@pytest.fixture
+def lua():
+    """A fresh Lua runtime with a `warn` that records its messages in `warnings`."""
+    lupa = pytest.importorskip("lupa")
+    runtime = lupa.LuaRuntime()
+    runtime.execute("""
+        warnings = {}
+        warn = function(...)
+            local parts = {}
+            for index = 1, select("#", ...) do
+                parts[index] = tostring((select(index, ...)))
+            end
+            table.insert(warnings, table.concat(parts, " "))
+        end
+    """)
+    return runtime
+
+
+@pytest.fixture
+def load(lua):
+    """Run a source file (path relative to the repo root) and return what it returns."""
+    def load(relative: str):
+        return lua.execute((ROOT / relative).read_text(encoding="utf-8"))
+    return load
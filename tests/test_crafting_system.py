@@ -0,0 +1,245 @@
+"""CraftingSystem (src/shared/CraftingSystem.luau) under lupa."""
+
+import pytest
+
+# Stand-ins for the Roblox globals the module touches: a hand-driven clock,
+# task.delay/task.cancel timers that only fire from advance(), a Players
+# service whose signals can be fired, and an ItemDataFetcher with fixed recipes.
+SETUP = """
+local state = { now = 0, timers = {}, recipes = {} }
+
+typeof = type
+require = function(module)
+    return module
+end
+
+task = {
+    delay = function(seconds, callback)
+        local timer = { at = state.now + seconds, callback = callback }
+        state.timers[timer] = true
+        return timer
+    end,
+    cancel = function(timer)
+        state.timers[timer] = nil
+    end,
+}
+
+local function signal()
+    local handlers = {}
+    return {
+        Connect = function(_, handler)
+            table.insert(handlers, handler)
+        end,
+        Fire = function(_, ...)
+            for _, handler in ipairs(handlers) do
+                handler(...)
+            end
+        end,
+    }
+end
+local Players = { PlayerAdded = signal(), PlayerRemoving = signal() }
+function Players:GetPlayers()
+    return {}
+end
+game = { GetService = function()
+    return Players
+end }
+
+script = { Parent = { ItemDataFetcher = {
+    peekCraftingRecipe = function(itemId)
+        return state.recipes[itemId]
+    end,
+    peekCraftableItems = function()
+        return {}
+    end,
+} } }
+
+-- Fire every timer due by `to`, earliest first, with the clock at its due time.
+function state.advance(to)
+    while true do
+        local due = nil
+        for timer in pairs(state.timers) do
+            if timer.at <= to and (not due or timer.at < due.at) then
+                due = timer
+            end
+        end
+        if not due then
+            break
+        end
+        state.timers[due] = nil
+        state.now = due.at
+        due.callback()
+    end
+    state.now = to
+end
+
+function state.pending()
+    local ats = {}
+    for timer in pairs(state.timers) do
+        table.insert(ats, timer.at)
+    end
+    table.sort(ats)
+    return ats
+end
+
+return state, Players
+"""
+
+
+class Crafting:
+    """CraftingSystem on the stand-ins above, with players created by name."""
+
+    def __init__(self, lua, load, recipes):
+        self.lua = lua
+        self.state, self.Players = lua.execute(SETUP)
+        for item_id, time in recipes.items():
+            self.state.recipes[item_id] = lua.table_from({"station": "workbench", "materials": lua.table(), "time": time})
+        self.granted = []
+        self.players = {}
+        self.module = load("src/shared/CraftingSystem.luau")
+        self.module.configure(lua.table_from({
+            "clock": lambda: self.state.now,
+            "grantItems": lambda player, items: self.granted.append((self.state.now, player.Name, list(items.values()))),
+        }))
+
+    def player(self, name):
+        if name not in self.players:
+            player = self.lua.table_from({"Name": name, "UserId": len(self.players) + 1})
+            self.module.unlockStation(player, "workbench")
+            self.players[name] = player
+        return self.players[name]
+
+    def start(self, name, item_id, quantity=1):
+        return self.module.startCrafting(self.player(name), item_id, quantity)
+
+    def advance(self, to):
+        self.state.advance(to)
+
+    def pending(self):
+        return list(self.state.pending().values())
+
+    def progress(self, name):
+        rows = self.module.getCraftingProgress(self.player(name))
+        return [(row.itemId, row.crafted, row.quantity, row.completed) for row in rows.values()]
+
+
+@pytest.fixture
+def crafting(lua, load):
+    return Crafting(lua, load, {"chair": 6, "axe": 2, "rug": 10})
+
+
+def test_units_are_granted_in_finish_time_order(crafting):
+    crafting.start("A", "rug")
+    crafting.start("B", "chair")
+    crafting.start("C", "axe")
+    crafting.start("A", "axe")
+
+    crafting.advance(20)
+
+    assert crafting.granted == [(2, "C", ["axe"]), (2, "A", ["axe"]), (6, "B", ["chair"]), (10, "A", ["rug"])]
+    assert crafting.pending() == []
+
+
+def test_wake_follows_the_earliest_pending_unit(crafting):
+    crafting.start("A", "rug")
+    assert crafting.pending() == [10]
+
+    crafting.advance(1)
+    crafting.start("B", "axe")
+    assert crafting.pending() == [3]
+
+    crafting.start("B", "chair")
+    assert crafting.pending() == [3]
+
+    crafting.advance(3)
+    assert crafting.granted == [(3, "B", ["axe"])]
+    assert crafting.pending() == [7]
+
+    crafting.advance(10)
+    assert crafting.pending() == []
+
+
+def test_due_units_are_batched_per_player(crafting):
+    crafting.start("A", "axe", 2)
+    crafting.start("A", "axe")
+    crafting.start("B", "axe")
+
+    crafting.advance(4)
+
+    assert crafting.granted == [(2, "A", ["axe", "axe"]), (2, "B", ["axe"]), (4, "A", ["axe"])]
+
+
+def test_flushing_early_grants_nothing_before_it_is_due(crafting):
+    crafting.start("A", "chair")
+
+    crafting.advance(5)
+    crafting.module.processAllCrafting()
+
+    assert crafting.granted == []
+    assert crafting.pending() == [6]
+
+
+def test_jobs_of_players_who_left_are_dropped(crafting):
+    crafting.module.initialize()
+    crafting.start("A", "axe")
+    crafting.start("B", "axe")
+
+    crafting.Players.PlayerRemoving.Fire(crafting.Players.PlayerRemoving, crafting.player("A"))
+    crafting.advance(2)
+
+    assert crafting.granted == [(2, "B", ["axe"])]
+
+
+def test_a_request_is_one_job_granted_unit_by_unit(crafting):
+    crafting.start("A", "chair", 3)
+    assert crafting.progress("A") == [("chair", 0, 3, False)]
+
+    crafting.advance(6)
+    assert crafting.granted == [(6, "A", ["chair"])]
+    assert crafting.progress("A") == [("chair", 1, 3, False)]
+
+    crafting.advance(17)
+    assert crafting.granted == [(6, "A", ["chair"]), (12, "A", ["chair"])]
+    assert crafting.progress("A") == [("chair", 2, 3, False)]
+    assert crafting.pending() == [18]
+
+    crafting.advance(18)
+    assert [items for _, _, items in crafting.granted] == [["chair"]] * 3
+    assert crafting.progress("A") == []
+
+
+def test_progress_has_one_row_per_request(crafting):
+    crafting.start("A", "axe", 2)
+    crafting.start("A", "axe", 2)
+    crafting.start("A", "rug")
+
+    crafting.advance(3)
+    rows = crafting.module.getCraftingProgress(crafting.player("A"))
+
+    assert crafting.progress("A") == [("axe", 1, 2, False), ("axe", 1, 2, False), ("rug", 0, 1, False)]
+    assert rows[1].timeRemaining == 1
+    assert rows[1].progress == pytest.approx(0.75)
+
+
+def test_a_finished_job_leaves_its_siblings_queued(crafting):
+    crafting.start("A", "axe")
+    crafting.start("A", "axe", 3)
+
+    crafting.advance(2)
+    assert crafting.progress("A") == [("axe", 1, 3, False)]
+
+    crafting.advance(6)
+    assert crafting.progress("A") == []
+    assert sum(len(items) for _, _, items in crafting.granted) == 4
+
+
+def test_a_late_pass_grants_every_unit_already_due(crafting):
+    crafting.start("A", "axe", 3)
+    # Lose the wake-up, as if the server stalled past all three finish times.
+    crafting.state.timers = crafting.lua.table()
+
+    crafting.state.now = 7
+    crafting.module.processAllCrafting()
+
+    assert crafting.granted == [(7, "A", ["axe", "axe", "axe"])]
+    assert crafting.progress("A") == []
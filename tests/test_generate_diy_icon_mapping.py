@@ -0,0 +1,66 @@
+"""Registry bookkeeping in tools/generate_diy_icon_mapping.py."""
+
+from generate_diy_icon_mapping import assign_indices, build_mapping, compact_indices
+
+
+def registry(**indices):
+    return {
+        "nextIndex": max(indices.values(), default=0) + 1,
+        "entries": {key: {"index": index, "hash": None} for key, index in indices.items()},
+        "retired": {},
+    }
+
+
+def recipes(*keys):
+    return [{"id": key} for key in keys]
+
+
+def test_retired_cells_are_not_reused_without_compacting():
+    state = registry(a=1, b=2, c=3)
+
+    report = assign_indices(state, recipes("a", "c", "d"), None)
+
+    assert report["retired"] == ["b"]
+    assert report["new"] == ["d"]
+    assert build_mapping(state) == {"a": 1, "c": 3, "d": 4}
+
+
+def test_returning_recipe_gets_its_cell_back():
+    state = registry(a=1, b=2)
+    assign_indices(state, recipes("a"), None)
+
+    report = assign_indices(state, recipes("a", "b"), None)
+
+    assert report["restored"] == ["b"]
+    assert build_mapping(state) == {"a": 1, "b": 2}
+
+
+def test_compact_moves_the_highest_recipes_into_freed_cells():
+    state = registry(a=1, b=2, c=3, d=4, e=5, f=6)
+    state["nextIndex"] = 8
+    assign_indices(state, recipes("a", "c", "e", "f"), None)
+
+    moves = compact_indices(state)
+
+    assert moves == [("f", 6, 2), ("e", 5, 4)]
+    assert build_mapping(state) == {"a": 1, "f": 2, "c": 3, "e": 4}
+    assert state["retired"] == {}
+    assert state["nextIndex"] == 5
+
+
+def test_compact_leaves_a_dense_registry_alone():
+    state = registry(a=1, b=2)
+
+    assert compact_indices(state) == []
+    assert state["nextIndex"] == 3
+
+
+def test_new_recipes_follow_the_compacted_cells():
+    state = registry(a=1, b=2, c=3)
+    assign_indices(state, recipes("a", "c"), None)
+    compact_indices(state)
+
+    report = assign_indices(state, recipes("a", "c", "b"), None)
+
+    assert report["new"] == ["b"]
+    assert build_mapping(state) == {"a": 1, "c": 2, "b": 3}
@@ -0,0 +1,116 @@
+"""InventoryCodec (src/shared/inventory/InventoryCodec.luau) and its Python twin, tools/inventory_codec.py."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from inventory_codec import CodecError, decode_inventory, encode_inventory, migrate
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import fixtures  # noqa: E402
+
+MODULES = ("InventoryConstants", "InventorySchemas", "InventoryAdapters", "InventoryCodec")
+
+STATE = {
+    "slots": {1: {"itemId": "apple", "count": 1}, 2: {"itemId": "wood", "count": 30}, 9: {"itemId": "apple", "count": 99}},
+    "maxSlots": 20,
+    "inventoryLevel": 2,
+}
+
+
+@pytest.fixture
+def codec(lua, load):
+    harness = load("benchmarks/inventory_codec.lua")
+    folder = ROOT / "src" / "shared" / "inventory"
+    return harness.loadCodec(lua.table_from({name: (folder / f"{name}.luau").read_text(encoding="utf-8") for name in MODULES}))
+
+
+def lua_value(lua, value):
+    """JSON-shaped Python value -> Lua table, keeping integer keys as numbers."""
+    if isinstance(value, dict):
+        return lua.table_from({key: lua_value(lua, item) for key, item in value.items()})
+    if isinstance(value, list):
+        return lua.table_from([lua_value(lua, item) for item in value])
+    return value
+
+
+def py_state(state):
+    return {
+        "slots": {index: {"itemId": slot.itemId, "count": slot.count} for index, slot in state.slots.items()},
+        "maxSlots": state.maxSlots,
+        "inventoryLevel": state.inventoryLevel,
+    }
+
+
+def test_python_round_trip():
+    blob = encode_inventory(STATE)
+
+    assert blob.isascii()
+    assert decode_inventory(blob) == STATE
+    assert migrate(blob) == (STATE, "packed")
+
+
+@pytest.mark.parametrize("blob", ["", "zzz", encode_inventory(STATE)[:-1], encode_inventory(STATE) + "A"])
+def test_python_rejects_malformed_blobs(blob):
+    with pytest.raises(CodecError):
+        decode_inventory(blob)
+
+
+def test_python_migrates_every_stored_shape():
+    record = fixtures.stored_inventories(1)[0]
+
+    from_slots, slots_format = migrate(record)
+    from_legacy, legacy_format = migrate(record["legacyPayload"])
+
+    assert (slots_format, legacy_format) == ("slots", "legacy")
+    assert from_slots == from_legacy
+    assert len(from_slots["slots"]) == sum(1 for slot in record["slots"] if slot["itemId"])
+
+
+def test_lua_and_python_encoders_agree(lua, codec):
+    for record in fixtures.stored_inventories(1):
+        state, stored_format = codec.migrate(lua_value(lua, record["legacyPayload"]))
+        expected, _ = migrate(record["legacyPayload"])
+
+        assert stored_format == "legacy"
+        assert py_state(state) == expected
+        assert codec.encode(state) == encode_inventory(expected)
+
+
+def test_lua_decodes_python_blobs(codec):
+    state, stored_format = codec.migrate(encode_inventory(STATE))
+
+    assert stored_format == "packed"
+    assert py_state(state) == STATE
+
+
+@pytest.mark.parametrize("blob", ["", "zzz", encode_inventory(STATE)[:-1], encode_inventory(STATE) + "A"])
+def test_lua_rejects_malformed_blobs(codec, blob):
+    state, reason = codec.decode(blob)
+
+    assert state is None
+    assert isinstance(reason, str)
+
+
+def test_blobs_are_a_fraction_of_the_table_format():
+    records = fixtures.stored_inventories(1)
+    tables = sum(len(json.dumps(record, separators=(",", ":"))) for record in records)
+    blobs = sum(len(json.dumps(encode_inventory(migrate(record)[0]))) for record in records)
+
+    assert blobs * 4 < tables
+
+
+def test_benchmark_json_reader_matches_json_loads(lua, load):
+    harness = load("benchmarks/inventory_codec.lua")
+    record = fixtures.stored_inventories(1)[0]
+    record["legacyPayload"]["note"] = "tab\t\"quoted\" café"
+
+    value, _ = harness.readJson(json.dumps(record), 1)
+
+    assert value.maxSlots == record["maxSlots"]
+    assert value.legacyPayload.note == record["legacyPayload"]["note"]
+    assert [slot.itemId for slot in value.slots.values()] == [slot["itemId"] for slot in record["slots"]]
@@ -0,0 +1,114 @@
+"""InventoryItemIndex (src/server/InventoryItemIndex.luau) under lupa."""
+
+import pytest
+
+
+class Index:
+    """One index over a Lua slot table; Lua methods are called with an explicit self."""
+
+    def __init__(self, lua, load, slots, max_slots=6):
+        self.lua = lua
+        self.max_slots = max_slots
+        self.slots = lua.table_from({index: self.slot(*slot) for index, slot in slots.items()})
+        module = load("src/server/InventoryItemIndex.luau")
+        self.index = module.new(self.slots, max_slots)
+
+    def __getattr__(self, name):
+        method = self.index[name]
+        return lambda *args: method(self.index, *args)
+
+    def slot(self, item_id, count):
+        return self.lua.table_from({"itemId": item_id, "count": count})
+
+    def set(self, index, item_id=None, count=0):
+        self.slots[index] = self.slot(item_id, count) if item_id is not None else None
+        self.refresh(index, self.slots[index])
+
+    def slots_for(self, item_id):
+        return list(self.slotsFor(item_id).values())
+
+    def check(self):
+        # lupa returns a lone `true` as a bool and `false, message` as a tuple.
+        result = self.validate(self.slots, self.max_slots)
+        return result if isinstance(result, tuple) else (result,)
+
+
+@pytest.fixture
+def make(lua, load):
+    return lambda slots, max_slots=6: Index(lua, load, slots, max_slots)
+
+
+def test_new_indexes_slots_in_order(make):
+    index = make({5: ("wood", 2), 1: ("wood", 3), 2: ("apple", 1), 3: ("", 4), 4: ("stone", 0)})
+
+    assert index.total("wood") == 5
+    assert index.total("apple") == 1
+    assert index.total("stone") == 0
+    assert index.slots_for("wood") == [1, 5]
+    assert index.slots_for("missing") == []
+    assert index.check() == (True,)
+
+
+def test_refresh_moves_a_slot_between_items(make):
+    index = make({1: ("wood", 3), 2: ("apple", 1), 3: ("wood", 4)})
+
+    index.set(3, "apple", 2)
+    assert (index.total("wood"), index.total("apple")) == (3, 3)
+    assert index.slots_for("apple") == [2, 3]
+
+    index.set(1)
+    index.set(1)
+    assert index.total("wood") == 0
+    assert index.slots_for("wood") == []
+    assert index.check() == (True,)
+
+
+def test_rebuild_forgets_the_old_slots(lua, make):
+    index = make({1: ("wood", 3)})
+
+    index.slots = lua.table_from({2: index.slot("apple", 6)})
+    index.rebuild(index.slots, index.max_slots)
+
+    assert index.total("wood") == 0
+    assert index.slots_for("apple") == [2]
+    assert index.check() == (True,)
+
+
+@pytest.mark.parametrize("corrupt, message", [
+    (lambda index: setattr(index.slots[1], "count", 9), "slot 1 indexed with count 3 but holds 9"),
+    (lambda index: setattr(index.slots[1], "itemId", "apple"), "slot 1 indexed as wood but holds apple"),
+    (lambda index: index.slots.__setitem__(4, index.slot("stone", 1)), "slot 4 indexed as nil but holds stone"),
+    (lambda index: index.index.totals.__setitem__("wood", 1), "total for wood is 1, slots hold 7"),
+    (lambda index: index.index.slotsByItem.wood.__setitem__(1, 3), "slot list for wood is out of order or stale"),
+])
+def test_validate_reports_the_first_mismatch(make, corrupt, message):
+    index = make({1: ("wood", 3), 3: ("wood", 4)})
+
+    corrupt(index)
+
+    assert index.check() == (False, message)
+
+
+def test_validate_reports_items_missing_from_the_index(make):
+    index = make({1: ("wood", 3)})
+
+    index.index.slotItems[2] = "apple"
+    index.index.slotCounts[2] = 1
+    index.slots[2] = index.slot("apple", 1)
+
+    assert index.check() == (False, "apple is missing from the index")
+
+
+@pytest.mark.parametrize("seed", [5, 17, 123])
+def test_crafting_matches_the_slot_scans(load, seed):
+    harness = load("benchmarks/item_index.lua")
+    module = load("src/server/InventoryItemIndex.luau")
+    workload = harness.prepare(40, 12, 5, 500, seed)
+
+    crafted, checksum, slots, index = harness.scenario(module, workload)
+    legacy_crafted, legacy_checksum, _, _ = harness.scenario(None, workload)
+
+    assert crafted > 0
+    assert (crafted, checksum) == (legacy_crafted, legacy_checksum)
+    assert index.validate(index, slots, 40) is True
+    assert harness.scenario(module, workload)[:2] == (crafted, checksum)
@@ -0,0 +1,161 @@
+"""InventorySaveScheduler (src/server/InventorySaveScheduler.luau) under lupa."""
+
+import pytest
+
+# A hand-driven clock, a recording save callback and a Heartbeat stand-in.
+SETUP = """
+local Scheduler, options, phases = ...
+local state = { now = 0, saved = {}, failing = {}, connected = false }
+local nextPhase = 0
+options.clock = function()
+    return state.now
+end
+options.random = function()
+    nextPhase = nextPhase + 1
+    return phases[nextPhase] or 0
+end
+options.heartbeat = {
+    Connect = function()
+        state.connected = true
+        return { Disconnect = function()
+            state.connected = false
+        end }
+    end,
+}
+options.players = { GetPlayers = function()
+    return {}
+end }
+options.save = function(context, key)
+    if state.failing[key] then
+        return false
+    end
+    table.insert(state.saved, key .. "@" .. state.now .. ":" .. context.version)
+    return true
+end
+return Scheduler.new(options), state
+"""
+
+
+class Scheduler:
+    """One scheduler on the stand-ins above; Lua methods are called with an explicit self."""
+
+    def __init__(self, lua, load, phases=(), **options):
+        load("benchmarks/autosave.lua")  # installs the task.spawn / task.wait stand-ins
+        module = load("src/server/InventorySaveScheduler.luau")
+        self.lua = lua
+        self.scheduler, self.state = lua.execute(SETUP, module, lua.table_from(options), lua.table_from(list(phases)))
+        self.contexts = {}
+
+    def __getattr__(self, name):
+        method = self.scheduler[name]
+        return lambda *args: method(self.scheduler, *args)
+
+    def track(self, key):
+        self.contexts[key] = self.lua.table_from({"version": 0})
+        self.scheduler.track(self.scheduler, key, self.contexts[key])
+
+    def change(self, key):
+        self.contexts[key].version += 1
+        self.markDirty(key)
+
+    def at(self, now):
+        self.state.now = now
+        return self.step()
+
+    def saved(self):
+        return list(self.state.saved.values())
+
+
+@pytest.fixture
+def make(lua, load):
+    return lambda phases=(), **options: Scheduler(lua, load, phases, **options)
+
+
+def test_saves_only_dirty_inventories_once_per_turn(make):
+    saver = make(interval=30)
+    saver.track("a")
+    saver.track("b")
+    saver.change("a")
+    saver.change("a")
+
+    assert saver.at(0) == 1
+    assert saver.saved() == ["a@0:2"]
+    assert not saver.isDirty("a")
+
+    saver.change("a")
+    assert saver.at(29) == 0
+    assert saver.at(30) == 1
+    assert saver.saved() == ["a@0:2", "a@30:3"]
+
+
+def test_turns_are_staggered_across_the_interval(make):
+    saver = make(phases=(0.1, 0.5, 0.9), interval=30)
+    for key in ("a", "b", "c"):
+        saver.track(key)
+        saver.change(key)
+
+    assert saver.at(2) == 0
+    assert saver.at(3) == 1
+    assert saver.at(15) == 1
+    assert saver.at(27) == 1
+    assert saver.saved() == ["a@3:1", "b@15:1", "c@27:1"]
+
+
+def test_budget_postpones_saves_instead_of_dropping_them(make):
+    # 6 requests a minute with a 10 s burst: one token, then one every 10 s.
+    saver = make(interval=30, requestsPerMinute=6)
+    for key in ("a", "b", "c"):
+        saver.track(key)
+        saver.change(key)
+
+    assert saver.at(0) == 1
+    assert saver.at(5) == 0
+    assert saver.at(10) == 1
+    assert saver.at(20) == 1
+    assert [entry.split("@")[1] for entry in saver.saved()] == ["0:1", "10:1", "20:1"]
+
+
+def test_failed_save_stays_dirty_and_retries(lua, make):
+    saver = make(interval=30)
+    saver.track("a")
+    saver.change("a")
+    saver.state.failing["a"] = True
+
+    assert saver.at(0) == 1
+    assert saver.isDirty("a")
+    assert saver.scheduler.failures == 1
+    assert "Save failed" in lua.globals().warnings[1]
+
+    saver.state.failing["a"] = False
+    assert saver.at(4) == 0
+    assert saver.at(5) == 1
+    assert saver.saved() == ["a@5:1"]
+
+
+def test_flush_saves_immediately_and_untrack_disconnects(make):
+    saver = make(phases=(0.5,), interval=30, requestsPerMinute=1)
+    saver.track("a")
+    assert saver.state.connected
+
+    assert saver.flush("a")
+    assert saver.saved() == []
+    saver.change("a")
+    assert saver.flush("a")
+    assert saver.saved() == ["a@0:1"]
+
+    saver.untrack("a")
+    assert not saver.state.connected
+    assert saver.at(100) == 0
+
+
+def test_session_saves_less_and_never_throttles(load):
+    harness = load("benchmarks/autosave.lua")
+    module = load("src/server/InventorySaveScheduler.luau")
+
+    writes, throttled, peak, persisted = harness.scenario(module, 50, 2, 0.2, 99)()
+    legacy_writes, _, legacy_peak, _ = harness.scenario(None, 50, 2, 0.2, 99)()
+
+    assert throttled == 0
+    assert persisted
+    assert writes < legacy_writes
+    assert peak < legacy_peak
@@ -0,0 +1,141 @@
+"""InventoryStateStore (src/client/inventory/InventoryStateStore.luau) under lupa."""
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+MODULES = ("InventoryConstants", "InventorySchemas", "InventoryAdapters", "InventoryCodec", "InventoryValidation", "init")
+
+
+@pytest.fixture
+def loaded(lua, load):
+    harness = load("benchmarks/state_store.lua")
+    folder = ROOT / "src" / "shared" / "inventory"
+    sources = {name: (folder / f"{name}.luau").read_text(encoding="utf-8") for name in MODULES}
+    # InventoryTypes only declares Luau types, which plain Lua cannot parse.
+    sources["InventoryTypes"] = "return {}"
+    sources["InventoryStateStore"] = (ROOT / "src" / "client" / "inventory" / "InventoryStateStore.luau").read_text(encoding="utf-8")
+    store_class, domain = harness.loadStore(lua.table_from(sources))
+    return harness, store_class, domain
+
+
+class Store:
+    """One store plus a record of its onChanged events; Lua methods are called with an explicit self."""
+
+    def __init__(self, lua, store_class, max_slots=4):
+        self.lua = lua
+        self.store = store_class.new(lua.table_from({"maxSlots": max_slots}))
+        self.events = []
+        self.store.onChanged(self.store, lambda snapshot, changes=None: self.events.append((snapshot, changes)))
+
+    def __getattr__(self, name):
+        method = self.store[name]
+        return lambda *args: method(self.store, *args)
+
+    def put(self, index, item_id, count):
+        self.updateSlot(index, self.lua.table_from({"id": item_id, "count": count}))
+
+    def batch(self, *steps):
+        def run():
+            for step in steps:
+                step()
+        self.store.batch(self.store, run)
+
+    def stacks(self, snapshot=None):
+        snapshot = snapshot or self.store.snapshot
+        return [(slot.stack.id, slot.stack.count) if slot.stack else None for slot in snapshot.slots.values()]
+
+    def changes(self, event=-1):
+        changes = self.events[event][1]
+        return [(change.index, change.itemId, change.count) for change in changes.values()]
+
+
+@pytest.fixture
+def store(lua, loaded):
+    return Store(lua, loaded[1])
+
+
+def test_update_shares_untouched_slots_and_keeps_old_snapshot(lua, store):
+    store.put(1, "apple", 3)
+    before = store.peekSnapshot()
+
+    store.put(2, "wood", 5)
+    after = store.peekSnapshot()
+
+    same = lua.eval("rawequal")
+    assert not same(before, after)
+    assert same(before.slots[1], after.slots[1])
+    assert store.stacks(before) == [("apple", 3), None, None, None]
+    assert store.stacks(after) == [("apple", 3), ("wood", 5), None, None]
+    assert store.changes() == [(2, "wood", 5)]
+
+
+def test_get_snapshot_is_a_private_copy(lua, store):
+    store.put(1, "apple", 3)
+    copy = store.getSnapshot()
+
+    copy.slots[1].stack.count = 99
+    assert not lua.eval("rawequal")(copy.slots[1], store.peekSnapshot().slots[1])
+    assert store.stacks() == [("apple", 3), None, None, None]
+
+
+def test_batch_publishes_once_with_every_change(store):
+    store.batch(
+        lambda: store.put(1, "apple", 1),
+        lambda: store.batch(lambda: store.put(3, "wood", 2)),
+        lambda: store.updateSlot(1, None),
+    )
+
+    assert len(store.events) == 1
+    assert store.changes() == [(1, "apple", 1), (3, "wood", 2), (1, "", 0)]
+    assert store.stacks() == [None, None, ("wood", 2), None]
+
+
+def test_failing_batch_commits_what_it_wrote_and_rethrows(store):
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(Exception, match="boom"):
+        store.batch(lambda: store.put(2, "apple", 1), fail)
+
+    assert len(store.events) == 1
+    assert store.stacks() == [None, ("apple", 1), None, None]
+
+
+def test_out_of_range_updates_are_ignored(store):
+    store.put(5, "apple", 1)
+    store.put(0, "apple", 1)
+
+    assert store.events == []
+
+
+def test_deltas_apply_in_order_only(lua, store):
+    store.applySync(lua.table_from({"version": 3, "maxSlots": 4, "slots": lua.table_from([
+        lua.table_from({"itemId": "apple", "count": 2}),
+        lua.table_from({"itemId": "", "count": 0}),
+    ])}))
+    stale = lua.table_from({"version": 5, "baseVersion": 4, "changes": lua.table()})
+    delta = lua.table_from({"version": 4, "baseVersion": 3, "changes": lua.table_from([
+        lua.table_from({"index": 1, "itemId": "", "count": 0}),
+        lua.table_from({"index": 2, "itemId": "wood", "count": 7}),
+    ])})
+
+    assert store.applyDelta(stale) is False
+    assert store.applyDelta(delta) is True
+    assert store.store.version == 4
+    assert len(store.events) == 2
+    assert store.changes() == [(1, "", 0), (2, "wood", 7)]
+    assert store.stacks() == [None, ("wood", 7), None, None]
+
+
+@pytest.mark.parametrize("seed", [7, 11])
+def test_swaps_match_the_full_copy_store(loaded, seed):
+    harness, store_class, domain = loaded
+
+    events, checksum = harness.scenario(store_class, domain, False, 40, 200, seed)
+    legacy_events, legacy_checksum = harness.scenario(store_class, domain, True, 40, 200, seed)
+
+    assert checksum == legacy_checksum
+    assert events * 2 == legacy_events
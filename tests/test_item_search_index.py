@@ -0,0 +1,94 @@
+"""tools/item_search_index.py and ItemDataFetcher.searchItemIds, which must agree."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from item_search_index import ascii_lower, build_search_index, search
+
+ROOT = Path(__file__).resolve().parents[1]
+
+ITEMS = [
+    {"id": "chair", "name": "Chair"},
+    {"id": "armchair", "name": "Armchair"},
+    {"id": "wooden-chair", "name": "Wooden Chair"},
+    {"id": "chair-set", "name": "Chair Set"},
+    {"id": "cherry", "name": "Cherry"},
+    {"id": "cafe-table", "name": "Café Table"},
+]
+
+
+def test_index_is_sorted_and_ranked_by_name():
+    index = build_search_index(ITEMS)
+
+    assert index["names"] == sorted(index["names"])
+    assert index["tokens"] == sorted(set(index["tokens"]))
+    for postings in list(index["tokenPostings"]) + list(index["trigrams"].values()):
+        assert postings == sorted(set(postings))
+    assert all(gram.isascii() for gram in index["trigrams"])
+
+
+def test_search_orders_exact_prefix_word_then_substring():
+    index = build_search_index(ITEMS)
+
+    assert search(index, "CHAIR") == ["chair", "chair-set", "wooden-chair", "armchair"]
+    assert search(index, "chair", limit=2) == ["chair", "chair-set"]
+
+
+def test_short_queries_match_word_prefixes_only():
+    index = build_search_index(ITEMS)
+
+    assert search(index, "ch") == ["chair", "chair-set", "cherry", "wooden-chair"]
+    assert search(index, "") == []
+
+
+def test_non_ascii_names_match_on_their_ascii_parts():
+    index = build_search_index(ITEMS)
+
+    assert search(index, "café") == ["cafe-table"]
+    assert search(index, "table") == ["cafe-table"]
+
+
+@pytest.fixture
+def fetcher(lua, load):
+    from pack_luau_data import pack_value
+
+    payload = json.loads((ROOT / "data" / "items.json").read_text(encoding="utf-8"))
+    index = build_search_index(payload["items"])
+    harness = load("benchmarks/item_search.lua")
+    modules = lua.table_from({
+        "ItemsData": lua.execute(pack_value(payload)),
+        "ItemSearchIndex": lua.execute(pack_value(index)),
+        "SpriteManifest": lua.table(),
+        "DIYIconIndex": lua.table(),
+        "SpriteUVs": lua.table_from({"aliases": lua.table()}),
+    })
+    source = (ROOT / "src" / "shared" / "ItemDataFetcher.luau").read_text(encoding="utf-8")
+    return harness.loadFetcher(source, modules), index
+
+
+def test_fetcher_matches_reference_search(fetcher):
+    fetcher, index = fetcher
+    queries = {name[:length] for name in index["names"][::7] for length in (1, 2, 3, 5, len(name))}
+    queries |= {"chair", "ZZZ", "-", "the"}
+
+    for query in sorted(queries):
+        assert list(fetcher.searchItemIds(query).values()) == search(index, query), query
+        assert list(fetcher.searchItemIds(query, 3).values()) == search(index, query, 3), query
+
+
+def test_search_items_keeps_substring_matches_in_name_order(fetcher):
+    fetcher, index = fetcher
+    payload = json.loads((ROOT / "data" / "items.json").read_text(encoding="utf-8"))
+    names = [item.get("name") or item["id"] for item in payload["items"]]
+    queries = {"a", "ch", "ir", "e", "chair", "AIR", "ZZZ", "-", "the"}
+
+    for query in sorted(queries):
+        expected = sorted(name for name in names if ascii_lower(query) in ascii_lower(name))
+        found = [record.name or record.id for record in fetcher.searchItems(query).values()]
+        assert found == expected, query
+        assert len(fetcher.searchItems(query, 2)) == min(2, len(expected)), query
+
+    # Short queries match inside words here, unlike the ranked searchItemIds.
+    assert len(fetcher.searchItems("ir")) > len(fetcher.searchItemIds("ir"))
@@ -0,0 +1,152 @@
+"""WorldItemProximity (src/server/WorldItemProximity.luau) under lupa."""
+
+import pytest
+
+# A Heartbeat signal fired by hand and a Players service whose root parts can
+# be moved, in the shape WorldItemProximity.new accepts.
+WORLD = """
+local Vector3 = ...
+local heartbeat = { handlers = {}, connections = 0 }
+function heartbeat:Connect(handler)
+    self.handlers[handler] = true
+    self.connections = self.connections + 1
+    return { Disconnect = function()
+        self.handlers[handler] = nil
+        self.connections = self.connections - 1
+    end }
+end
+function heartbeat:Fire()
+    local handlers = {}
+    for handler in pairs(self.handlers) do
+        table.insert(handlers, handler)
+    end
+    for _, handler in ipairs(handlers) do
+        handler(1 / 60)
+    end
+end
+
+local players = { list = {} }
+function players:GetPlayers()
+    return self.list
+end
+function players:add(name, x, z)
+    local rootPart = { Position = Vector3.new(x, 0, z) }
+    local player = { Name = name, rootPart = rootPart, Character = {
+        FindFirstChild = function(_, child)
+            return child == "HumanoidRootPart" and rootPart or nil
+        end,
+    } }
+    table.insert(self.list, player)
+    return player
+end
+
+local picked = {}
+local function record(player, id)
+    table.insert(picked, id .. ":" .. player.Name)
+end
+return heartbeat, players, picked, record
+"""
+
+
+class World:
+    """One tracker with the stand-ins above; Lua methods are called with an explicit self."""
+
+    def __init__(self, lua, load):
+        harness = load("benchmarks/proximity.lua")
+        module = load("src/server/WorldItemProximity.luau")
+        self.Vector3 = harness.Vector3
+        self.heartbeat, self.players, self.picked, self.record = lua.execute(WORLD, self.Vector3)
+        self.tracker = module.new(lua.table_from({"radius": 8, "players": self.players, "heartbeat": self.heartbeat}))
+
+    def add_player(self, name, x, z):
+        self.players.add(self.players, name, x, z)
+
+    def track(self, id, x, z, callback=None):
+        self.tracker.track(self.tracker, id, self.Vector3.new(x, 0, z), callback or self.record)
+
+    def __getattr__(self, name):
+        method = self.tracker[name]
+        return lambda *args: method(self.tracker, *args)
+
+    def fire(self):
+        self.heartbeat.Fire(self.heartbeat)
+
+    def connections(self):
+        return self.heartbeat.connections
+
+    def pickups(self):
+        return list(self.picked.values())
+
+
+@pytest.fixture
+def world(lua, load):
+    return World(lua, load)
+
+
+def test_picks_up_items_across_cell_edges(world):
+    world.add_player("A", 15.5, 15.5)
+    # Cell size is 16: the first three sit in neighbouring cells, within 8 studs.
+    world.track(1, 16.5, 15.5)
+    world.track(2, 15.5, 16.5)
+    world.track(3, 20, 20)
+    world.track(4, 24, 24)
+
+    assert world.step() == 3
+    assert sorted(world.pickups()) == ["1:A", "2:A", "3:A"]
+    assert world.isTracked(4)
+
+
+def test_first_player_in_order_claims_once(world):
+    world.add_player("A", 0, 0)
+    world.add_player("B", 1, 0)
+    world.track(7, 0.5, 0)
+
+    world.fire()
+    world.fire()
+
+    assert world.pickups() == ["7:A"]
+    assert not world.isTracked(7)
+
+
+def test_heartbeat_connection_follows_tracked_items(world):
+    world.track(1, 0, 0)
+    world.track(2, 100, 0)
+    assert world.connections() == 1
+
+    world.untrack(1)
+    assert world.connections() == 1
+    world.untrack(2)
+    assert world.connections() == 0
+
+
+def test_move_rebuckets_item(world):
+    world.add_player("A", 200, 200)
+    world.track(1, 0, 0)
+    assert world.step() == 0
+
+    world.move(1, world.Vector3.new(195, 0, 203))
+    assert world.step() == 1
+    assert world.pickups() == ["1:A"]
+
+
+def test_failing_callback_is_reported_and_untracked(lua, world):
+    world.add_player("A", 0, 0)
+    world.track(1, 0, 0, lua.eval("function() error('boom') end"))
+    world.track(2, 1, 0)
+
+    assert world.step() == 2
+    assert world.pickups() == ["2:A"]
+    assert not world.isTracked(1)
+    assert "Pickup callback failed" in lua.globals().warnings[1]
+
+
+@pytest.mark.parametrize("seed", [1234, 99, 7])
+def test_matches_per_item_heartbeat_loop(load, seed):
+    harness = load("benchmarks/proximity.lua")
+    module = load("src/server/WorldItemProximity.luau")
+
+    grid = harness.scenario(module, 500, 12, 30, seed)()
+    legacy = harness.scenario(None, 500, 12, 30, seed)()
+
+    assert grid == legacy
+    assert grid[0] > 0
@@ -2,24 +2,15 @@
 """
 Add missing items from ItemsData to SpriteManifest with placeholder sprite indices.
 """
+import json
 import re
-import sys
 
 def extract_items_from_items_data(filepath):
-    """Extract item id and name pairs from ItemsData.luau"""
+    """Extract item id and name pairs from data/items.json (ItemsData.luau is packed)"""
     with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    items = []
-    # Match item entries: { ["id"] = "...", ["name"] = "...", ... }
-    pattern = r'\{[^}]*\[\"id\"\]\s*=\s*\"([^\"]+)\"[^}]*\[\"name\"\]\s*=\s*\"([^\"]+)\"'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
-        item_id = match.group(1)
-        item_name = match.group(2)
-        items.append((item_id, item_name))
+        payload = json.load(f)
     
-    return items
+    return [(item['id'], item['name']) for item in payload.get('items', [])]
 
 def extract_existing_manifest_items(filepath):
     """Extract existing item IDs from SpriteManifest"""
@@ -64,7 +55,7 @@ def convert_id_to_manifest_key(item_id):
     return key
 
 def main():
-    items_data_path = 'src/shared/data/ItemsData.luau'
+    items_data_path = 'data/items.json'
     manifest_path = 'src/shared/SpriteManifest.luau'
     
     print("Loading items from ItemsData...")
@@ -4,12 +4,16 @@ ACNH Sprite Sheet Analyzer
 Analyzes the acnh-item-sprites.png to map out every item and coordinate positions.
 """
 
+import argparse
 import json
 from pathlib import Path
 from PIL import Image
 from typing import Dict, List, Tuple
 import re
 
+from instrumentation import add_profile_arguments, count, profiled, span
+from pack_spritesheet import read_sprite_config
+
 ROOT = Path(__file__).resolve().parents[1]
 SPRITESHEET = ROOT / "acnh-item-sprites.png"
 SPRITEMANIFEST = ROOT / "src" / "shared" / "SpriteManifest.luau"
@@ -20,13 +24,15 @@ OUTPUT_MAPPING = OUTPUT_DIR / "item_mapping.json"
 
 class SpriteSheetAnalyzer:
     def __init__(self):
+        # Grid geometry comes from SpriteConfig.luau (fit it with calibrate_sprites.py).
+        config = read_sprite_config()
         self.sprite_config = {
-            "SHEET_ASSET": "rbxassetid://74324628581851",
-            "COLUMNS": 21,
-            "ROWS": 24,
-            "TILE": 36.6,
-            "INNER": (6, 6),
-            "OUTER": (4, 4),
+            "SHEET_ASSET": config["SHEET_ASSET"],
+            "COLUMNS": int(config["COLUMNS"]),
+            "ROWS": int(config["ROWS"]),
+            "TILE": config["SPRITE_SIZE"],
+            "INNER": (config["PADDING"], config["PADDING"]),
+            "OUTER": (config["OUTER_PADDING_LEFT"], config["OUTER_PADDING_TOP"]),
             "BLEED_FIX": 0.25,
         }
         self.sprite_manifest = {}
@@ -273,18 +279,30 @@ class SpriteSheetAnalyzer:
         print("ACNH Sprite Sheet Analyzer")
         print("=" * 60)
         
-        self.load_sprite_manifest()
-        self.load_nookipedia_data()
-        self.load_items_data()
-        self.analyze_spritesheet()
-        self.generate_statistics()
-        self.save_mapping()
-        self.generate_report()
+        with span("load"):
+            self.load_sprite_manifest()
+            self.load_nookipedia_data()
+            self.load_items_data()
+        with span("transform"):
+            self.analyze_spritesheet()
+            self.generate_statistics()
+        count("sprites", len(self.output))
+        with span("write"):
+            self.save_mapping()
+            self.generate_report()
         
         print("\nAnalysis complete!")
 
 
+@profiled("analyze_spritesheet")
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Map every sprite sheet slot to its manifest entry and item data.")
+    add_profile_arguments(parser)
+    parser.parse_args(argv)
+    SpriteSheetAnalyzer().run()
+    return 0
+
+
 if __name__ == "__main__":
-    analyzer = SpriteSheetAnalyzer()
-    analyzer.run()
+    raise SystemExit(main())
 
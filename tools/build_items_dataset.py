@@ -1,7 +1,13 @@
+import argparse
 import json
 import re
 from pathlib import Path
 
+from instrumentation import add_profile_arguments, count, profiled, span
+from item_search_index import OUTPUT_LUA as OUTPUT_SEARCH_INDEX, build_search_index, to_luau_module as search_index_module
+from items_schema import format_errors, validate_payload
+from pack_luau_data import pack_value
+
 ROOT = Path(__file__).resolve().parents[1]
 SOURCE_PATH = ROOT / "nookipedia_items.json"
 OUTPUT_JSON = ROOT / "data" / "items.json"
@@ -76,10 +82,7 @@ def ensure_output_dirs():
     OUTPUT_LUA.parent.mkdir(parents=True, exist_ok=True)
 
 
-def main():
-    ensure_output_dirs()
-    data = json.loads(SOURCE_PATH.read_text(encoding="utf-8"))
-
+def build_payload(data):
     items = {}
     recipes = []
 
@@ -166,7 +169,7 @@ def main():
     sorted_items = sorted(items.values(), key=lambda item: item["name"].lower())
     recipes.sort(key=lambda recipe: recipe["name"].lower())
 
-    payload = {
+    return {
         "items": sorted_items,
         "recipes": recipes,
         "meta": {
@@ -176,13 +179,48 @@ def main():
         },
     }
 
-    OUTPUT_JSON.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
-    lua_table = ["return {"]
-    for key in ("items", "recipes", "meta"):
-        lua_table.append(f"    {key} = {to_lua(payload[key], 4)},")
-    lua_table.append("}")
-    OUTPUT_LUA.write_text("\n".join(lua_table) + "\n", encoding="utf-8")
+@profiled("build_items_dataset")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build data/items.json, ItemsData.luau and ItemSearchIndex.luau from nookipedia_items.json.")
+    parser.add_argument("--pretty", action="store_true", help="Write ItemsData.luau as a readable table instead of packing it.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    ensure_output_dirs()
+    with span("load"):
+        data = json.loads(SOURCE_PATH.read_text(encoding="utf-8"))
+
+    with span("transform"):
+        payload = build_payload(data)
+        search_index = build_search_index(payload["items"])
+    count("items", len(payload["items"]))
+    count("recipes", len(payload["recipes"]))
+
+    with span("validate"):
+        errors = validate_payload(payload)
+    if errors:
+        print(f"❌ Dataset failed schema validation ({len(errors)} error(s)); nothing written.")
+        for line in format_errors(errors):
+            print(f"  {line}")
+        raise SystemExit(1)
+
+    with span("serialize"):
+        json_text = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+        if args.pretty:
+            lua_table = ["return {"]
+            for key in ("items", "recipes", "meta"):
+                lua_table.append(f"    {key} = {to_lua(payload[key], 4)},")
+            lua_table.append("}")
+            lua_text = "\n".join(lua_table) + "\n"
+        else:
+            lua_text = pack_value(payload)
+        index_text = search_index_module(search_index, args.pretty)
+
+    with span("write"):
+        OUTPUT_JSON.write_text(json_text, encoding="utf-8")
+        OUTPUT_LUA.write_text(lua_text, encoding="utf-8")
+        OUTPUT_SEARCH_INDEX.write_text(index_text, encoding="utf-8")
 
 
 if __name__ == "__main__":
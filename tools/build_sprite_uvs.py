@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed sprite UV table.
+
+Resolves every icon rect once, at build time, from SpriteConfig.luau (grid
+size, padding and outer paddings), SpriteManifest.luau (item sprite indices
+and packed rects) and DIYIconIndex (recipe icon indices). Each rect is rounded
+to whole pixels.
+
+Item ids used by data/items.json are resolved to their manifest key with the
+same fallbacks ItemDataFetcher used at runtime (`_gui` suffix, hyphen and
+underscore swaps), so every alias maps straight to its rect and icon binding
+is a single table read.
+
+Outputs:
+  - src/shared/data/SpriteUVs.luau
+
+Usage:
+    python tools/build_sprite_uvs.py [--check]
+
+Re-run after changing SpriteConfig, SpriteManifest, items.json or the DIY
+mapping; --check exits non-zero when the committed module is stale.
+"""
+
+import argparse
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from instrumentation import add_profile_arguments, count, profiled, span
+from pack_spritesheet import SPRITE_CONFIG, SPRITE_MANIFEST, parse_manifest, read_sprite_config
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_ITEMS = ROOT / "data" / "items.json"
+DIY_MAPPING = Path(__file__).parent / "diy_icon_mapping.json"
+OUTPUT_LUA = ROOT / "src" / "shared" / "data" / "SpriteUVs.luau"
+
+Rect = Tuple[int, int, int, int]
+
+
+def luau_round(value: float) -> int:
+    """math.floor(value + 0.5), as SpriteConfig rounds offsets."""
+    return math.floor(value + 0.5)
+
+
+def grid_rect(index: int, config: Dict[str, object], prefix: str = "") -> Optional[Rect]:
+    """Rect of a 1-based grid cell, or None outside the sheet (as getSpriteRect)."""
+    columns = int(config[f"{prefix}COLUMNS"])
+    rows = int(config[f"{prefix}ROWS"])
+    if index < 1 or index > columns * rows:
+        return None
+
+    size = float(config[f"{prefix}SPRITE_SIZE"])
+    cell = size + float(config[f"{prefix}PADDING"])
+    col = (index - 1) % columns
+    row = (index - 1) // columns
+    x = float(config[f"{prefix}OUTER_PADDING_LEFT"]) + col * cell
+    y = float(config[f"{prefix}OUTER_PADDING_TOP"]) + row * cell
+    return luau_round(x), luau_round(y), luau_round(size), luau_round(size)
+
+
+def id_variants(item_id: str) -> List[str]:
+    """Manifest keys tried for an item id, in ItemDataFetcher's historical order."""
+    underscored = item_id.replace("-", "_")
+    return [item_id, item_id + "_gui", underscored, underscored + "_gui", item_id.replace("_", "-")]
+
+
+def collect_item_ids(payload: Dict) -> List[str]:
+    ids: Dict[str, None] = {}
+    for item in payload.get("items", []):
+        ids[item["id"]] = None
+    for recipe in payload.get("recipes", []):
+        ids[recipe["itemId"]] = None
+        for material in recipe.get("materials", []):
+            ids[material["itemId"]] = None
+    return list(ids)
+
+
+def build_tables(config: Dict[str, object], manifest: Sequence[Dict], item_ids: Iterable[str], diy_mapping: Dict[str, int]):
+    """Return (item rects by manifest key, alias -> manifest key, DIY rects by recipe id)."""
+    items: Dict[str, Rect] = {}
+    for entry in manifest:
+        # Later duplicates win, as they do in the Luau table constructor.
+        rect = entry.get("rect") or grid_rect(entry["spriteIndex"], config)
+        if rect is None:
+            items.pop(entry["key"], None)
+        else:
+            items[entry["key"]] = tuple(rect)
+
+    aliases: Dict[str, str] = {}
+    for item_id in item_ids:
+        if item_id in items:
+            continue
+        for variant in id_variants(item_id):
+            if variant in items:
+                aliases[item_id] = variant
+                break
+
+    diy: Dict[str, Rect] = {}
+    for recipe_id, index in diy_mapping.items():
+        rect = grid_rect(index, config, "DIY_")
+        if rect is not None:
+            diy[recipe_id] = rect
+    return items, aliases, diy
+
+
+def lua_key(key: str) -> str:
+    escaped = key.replace("\\", "\\\\").replace("\"", "\\\"")
+    return f'["{escaped}"]'
+
+
+def to_luau_module(items: Dict[str, Rect], aliases: Dict[str, str], diy: Dict[str, Rect], config: Dict[str, object]) -> str:
+    # Grid icons all share one size; reuse a single Vector2 for each sheet.
+    def sizes(rects: Dict[str, Rect]) -> Dict[Tuple[int, int], str]:
+        counts: Dict[Tuple[int, int], int] = {}
+        for rect in rects.values():
+            counts[rect[2:]] = counts.get(rect[2:], 0) + 1
+        common = max(counts, key=counts.get) if counts else None
+        return {common: f"V({common[0]}, {common[1]})"} if common else {}
+
+    item_size = sizes(items)
+    diy_size = sizes(diy)
+    lines = [
+        "-- Generated by tools/build_sprite_uvs.py. Do not edit by hand.",
+        "-- Icon rects (ImageRectOffset/ImageRectSize in sheet pixels) for every item",
+        "-- id and alias on SHEET_ASSET, and every recipe id on DIY_SHEET_ASSET.",
+        "local V = Vector2.new",
+        "",
+    ]
+    for name, size in (("ITEM_SIZE", item_size), ("DIY_SIZE", diy_size)):
+        if size:
+            lines.append(f"local {name} = {next(iter(size.values()))}")
+    lines.append("")
+
+    def render(table: str, rects: Dict[str, Rect], shared: Dict[Tuple[int, int], str], shared_name: str) -> None:
+        lines.append(f"local {table} = {{")
+        for key, (x, y, w, h) in rects.items():
+            size = shared_name if (w, h) in shared else f"V({w}, {h})"
+            lines.append(f"    {lua_key(key)} = {{ offset = V({x}, {y}), size = {size} }},")
+        lines.append("}")
+        lines.append("")
+
+    render("items", items, item_size, "ITEM_SIZE")
+    render("diy", diy, diy_size, "DIY_SIZE")
+
+    lines.append("-- Item ids that only match a manifest key after the _gui / hyphen / underscore fallbacks.")
+    lines.append("local aliases = {")
+    for alias, key in aliases.items():
+        lines.append(f"    {lua_key(alias)} = {lua_key(key)[1:-1]},")
+    lines.append("}")
+    lines.append("")
+    lines.append("for alias, key in pairs(aliases) do")
+    lines.append("    items[alias] = items[key]")
+    lines.append("end")
+    lines.append("")
+    lines.append("return {")
+    lines.append(f'    SHEET_ASSET = "{config["SHEET_ASSET"]}",')
+    lines.append(f'    DIY_SHEET_ASSET = "{config["DIY_SHEET_ASSET"]}",')
+    lines.append("    items = items,")
+    lines.append("    diy = diy,")
+    lines.append("    aliases = aliases,")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+@profiled("build_sprite_uvs")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute icon rects for every item id, alias and recipe.")
+    parser.add_argument("--check", action="store_true", help="Only report whether SpriteUVs.luau is up to date.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    for path in (SPRITE_CONFIG, SPRITE_MANIFEST, DATA_ITEMS):
+        if not path.exists():
+            print(f"❌ Error: {path} not found")
+            return 1
+
+    with span("load"):
+        config = read_sprite_config()
+        manifest = parse_manifest(SPRITE_MANIFEST.read_text(encoding="utf-8"))
+        item_ids = collect_item_ids(json.loads(DATA_ITEMS.read_text(encoding="utf-8")))
+        diy_mapping = json.loads(DIY_MAPPING.read_text(encoding="utf-8")) if DIY_MAPPING.exists() else {}
+
+    with span("transform"):
+        items, aliases, diy = build_tables(config, manifest, item_ids, diy_mapping)
+    count("item_rects", len(items))
+    count("aliases", len(aliases))
+    count("diy_rects", len(diy))
+
+    with span("serialize"):
+        module = to_luau_module(items, aliases, diy, config)
+    unmatched = [item_id for item_id in item_ids if item_id not in items and item_id not in aliases]
+
+    print(f"📋 {len(items)} item rects, {len(aliases)} aliases, {len(diy)} DIY rects")
+    if unmatched:
+        print(f"⚠️  {len(unmatched)} item ids have no sprite (first: {', '.join(unmatched[:5])})")
+
+    current = OUTPUT_LUA.read_text(encoding="utf-8") if OUTPUT_LUA.exists() else None
+    if args.check:
+        if current != module:
+            print(f"❌ {OUTPUT_LUA.name} is out of date; run tools/build_sprite_uvs.py")
+            return 1
+        print(f"✅ {OUTPUT_LUA.name} is up to date")
+        return 0
+
+    with span("write"):
+        OUTPUT_LUA.parent.mkdir(parents=True, exist_ok=True)
+        OUTPUT_LUA.write_text(module, encoding="utf-8")
+    print(f"💾 UV table saved to: {OUTPUT_LUA}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Sprite Grid Calibration
+Fits the SpriteConfig grid geometry (tile size, padding and outer margins)
+to an actual sprite sheet PNG instead of tuning the numbers by eye.
+
+The sheet is reduced to a foreground weight per pixel (alpha, or the
+luminance/colour distance from the border colour for opaque sheets) and
+projected onto each axis. Runs of near-empty columns and rows are the
+gutters between icons; the runs between them are icon spans. Every span
+start/end is then fitted in one least-squares system
+
+    start = origin + k * pitch        end = origin + size + k * pitch
+
+shared by both axes (one tile size and one pitch, separate x/y origins), so
+a few icons with transparent edges cannot skew the result. The fit is
+written to SpriteConfig.luau, which analyze_spritesheet.py and
+build_sprite_uvs.py both read, and the UV table is regenerated.
+
+Usage:
+    python tools/calibrate_sprites.py SHEET.png [--sheet items|diy]
+        [--columns N] [--rows N] [--channel auto|alpha|luma] [--write]
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+import build_sprite_uvs
+from instrumentation import add_profile_arguments, count, profiled, span
+from pack_spritesheet import SHEET_PREFIX, read_sprite_config, update_sprite_config
+
+# A projected column/row counts as gutter below this fraction of the busiest one.
+GUTTER_FRACTION = 0.02
+
+# Fits whose spans miss the grid by more than this (RMS, px) are reported as suspect.
+MAX_RESIDUAL = 1.5
+
+Span = Tuple[int, int]
+
+
+def foreground(image: Image.Image, channel: str = "auto") -> np.ndarray:
+    """Per-pixel foreground weight in [0, 1]."""
+    rgba = np.asarray(image.convert("RGBA"), dtype=np.float32) / 255.0
+    alpha = rgba[..., 3]
+    if channel == "alpha" or (channel == "auto" and alpha.min() < 0.99):
+        return alpha
+
+    border = np.concatenate([rgba[0, :, :3], rgba[-1, :, :3], rgba[:, 0, :3], rgba[:, -1, :3]])
+    background = np.median(border, axis=0)
+    distance = np.abs(rgba[..., :3] - background).max(axis=2)
+    return np.clip(distance * 4.0, 0.0, 1.0)
+
+
+def content_spans(profile: np.ndarray) -> List[Span]:
+    """[start, end) runs where the projected profile rises above the gutter level."""
+    busy = profile > GUTTER_FRACTION * profile.max()
+    edges = np.flatnonzero(np.diff(np.concatenate([[False], busy, [False]]).astype(np.int8)))
+    return [(int(start), int(end)) for start, end in zip(edges[::2], edges[1::2])]
+
+
+def merge_spans(spans: List[Span], count: int) -> List[Span]:
+    """Join spans split by transparent gaps inside icons until at most `count` remain."""
+    spans = list(spans)
+    while len(spans) > count:
+        gaps = [spans[i + 1][0] - spans[i][1] for i in range(len(spans) - 1)]
+        i = int(np.argmin(gaps))
+        spans[i:i + 2] = [(spans[i][0], spans[i + 1][1])]
+    return spans
+
+
+def initial_indices(spans: List[Span], count: int) -> np.ndarray:
+    centers = np.array([(start + end) / 2 for start, end in spans])
+    if len(spans) == count or len(spans) < 2:
+        return np.arange(len(spans))
+    pitch = (centers[-1] - centers[0]) / (count - 1)
+    return np.rint((centers - centers[0]) / pitch).astype(int)
+
+
+def fit_grid(x_spans: List[Span], y_spans: List[Span], columns: int, rows: int) -> Dict[str, float]:
+    """Least-squares grid fit; returns origin_x/origin_y/size/pitch and the RMS residual."""
+    kx = initial_indices(x_spans, columns)
+    ky = initial_indices(y_spans, rows)
+    for _ in range(3):
+        design, target = [], []
+        for axis, (spans, indices) in enumerate(((x_spans, kx), (y_spans, ky))):
+            for (start, end), k in zip(spans, indices):
+                origin = [1.0, 0.0] if axis == 0 else [0.0, 1.0]
+                design.append(origin + [0.0, float(k)])
+                target.append(start)
+                design.append(origin + [1.0, float(k)])
+                target.append(end)
+        a, b = np.array(design), np.array(target, dtype=np.float64)
+        solution, *_ = np.linalg.lstsq(a, b, rcond=None)
+        x0, y0, size, pitch = solution
+
+        # Re-assign spans to their nearest cell with the refined pitch (handles empty cells).
+        kx = np.clip(np.rint([((s + e) / 2 - x0 - size / 2) / pitch for s, e in x_spans]), 0, columns - 1).astype(int)
+        ky = np.clip(np.rint([((s + e) / 2 - y0 - size / 2) / pitch for s, e in y_spans]), 0, rows - 1).astype(int)
+
+    residual = float(np.sqrt(np.mean((a @ solution - b) ** 2)))
+    return {"origin_x": float(x0), "origin_y": float(y0), "size": float(size), "pitch": float(pitch), "residual": residual}
+
+
+def calibrate(image: Image.Image, columns: int, rows: int, channel: str = "auto") -> Dict[str, float]:
+    with span("parse"):
+        weights = foreground(image, channel)
+        x_spans = merge_spans(content_spans(weights.mean(axis=0)), columns)
+        y_spans = merge_spans(content_spans(weights.mean(axis=1)), rows)
+    if len(x_spans) < 2 or len(y_spans) < 2:
+        raise ValueError(f"found {len(x_spans)} column and {len(y_spans)} row spans; need at least 2 of each")
+    count("spans", len(x_spans) + len(y_spans))
+
+    with span("transform"):
+        fit = fit_grid(x_spans, y_spans, columns, rows)
+    width, height = image.size
+    padding = fit["pitch"] - fit["size"]
+    fit.update({
+        "padding": padding,
+        "right": width - fit["origin_x"] - columns * fit["pitch"] + padding,
+        "bottom": height - fit["origin_y"] - rows * fit["pitch"] + padding,
+        "column_spans": len(x_spans),
+        "row_spans": len(y_spans),
+    })
+    return fit
+
+
+def config_values(fit: Dict[str, float], prefix: str) -> Dict[str, object]:
+    def tidy(value: float) -> float:
+        return round(value, 4)
+
+    return {
+        f"{prefix}SPRITE_SIZE": tidy(fit["size"]),
+        f"{prefix}PADDING": tidy(fit["padding"]),
+        f"{prefix}OUTER_PADDING_LEFT": tidy(fit["origin_x"]),
+        f"{prefix}OUTER_PADDING_RIGHT": tidy(fit["right"]),
+        f"{prefix}OUTER_PADDING_TOP": tidy(fit["origin_y"]),
+        f"{prefix}OUTER_PADDING_BOTTOM": tidy(fit["bottom"]),
+    }
+
+
+@profiled("calibrate_sprites")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fit SpriteConfig tile size, padding and margins to a sprite sheet PNG.")
+    parser.add_argument("sheet_png", type=Path, help="Sprite sheet image to calibrate against.")
+    parser.add_argument("--sheet", choices=sorted(SHEET_PREFIX), default="items", help="Which SpriteConfig sheet to calibrate.")
+    parser.add_argument("--columns", type=int, default=None, help="Grid columns (default: from SpriteConfig).")
+    parser.add_argument("--rows", type=int, default=None, help="Grid rows (default: from SpriteConfig).")
+    parser.add_argument("--channel", choices=("auto", "alpha", "luma"), default="auto", help="Foreground signal (auto: alpha when the sheet has transparency).")
+    parser.add_argument("--write", action="store_true", help="Write the fit to SpriteConfig.luau and rebuild SpriteUVs.luau.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not args.sheet_png.exists():
+        print(f"❌ Error: {args.sheet_png} not found")
+        return 1
+
+    prefix = SHEET_PREFIX[args.sheet]
+    config = read_sprite_config()
+    columns = args.columns or int(config[f"{prefix}COLUMNS"])
+    rows = args.rows or int(config[f"{prefix}ROWS"])
+
+    with Image.open(args.sheet_png) as image:
+        with span("load"):
+            image.load()
+        print(f"📋 {args.sheet_png.name}: {image.size[0]}×{image.size[1]}px, {columns}×{rows} grid")
+        try:
+            fit = calibrate(image, columns, rows, args.channel)
+        except ValueError as exc:
+            print(f"❌ Calibration failed: {exc}")
+            return 1
+
+    print(f"   Detected {fit['column_spans']} icon columns and {fit['row_spans']} icon rows")
+    print(f"   RMS residual: {fit['residual']:.3f}px")
+    values = config_values(fit, prefix)
+    print(f"\n{'Constant':<28} {'Current':>10} {'Fitted':>10}")
+    for key, value in values.items():
+        current = config.get(key)
+        print(f"{key:<28} {current if current is not None else '-':>10} {value:>10}")
+
+    if fit["residual"] > MAX_RESIDUAL:
+        print(f"\n⚠️  Spans miss the fitted grid by {fit['residual']:.2f}px RMS; check --columns/--rows and --channel before writing.")
+
+    if not args.write:
+        print("\nDry run: re-run with --write to update SpriteConfig.luau")
+        return 0
+
+    with span("write"):
+        update_sprite_config(values)
+    print("\n💾 SpriteConfig.luau updated")
+    with span("build_sprite_uvs"):
+        return build_sprite_uvs.main([])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
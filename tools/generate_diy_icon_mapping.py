@@ -1,56 +1,264 @@
 #!/usr/bin/env python3
 """
 Generate DIY Icon Mapping Reference
-Shows which recipe ID maps to which DIY icon index (1-80)
+Assigns every recipe a stable DIY icon index (1-598) on the 26×23 DIY sheet.
+
+Indices come from a persistent, append-only registry keyed by recipe id
+(tools/diy_icon_registry.json) instead of the recipe's position in
+data/items.json, so re-sorting or adding recipes never shifts existing icons.
+An index is never handed to a second recipe: recipes that disappear are moved
+to the registry's "retired" table with their index, and get that same index
+back if they return. New recipes always take the next unused index, so art
+already uploaded to a cell can never end up labelled as a different recipe.
+
+Retired cells are only reclaimed on request: --compact moves the live recipes
+with the highest indices down into the retired (or otherwise unused) cells,
+forgets the retired recipes, and lists the moved recipes, whose art has to be
+re-uploaded to its new cell.
+
+Outputs:
+  - tools/diy_icon_mapping.json            (recipe id -> index)
+  - src/shared/data/DIYIconIndex.luau      (same mapping as a Luau lookup)
+
+Usage:
+    python tools/generate_diy_icon_mapping.py [--icons DIR] [--force] [--compact]
+
+With --icons, DIR/<recipe-id>.png is hashed so changed artwork is reported
+for re-upload alongside genuinely new recipes.
 """
 
+import argparse
+import hashlib
 import json
-import sys
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from instrumentation import add_profile_arguments, count, profiled, span
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_ITEMS = ROOT / "data" / "items.json"
+REGISTRY_PATH = Path(__file__).parent / "diy_icon_registry.json"
+OUTPUT_JSON = Path(__file__).parent / "diy_icon_mapping.json"
+OUTPUT_LUA = ROOT / "src" / "shared" / "data" / "DIYIconIndex.luau"
+
+REGISTRY_VERSION = 2
+DIY_COLUMNS = 26
+DIY_ROWS = 23
+DIY_CAPACITY = DIY_COLUMNS * DIY_ROWS
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def recipe_digest(recipe: Dict) -> str:
+    """Content key for a recipe's icon when no artwork file is available."""
+    identity = f"{recipe.get('itemId') or ''}\0{recipe.get('name') or ''}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def recipe_key(recipe: Dict) -> str:
+    return recipe.get('id') or recipe.get('itemId', 'unknown')
+
+
+def load_registry() -> Dict:
+    """Load the registry, seeding it from the legacy positional mapping on first run."""
+    if REGISTRY_PATH.exists():
+        registry = json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
+        registry.setdefault("entries", {})
+        registry.setdefault("retired", {})
+        # Registries written before retirement kept a reusable "free" list;
+        # nextIndex is already past those indices, so dropping it retires them.
+        registry.pop("free", None)
+        return registry
+
+    entries = {}
+    if OUTPUT_JSON.exists():
+        legacy = json.loads(OUTPUT_JSON.read_text(encoding="utf-8"))
+        for key, index in legacy.items():
+            entries[key] = {"index": int(index), "hash": None}
+
+    return {
+        "version": REGISTRY_VERSION,
+        "sourceHash": None,
+        "nextIndex": max((entry["index"] for entry in entries.values()), default=0) + 1,
+        "entries": entries,
+        "retired": {},
+    }
+
+
+def assign_indices(registry: Dict, recipes: Sequence[Dict], icons_dir: Optional[Path]) -> Dict[str, List[str]]:
+    """Update the registry in place for the given recipes and report what changed."""
+    entries = registry["entries"]
+    retired = registry["retired"]
+    live_keys = set()
+    report = {"new": [], "changed": [], "retired": [], "restored": []}
+
+    # Retire recipes that no longer exist; their indices stay reserved.
+    for recipe in recipes:
+        live_keys.add(recipe_key(recipe))
+    for key in sorted(set(entries) - live_keys):
+        retired[key] = entries.pop(key)
+        report["retired"].append(key)
+
+    for recipe in recipes:
+        key = recipe_key(recipe)
+        icon_path = icons_dir / f"{key}.png" if icons_dir else None
+        digest = file_digest(icon_path) if icon_path and icon_path.exists() else recipe_digest(recipe)
+
+        entry = entries.get(key)
+        if entry is None and key in retired:
+            # A returning recipe gets its old cell back; re-upload if the art moved on.
+            entry = entries[key] = retired.pop(key)
+            report["restored"].append(key)
+        if entry is None:
+            index = registry["nextIndex"]
+            registry["nextIndex"] = index + 1
+            if index > DIY_CAPACITY:
+                raise SystemExit(
+                    f"❌ Error: DIY sheet is full ({DIY_CAPACITY} slots); cannot place {key}. "
+                    "Run with --compact to reclaim retired cells."
+                )
+            entries[key] = {"index": index, "hash": digest}
+            report["new"].append(key)
+        elif entry.get("hash") is None:
+            # Entries seeded from the legacy mapping adopt their hash without a re-upload.
+            entry["hash"] = digest
+        elif entry["hash"] != digest:
+            entry["hash"] = digest
+            report["changed"].append(key)
+
+    return report
+
+
+def compact_indices(registry: Dict) -> List[Tuple[str, int, int]]:
+    """Renumber live recipes into freed cells, in place.
+
+    Every cell below nextIndex that no live recipe holds is free, whether a
+    retired recipe left it or not. The live recipe with the highest index
+    moves into the lowest free cell for as long as that is an improvement, so
+    live indices end up as 1..N and as few recipes as possible move. Retired
+    recipes are forgotten, since their cells may now belong to someone else.
+    Returns (recipe id, old index, new index) for every moved recipe.
+    """
+    entries = registry["entries"]
+    taken = {entry["index"] for entry in entries.values()}
+    free = [index for index in range(1, registry["nextIndex"]) if index not in taken]
+    highest = sorted(entries, key=lambda key: entries[key]["index"], reverse=True)
+
+    moves = []
+    for cell, key in zip(free, highest):
+        old = entries[key]["index"]
+        if cell > old:
+            break
+        entries[key]["index"] = cell
+        moves.append((key, old, cell))
+
+    registry["retired"] = {}
+    registry["nextIndex"] = max((entry["index"] for entry in entries.values()), default=0) + 1
+    return moves
+
+
+def build_mapping(registry: Dict) -> Dict[str, int]:
+    ordered = sorted(registry["entries"].items(), key=lambda pair: pair[1]["index"])
+    return {key: entry["index"] for key, entry in ordered}
+
+
+def lua_escape(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("\"", "\\\"")
+    return f'"{escaped}"'
+
+
+def to_luau_module(mapping: Dict[str, int]) -> str:
+    lines = [
+        "-- Generated by tools/generate_diy_icon_mapping.py. Do not edit by hand.",
+        "-- Maps recipe id -> stable DIY icon index on SpriteConfig.DIY_SHEET_ASSET.",
+        "return {",
+    ]
+    for key, index in mapping.items():
+        lines.append(f"    [{lua_escape(key)}] = {index},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+@profiled("generate_diy_icon_mapping")
+def generate_diy_mapping(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Assign stable DIY icon indices to recipes.")
+    parser.add_argument("--icons", type=Path, help="Directory of <recipe-id>.png DIY icons to hash.")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if items.json is unchanged.")
+    parser.add_argument("--compact", action="store_true", help="Move live recipes into retired cells (their icons must be re-uploaded).")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not DATA_ITEMS.exists():
+        print(f"❌ Error: {DATA_ITEMS} not found")
+        return 1
+
+    with span("load"):
+        source_bytes = DATA_ITEMS.read_bytes()
+        source_hash = hashlib.sha1(source_bytes).hexdigest()
+        registry = load_registry()
+
+    outputs_exist = OUTPUT_JSON.exists() and OUTPUT_LUA.exists()
+    if not args.force and not args.icons and not args.compact and outputs_exist and registry.get("sourceHash") == source_hash:
+        print("✅ DIY icon mapping is up to date (items.json unchanged)")
+        return 0
+
+    with span("parse"):
+        recipes = json.loads(source_bytes.decode("utf-8")).get('recipes', [])
+    count("recipes", len(recipes))
+    with span("transform"):
+        report = assign_indices(registry, recipes, args.icons)
+        moves = compact_indices(registry) if args.compact else []
+        registry["sourceHash"] = source_hash
+        registry["version"] = REGISTRY_VERSION
+        mapping = build_mapping(registry)
 
-def generate_diy_mapping():
-    # Load items.json
-    data_path = Path(__file__).parent.parent / "data" / "items.json"
-    
-    if not data_path.exists():
-        print(f"❌ Error: {data_path} not found")
-        return
-    
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    recipes = data.get('recipes', [])
-    
     print(f"📋 DIY Icon Mapping for {len(recipes)} Recipes")
     print("=" * 80)
-    print(f"{'Index':<8} {'Recipe ID':<30} {'Recipe Name':<40}")
+    print(f"{'Index':<8} {'Recipe ID':<30} {'Status':<10}")
     print("-" * 80)
-    
-    # Generate mapping (1-indexed to match Lua)
-    mapping = {}
-    for idx, recipe in enumerate(recipes, start=1):
-        recipe_id = recipe.get('id') or recipe.get('itemId', 'unknown')
-        recipe_name = recipe.get('name', 'Unknown Recipe')
-        mapping[recipe_id] = idx
-        
-        print(f"{idx:<8} {recipe_id:<30} {recipe_name:<40}")
-    
+    new_keys = set(report["new"])
+    changed_keys = set(report["changed"])
+    moved_keys = {key for key, _, _ in moves}
+    for key, index in mapping.items():
+        status = "new" if key in new_keys else "moved" if key in moved_keys else "changed" if key in changed_keys else ""
+        print(f"{index:<8} {key:<30} {status:<10}")
     print("=" * 80)
-    print(f"\n✅ Total: {len(recipes)} recipes mapped to DIY icon indices 1-{len(recipes)}")
+
+    print(f"\n✅ Total: {len(mapping)} recipes mapped into {DIY_CAPACITY} DIY sheet slots")
+    print(f"   New: {len(report['new'])}  Changed art: {len(report['changed'])}  Retired: {len(report['retired'])}  Restored: {len(report['restored'])}")
+    print(f"   Retired indices (kept until --compact): {len(registry['retired'])}  Next index: {registry['nextIndex']}")
+    if args.compact:
+        print(f"   Compacted: {len(moves)} recipe(s) moved into freed cells")
+    uploads = [key for key in report["new"] + report["changed"] if key not in moved_keys]
+    if uploads:
+        print("\n⬆️  Icons to (re-)upload:")
+        for key in uploads:
+            print(f"  - {key} -> {registry['entries'][key]['index']}")
+    if moves:
+        print("\n⬆️  Cells to re-upload after compacting (re-pack with pack_spritesheet.py --sheet diy):")
+        for key, old, new in moves:
+            print(f"  - {key}: {old} -> {new}")
     print(f"\nDIY Spritesheet Info:")
     print(f"  - Asset ID: rbxassetid://97942095241212")
-    print(f"  - Grid: 26 columns × 23 rows = 598 total slots")
-    print(f"  - Sprite size: 300px × 300px")
-    print(f"  - Padding: 10px between sprites")
-    print(f"\n📝 Note: Recipe indices are assigned sequentially based on their order")
-    print(f"         in the data/items.json recipes array.")
-    
-    # Save mapping to JSON for reference
-    output_path = Path(__file__).parent / "diy_icon_mapping.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(mapping, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n💾 Mapping saved to: {output_path}")
+    print(f"  - Grid: {DIY_COLUMNS} columns × {DIY_ROWS} rows = {DIY_CAPACITY} total slots")
+
+    with span("serialize"):
+        registry_text = json.dumps(registry, indent=2, ensure_ascii=False) + "\n"
+        mapping_text = json.dumps(mapping, indent=2, ensure_ascii=False) + "\n"
+        module = to_luau_module(mapping)
+    with span("write"):
+        REGISTRY_PATH.write_text(registry_text, encoding="utf-8")
+        OUTPUT_JSON.write_text(mapping_text, encoding="utf-8")
+        OUTPUT_LUA.parent.mkdir(parents=True, exist_ok=True)
+        OUTPUT_LUA.write_text(module, encoding="utf-8")
+
+    print(f"\n💾 Registry saved to: {REGISTRY_PATH}")
+    print(f"💾 Mapping saved to: {OUTPUT_JSON}")
+    print(f"💾 Luau lookup saved to: {OUTPUT_LUA}")
+    return 0
+
 
 if __name__ == "__main__":
-    generate_diy_mapping()
+    raise SystemExit(generate_diy_mapping())
@@ -0,0 +1,274 @@
+"""
+Shared profiling hooks for the tools.
+
+Tools mark their stages with spans and count the work they do:
+
+    from instrumentation import count, span
+
+    with span("load"):
+        data = json.loads(SOURCE_PATH.read_text(encoding="utf-8"))
+    count("items", len(data["items"]))
+
+Spans nest, cost a single attribute check when profiling is off, and record
+wall time, calls and the process's peak RSS when they close. An entry point
+opts in with `@profiled("tool_name")` on its `main(argv)` and
+`add_profile_arguments(parser)` on its parser, which gives every tool the same
+flags:
+
+    --profile [DIR]            write DIR/<tool>.json and DIR/<tool>.folded
+                               (default DIR: build/profile)
+    --profile-mode MODE        spans (default): stacks are the span tree
+                               sample: a background thread samples the Python
+                                       stack every few ms, under the open spans
+                               cprofile: spans, plus DIR/<tool>.prof for pstats
+                                         or snakeviz
+
+The .folded file is in the collapsed-stack format ("a;b;c weight" per line)
+that flamegraph.pl, speedscope and inferno read. Weights are microseconds
+for spans and sample counts for the sampler. The JSON summary holds the run's
+arguments, exit code, per-span totals, counters and peak RSS, so a slow CI
+run can be diagnosed from its artifacts.
+"""
+
+import argparse
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[1]
+PROFILE_DIR = ROOT / "build" / "profile"
+PROFILE_MODES = ("spans", "sample", "cprofile")
+
+# Sampler period; short enough to see per-stage hot functions in runs of a few seconds.
+SAMPLE_INTERVAL = 0.002
+
+Stack = Tuple[str, ...]
+
+
+def peak_rss_kib() -> Optional[float]:
+    """Peak resident set size of this process so far, in KiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB elsewhere.
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+
+class Profiler:
+    """Collects span timings and counters for one tool run."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.stack: List[str] = []
+        self.totals: Dict[Stack, float] = defaultdict(float)
+        self.calls: Dict[Stack, int] = defaultdict(int)
+        self.peak_rss: Dict[Stack, Optional[float]] = {}
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.samples: Dict[Stack, int] = defaultdict(int)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        self.stack.append(name)
+        path = tuple(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[path] += time.perf_counter() - start
+            self.calls[path] += 1
+            self.peak_rss[path] = peak_rss_kib()
+            self.stack.pop()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def self_times(self) -> Dict[Stack, float]:
+        """Span totals minus the time spent in their child spans."""
+        own = dict(self.totals)
+        for path, total in self.totals.items():
+            if len(path) > 1 and path[:-1] in own:
+                own[path[:-1]] -= total
+        return own
+
+    def folded(self) -> List[str]:
+        """Collapsed stacks: sampled stacks if any were taken, else the span tree in microseconds."""
+        if self.samples:
+            weights = self.samples
+        else:
+            weights = {path: int(round(seconds * 1e6)) for path, seconds in self.self_times().items()}
+        return [f"{';'.join(path)} {weight}" for path, weight in sorted(weights.items()) if weight > 0]
+
+    def summary(self) -> Dict:
+        own = self.self_times()
+        spans = [
+            {
+                "path": "/".join(path),
+                "calls": self.calls[path],
+                "total_s": round(self.totals[path], 6),
+                "self_s": round(own[path], 6),
+                "peak_rss_kib": self.peak_rss.get(path),
+            }
+            for path in sorted(self.totals)
+        ]
+        return {"spans": spans, "counters": dict(self.counters), "peak_rss_kib": peak_rss_kib()}
+
+
+PROFILER = Profiler()
+
+
+class _NullSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """Context manager timing one stage (load, parse, transform, serialize, write, ...)."""
+    if not PROFILER.enabled:
+        return _NULL_SPAN
+    return PROFILER.span(name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    if PROFILER.enabled:
+        PROFILER.count(name, amount)
+
+
+class _Sampler(threading.Thread):
+    """Samples the profiled thread's Python stack, prefixed with its open spans."""
+
+    def __init__(self, profiler: Profiler, target: int) -> None:
+        super().__init__(name="instrumentation-sampler", daemon=True)
+        self.profiler = profiler
+        self.target = target
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self.target)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                frame = frame.f_back
+            # Drop the instrumentation wrappers around main().
+            calls = [name for name in reversed(frames) if not name.startswith(("instrumentation:", "contextlib:"))]
+            self.profiler.samples[tuple(self.profiler.stack) + tuple(calls)] += 1
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", nargs="?", type=Path, const=PROFILE_DIR, default=None, metavar="DIR",
+                       help="Write a JSON timing summary and a collapsed-stack (.folded) file to DIR (default: build/profile).")
+    group.add_argument("--profile-mode", choices=PROFILE_MODES, default="spans",
+                       help="spans: stage timings; sample: sampled Python stacks; cprofile: also write a .prof file.")
+
+
+def _profile_options(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(add_help=False)
+    add_profile_arguments(parser)
+    options, _ = parser.parse_known_args(argv)
+    return options
+
+
+def profiled(tool: str) -> Callable:
+    """Decorate a tool's `main(argv)` so --profile wraps the whole run in a `tool` span."""
+    def decorator(main: Callable[..., Optional[int]]) -> Callable[..., Optional[int]]:
+        @functools.wraps(main)
+        def wrapper(argv: Optional[Sequence[str]] = None) -> Optional[int]:
+            args = list(sys.argv[1:] if argv is None else argv)
+            options = _profile_options(args)
+            if options.profile is None:
+                return main(argv)
+            return _run_profiled(tool, main, argv, args, options)
+        return wrapper
+    return decorator
+
+
+def _run_profiled(tool: str, main: Callable, argv, args: List[str], options: argparse.Namespace):
+    PROFILER.reset()
+    PROFILER.enabled = True
+    sampler = _Sampler(PROFILER, threading.get_ident()) if options.profile_mode == "sample" else None
+    profile = cProfile.Profile() if options.profile_mode == "cprofile" else None
+
+    started = time.perf_counter()
+    result = None
+    status = "error"
+    try:
+        if sampler:
+            sampler.start()
+        if profile:
+            profile.enable()
+        with PROFILER.span(tool):
+            result = main(argv)
+        status = "ok"
+        return result
+    except SystemExit as exc:
+        result = exc.code
+        status = "exit"
+        raise
+    finally:
+        if profile:
+            profile.disable()
+        if sampler:
+            sampler.stop()
+        PROFILER.enabled = False
+        _write_profile(tool, options, args, result, status, time.perf_counter() - started, profile)
+
+
+def _write_profile(tool: str, options: argparse.Namespace, args: List[str], result, status: str, elapsed: float, profile) -> None:
+    directory: Path = options.profile
+    directory.mkdir(parents=True, exist_ok=True)
+    summary = {
+        "tool": tool,
+        "argv": args,
+        "mode": options.profile_mode,
+        "status": status,
+        "exit_code": result if isinstance(result, int) else None,
+        "wall_s": round(elapsed, 6),
+        "pid": os.getpid(),
+        **PROFILER.summary(),
+    }
+    if PROFILER.samples:
+        summary["samples"] = sum(PROFILER.samples.values())
+        summary["sample_interval_s"] = SAMPLE_INTERVAL
+
+    json_path = directory / f"{tool}.json"
+    folded_path = directory / f"{tool}.folded"
+    json_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    folded_path.write_text("\n".join(PROFILER.folded()) + "\n", encoding="utf-8")
+    written = [json_path, folded_path]
+    if profile is not None:
+        prof_path = directory / f"{tool}.prof"
+        profile.dump_stats(str(prof_path))
+        written.append(prof_path)
+
+    print(f"\n⏱️  {tool}: {elapsed:.3f}s; profile written to {', '.join(str(path) for path in written)}")
+    own = PROFILER.self_times()
+    for path in sorted(PROFILER.totals, key=PROFILER.totals.get, reverse=True)[:8]:
+        print(f"   {'/'.join(path):<40} {PROFILER.totals[path] * 1000:>10.1f} ms  (self {own[path] * 1000:.1f} ms, {PROFILER.calls[path]}×)")
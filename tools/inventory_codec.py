@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Reference encoder for the packed inventory format (InventoryCodec.luau).
+
+A blob is a string of unsigned varints written as base64url digits of 5 bits
+each, least significant first, with 32 added to every digit but the last.
+Strings are a varint UTF-8 byte length followed by the bytes:
+
+    version, inventoryLevel, maxSlots,
+    idCount, id * idCount,
+    filledCount, (gap, idIndex, count - 1) * filledCount
+
+`encode_inventory` produces byte-identical output to InventoryCodec.encode,
+and `migrate` reads the same three stored shapes InventoryCodec.migrate does
+(a blob, the { slots, maxSlots, inventoryLevel, legacyPayload } table, or a
+bare legacy { inventory, capacity } payload), so DataStore exports and test
+fixtures can be converted offline.
+
+Usage:
+    python tools/inventory_codec.py INPUT.json [--output PATH] [--decode]
+
+INPUT.json maps DataStore keys to stored values. Without --decode every value
+is migrated and encoded, and the output maps the same keys to blobs; with
+--decode the blobs are decoded back to { slots, maxSlots, inventoryLevel }.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from instrumentation import add_profile_arguments, count, profiled, span
+
+FORMAT_VERSION = 1
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+DIGIT_VALUES = {char: value for value, char in enumerate(ALPHABET)}
+
+# InventoryConstants
+SLOTS_PER_LEVEL = 10
+STARTING_INVENTORY_LEVEL = 1
+DEFAULT_MAX_SLOTS = 20
+
+
+class CodecError(ValueError):
+    """Raised for input that is not a well-formed inventory blob or record."""
+
+
+def _write_varint(parts: List[str], value: int) -> None:
+    if value < 0:
+        raise CodecError(f"cannot encode negative value {value}")
+    while value >= 32:
+        parts.append(ALPHABET[32 + value % 32])
+        value //= 32
+    parts.append(ALPHABET[value])
+
+
+def _is_count(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 1 and value % 1 == 0
+
+
+def _slot_at(slots, index: int) -> Optional[Dict]:
+    """Slot `index` (1-based) from a JSON array or an index-keyed object."""
+    if isinstance(slots, list):
+        return slots[index - 1] if index <= len(slots) else None
+    return slots.get(str(index), slots.get(index))
+
+
+def _level_from_max_slots(max_slots: int) -> int:
+    return max(1, -(-max_slots // SLOTS_PER_LEVEL)) if max_slots >= 1 else STARTING_INVENTORY_LEVEL
+
+
+def encode_inventory(state: Dict) -> str:
+    """Blob for `state` ({ slots, maxSlots, inventoryLevel }), as InventoryCodec.encode."""
+    max_slots = state["maxSlots"]
+    if not isinstance(max_slots, int) or max_slots < 0:
+        raise CodecError("maxSlots must be a non-negative integer")
+    inventory_level = state.get("inventoryLevel") or _level_from_max_slots(max_slots)
+
+    ids: List[str] = []
+    id_indexes: Dict[str, int] = {}
+    filled: List[Tuple[int, Dict]] = []
+    for index in range(1, max_slots + 1):
+        slot = _slot_at(state.get("slots") or [], index)
+        if not slot or not slot.get("itemId") or not isinstance(slot.get("count"), (int, float)) or slot["count"] <= 0:
+            continue
+        if not isinstance(slot["itemId"], str):
+            raise CodecError(f"slot {index} item id must be a string")
+        if not _is_count(slot["count"]):
+            raise CodecError(f"slot {index} count must be a positive integer")
+        if slot["itemId"] not in id_indexes:
+            id_indexes[slot["itemId"]] = len(ids)
+            ids.append(slot["itemId"])
+        filled.append((index, slot))
+
+    parts: List[str] = []
+    for value in (FORMAT_VERSION, inventory_level, max_slots, len(ids)):
+        _write_varint(parts, value)
+    for item_id in ids:
+        _write_varint(parts, len(item_id.encode("utf-8")))
+        parts.append(item_id)
+    _write_varint(parts, len(filled))
+    previous = 0
+    for index, slot in filled:
+        _write_varint(parts, index - previous - 1)
+        _write_varint(parts, id_indexes[slot["itemId"]])
+        _write_varint(parts, int(slot["count"]) - 1)
+        previous = index
+    return "".join(parts)
+
+
+def decode_inventory(blob: str) -> Dict:
+    """{ slots, maxSlots, inventoryLevel } for `blob`; slots is keyed by 1-based index."""
+    data = blob.encode("utf-8")
+    position = 0
+
+    def read_varint() -> int:
+        nonlocal position
+        value = 0
+        scale = 1
+        while True:
+            if position >= len(data):
+                raise CodecError("truncated inventory blob")
+            digit = DIGIT_VALUES.get(chr(data[position]))
+            position += 1
+            if digit is None:
+                raise CodecError(f"invalid digit at byte {position}")
+            if digit < 32:
+                return value + digit * scale
+            value += (digit - 32) * scale
+            scale *= 32
+
+    version = read_varint()
+    if version != FORMAT_VERSION:
+        raise CodecError(f"unsupported inventory blob version {version}")
+    inventory_level = read_varint()
+    max_slots = read_varint()
+
+    ids = []
+    for _ in range(read_varint()):
+        size = read_varint()
+        if size == 0 or position + size > len(data):
+            raise CodecError("truncated item id in inventory blob")
+        ids.append(data[position:position + size].decode("utf-8"))
+        position += size
+
+    slots: Dict[int, Dict] = {}
+    index = 0
+    for _ in range(read_varint()):
+        index += read_varint() + 1
+        id_index = read_varint()
+        item_count = read_varint() + 1
+        if index > max_slots or id_index >= len(ids):
+            raise CodecError(f"inventory blob slot {index} is out of range")
+        slots[index] = {"itemId": ids[id_index], "count": item_count}
+
+    if position != len(data):
+        raise CodecError("trailing data after inventory blob")
+    return {"slots": slots, "maxSlots": max_slots, "inventoryLevel": inventory_level}
+
+
+def _resolve_max_slots(config: Optional[Dict]) -> int:
+    """InventoryConstants.resolveMaxSlots."""
+    if isinstance(config, dict):
+        for key in ("maxSlots", "MAX_SLOTS", "capacity"):
+            value = config.get(key)
+            if isinstance(value, (int, float)) and value > 0:
+                return int(value)
+        level = config.get("inventoryLevel", config.get("level"))
+        if isinstance(level, (int, float)) and level > 0:
+            return int(level) * SLOTS_PER_LEVEL
+    return DEFAULT_MAX_SLOTS
+
+
+def _from_legacy(payload: Dict, inventory_level: Optional[int]) -> Dict:
+    """InventoryAdapters.defaultLegacyAdapter.toSnapshot, reduced to ids and counts."""
+    max_slots = _resolve_max_slots(payload)
+    slots: Dict[int, Dict] = {}
+    for legacy_slot in payload.get("inventory") or []:
+        index = legacy_slot.get("slot") or max_slots + 1
+        if not 1 <= index <= max_slots:
+            continue
+        item_id = legacy_slot.get("itemId")
+        amount = legacy_slot.get("amount")
+        if amount is None:
+            amount = 1
+        if item_id and _is_count(amount):
+            slots[index] = {"itemId": item_id, "count": int(amount)}
+        else:
+            slots.pop(index, None)
+    return {
+        "slots": slots,
+        "maxSlots": max_slots,
+        "inventoryLevel": inventory_level or _level_from_max_slots(max_slots),
+    }
+
+
+def migrate(data) -> Tuple[Dict, str]:
+    """Decoded state and stored format ("packed", "slots" or "legacy"), as InventoryCodec.migrate."""
+    if isinstance(data, str):
+        return decode_inventory(data), "packed"
+    if not isinstance(data, dict):
+        raise CodecError("unrecognised inventory data")
+
+    if isinstance(data.get("slots"), (list, dict)):
+        inventory_level = data.get("inventoryLevel") or STARTING_INVENTORY_LEVEL
+        max_slots = data.get("maxSlots") or inventory_level * SLOTS_PER_LEVEL
+        slots: Dict[int, Dict] = {}
+        for index in range(1, max_slots + 1):
+            slot = _slot_at(data["slots"], index)
+            if slot and isinstance(slot.get("itemId"), str) and slot["itemId"] and _is_count(slot.get("count")):
+                slots[index] = {"itemId": slot["itemId"], "count": int(slot["count"])}
+        return {"slots": slots, "maxSlots": max_slots, "inventoryLevel": inventory_level}, "slots"
+
+    payload = data if isinstance(data.get("inventory"), list) else data.get("legacyPayload")
+    if isinstance(payload, dict):
+        return _from_legacy(payload, data.get("inventoryLevel")), "legacy"
+    raise CodecError("unrecognised inventory data")
+
+
+@profiled("inventory_codec")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Convert stored inventories to and from the packed blob format.")
+    parser.add_argument("input", type=Path, help="JSON object mapping DataStore keys to stored values.")
+    parser.add_argument("--output", type=Path, help="Write the result here instead of stdout.")
+    parser.add_argument("--decode", action="store_true", help="Decode blobs instead of encoding records.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not args.input.exists():
+        print(f"❌ Error: {args.input} not found", file=sys.stderr)
+        return 1
+
+    with span("load"):
+        records = json.loads(args.input.read_text(encoding="utf-8"))
+    if not isinstance(records, dict):
+        print("❌ Error: input must be a JSON object of key -> stored value", file=sys.stderr)
+        return 1
+
+    result = {}
+    formats: Dict[str, int] = {}
+    with span("transform"):
+        for key, value in records.items():
+            try:
+                if args.decode:
+                    result[key] = decode_inventory(value)
+                else:
+                    state, stored_format = migrate(value)
+                    formats[stored_format] = formats.get(stored_format, 0) + 1
+                    result[key] = encode_inventory(state)
+            except (CodecError, KeyError, TypeError) as exc:
+                print(f"❌ {key}: {exc}", file=sys.stderr)
+                return 1
+    count("records", len(result))
+
+    text = json.dumps(result, indent=2, ensure_ascii=False) + "\n"
+    if not args.decode:
+        before = sum(len(json.dumps(value, separators=(",", ":"))) for value in records.values())
+        after = sum(len(json.dumps(blob)) for blob in result.values())
+        summary = ", ".join(f"{total} {name}" for name, total in sorted(formats.items()))
+        print(f"📦 {len(result)} inventories ({summary}): {before} -> {after} bytes of JSON", file=sys.stderr)
+
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+        print(f"💾 Wrote {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Build the item search index used by ItemDataFetcher.searchItemIds and searchItems.
+
+Items are ranked once, by lowercased name, and referred to by that rank. The
+index holds:
+
+  * ids / names  - item ids and lowercased names in rank order
+  * tokens       - sorted, de-duplicated name words ([0-9a-z]+ runs), with
+                   tokenPostings[i] the ascending ranks of items containing
+                   tokens[i]; queries binary-search it for a prefix range
+  * trigrams     - every ASCII three-byte slice of a lowercased name mapped to
+                   the ascending ranks of items containing it; queries of three
+                   or more bytes intersect these and then confirm the substring
+
+Lowercasing is ASCII-only, as Luau's string.lower, so both sides agree byte
+for byte. `search()` is the reference implementation of the runtime query.
+
+Outputs:
+  - src/shared/data/ItemSearchIndex.luau
+
+Usage:
+    python tools/item_search_index.py [--check] [--pretty]
+
+build_items_dataset.py writes the index together with ItemsData.luau; run
+this tool directly to rebuild it from the committed data/items.json.
+"""
+
+import argparse
+import bisect
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from instrumentation import add_profile_arguments, count, profiled, span
+from pack_luau_data import pack_value
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_ITEMS = ROOT / "data" / "items.json"
+OUTPUT_LUA = ROOT / "src" / "shared" / "data" / "ItemSearchIndex.luau"
+
+INDEX_VERSION = 1
+HEADER = "-- Generated by tools/item_search_index.py. Do not edit by hand.\n"
+
+_TOKEN_SPLIT = re.compile(r"[^0-9a-z]+")
+
+
+def ascii_lower(text: str) -> str:
+    """Lowercase A-Z only, like Luau's string.lower."""
+    return text.encode("utf-8").lower().decode("utf-8")
+
+
+def tokenize(name: str) -> List[str]:
+    return [token for token in _TOKEN_SPLIT.split(ascii_lower(name)) if token]
+
+
+def trigrams(text: str) -> Iterable[str]:
+    # Non-ASCII characters are multi-byte in Luau; skipping slices that contain
+    # them keeps the keys identical to string.sub(name, i, i + 2) at runtime.
+    for start in range(len(text) - 2):
+        gram = text[start:start + 3]
+        if gram.isascii():
+            yield gram
+
+
+def build_search_index(items: Sequence[Dict]) -> Dict:
+    """Index `items` (records with `id` and `name`) for prefix and substring search."""
+    ranked = sorted(items, key=lambda item: (ascii_lower(item.get("name") or item["id"]), item["id"]))
+    ids = [item["id"] for item in ranked]
+    names = [ascii_lower(item.get("name") or item["id"]) for item in ranked]
+
+    token_postings: Dict[str, List[int]] = {}
+    trigram_postings: Dict[str, List[int]] = {}
+    for rank, name in enumerate(names, 1):
+        for token in dict.fromkeys(tokenize(name)):
+            token_postings.setdefault(token, []).append(rank)
+        for gram in dict.fromkeys(trigrams(name)):
+            trigram_postings.setdefault(gram, []).append(rank)
+
+    tokens = sorted(token_postings)
+    return {
+        "version": INDEX_VERSION,
+        "ids": ids,
+        "names": names,
+        "tokens": tokens,
+        "tokenPostings": [token_postings[token] for token in tokens],
+        "trigrams": dict(sorted(trigram_postings.items())),
+    }
+
+
+def _tier(name: str, query: str) -> Optional[int]:
+    """1 exact, 2 name prefix, 3 word prefix, 4 elsewhere; None without a match."""
+    if name == query:
+        return 1
+    position = name.find(query)
+    if position < 0:
+        return None
+    if position == 0:
+        return 2
+    while position >= 0:
+        if not name[position - 1].isalnum() or not name[position - 1].isascii():
+            return 3
+        position = name.find(query, position + 1)
+    return 4
+
+
+def search(index: Dict, term: str, limit: Optional[int] = None) -> List[str]:
+    """Ranked ids for `term`, as ItemDataFetcher.searchItemIds returns them."""
+    query = ascii_lower(term or "")
+    if not query:
+        return []
+    names = index["names"]
+
+    if len(query.encode("utf-8")) >= 3:
+        grams = list(dict.fromkeys(trigrams(query)))
+        if grams:
+            postings = [set(index["trigrams"].get(gram, ())) for gram in grams]
+            candidates = sorted(set.intersection(*postings))
+        else:
+            candidates = range(1, len(names) + 1)
+    else:
+        tokens = index["tokens"]
+        start = bisect.bisect_left(tokens, query)
+        found = set()
+        for position in range(start, len(tokens)):
+            if not tokens[position].startswith(query):
+                break
+            found.update(index["tokenPostings"][position])
+        candidates = sorted(found)
+
+    tiers: Dict[int, List[str]] = {1: [], 2: [], 3: [], 4: []}
+    for rank in candidates:
+        tier = _tier(names[rank - 1], query)
+        if tier is not None:
+            tiers[tier].append(index["ids"][rank - 1])
+    results = tiers[1] + tiers[2] + tiers[3] + tiers[4]
+    return results[:limit] if limit is not None else results
+
+
+def to_luau_module(index: Dict, pretty: bool = False) -> str:
+    if pretty:
+        from build_items_dataset import to_lua
+
+        return HEADER + "return " + to_lua(index) + "\n"
+    return pack_value(index)
+
+
+@profiled("item_search_index")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build ItemSearchIndex.luau from data/items.json.")
+    parser.add_argument("--check", action="store_true", help="Only report whether ItemSearchIndex.luau is up to date.")
+    parser.add_argument("--pretty", action="store_true", help="Write a readable table instead of packing it.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not DATA_ITEMS.exists():
+        print(f"❌ Error: {DATA_ITEMS} not found")
+        return 1
+
+    with span("load"):
+        items = json.loads(DATA_ITEMS.read_text(encoding="utf-8"))["items"]
+    with span("transform"):
+        index = build_search_index(items)
+    count("items", len(index["ids"]))
+    count("tokens", len(index["tokens"]))
+    count("trigrams", len(index["trigrams"]))
+    with span("serialize"):
+        module = to_luau_module(index, args.pretty)
+
+    print(f"📋 {len(index['ids'])} items, {len(index['tokens'])} tokens, {len(index['trigrams'])} trigrams")
+
+    current = OUTPUT_LUA.read_text(encoding="utf-8") if OUTPUT_LUA.exists() else None
+    if args.check:
+        if current != module:
+            print(f"❌ {OUTPUT_LUA.name} is out of date; run tools/item_search_index.py")
+            return 1
+        print(f"✅ {OUTPUT_LUA.name} is up to date")
+        return 0
+
+    with span("write"):
+        OUTPUT_LUA.parent.mkdir(parents=True, exist_ok=True)
+        OUTPUT_LUA.write_text(module, encoding="utf-8")
+    print(f"💾 Wrote {OUTPUT_LUA}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
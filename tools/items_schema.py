@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Schema validation for data/items.json.
+
+The record shapes below mirror what build_items_dataset.py emits. They are
+compiled once into a plain Python validator (generated source, no per-field
+interpretation at check time) that walks items, recipes and meta in a single
+pass and resolves recipe references through a hash index of item ids.
+
+Usage:
+    python tools/items_schema.py              # validate data/items.json
+    python tools/items_schema.py path/to.json # validate another payload
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_ITEMS = ROOT / "data" / "items.json"
+
+# Field kinds understood by the compiler:
+#   "str"      -> JSON string
+#   "int"      -> JSON integer (booleans rejected)
+#   "number"   -> JSON integer or float
+#   "str_list" -> JSON array of strings
+#   "list"     -> JSON array of nested records (see nested schema)
+# The boolean marks whether the field may be null.
+FieldSpec = Tuple[str, str, bool]
+
+ITEM_FIELDS: Sequence[FieldSpec] = (
+    ("id", "str", False),
+    ("name", "str", False),
+    ("category", "str", False),
+    ("series", "str", True),
+    ("set", "str", True),
+    ("tag", "str", True),
+    ("sell", "int", True),
+    ("buy", "int", True),
+    ("source", "str_list", False),
+    ("themes", "str_list", False),
+)
+
+MATERIAL_FIELDS: Sequence[FieldSpec] = (
+    ("itemId", "str", False),
+    ("name", "str", False),
+    ("count", "int", False),
+)
+
+RECIPE_FIELDS: Sequence[FieldSpec] = (
+    ("id", "str", False),
+    ("itemId", "str", False),
+    ("name", "str", False),
+    ("sell", "int", True),
+    ("station", "str", False),
+    ("time", "number", False),
+    ("materials", "list", False),
+    ("source", "str_list", False),
+)
+
+META_FIELDS: Sequence[FieldSpec] = (
+    ("source", "str", False),
+    ("itemsSampled", "int", False),
+    ("recipesSampled", "int", False),
+)
+
+_TYPE_TESTS = {
+    "str": "type({v}) is str",
+    "int": "type({v}) is int",
+    "number": "type({v}) is int or type({v}) is float",
+    "str_list": "type({v}) is list",
+    "list": "type({v}) is list",
+}
+
+_TYPE_NAMES = {
+    "str": "string",
+    "int": "integer",
+    "number": "number",
+    "str_list": "array of strings",
+    "list": "array",
+}
+
+
+class _Emitter:
+    """Tiny indented source builder used by the schema compiler."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.depth = 0
+
+    def line(self, text: str) -> None:
+        self.lines.append("    " * self.depth + text)
+
+    def indent(self) -> None:
+        self.depth += 1
+
+    def dedent(self) -> None:
+        self.depth -= 1
+
+    def source(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _emit_record(out: _Emitter, fields: Sequence[FieldSpec], var: str, path: str, nested: Dict[str, Sequence[FieldSpec]]) -> None:
+    """Emit checks for one record bound to `var` whose JSON path expression is `path`."""
+    allowed = repr(frozenset(name for name, _, _ in fields))
+    out.line(f"if type({var}) is not dict:")
+    out.indent()
+    out.line(f"err({path}, 'expected object')")
+    out.dedent()
+    out.line("else:")
+    out.indent()
+    out.line(f"for key in {var}.keys() - {allowed}:")
+    out.indent()
+    out.line(f"err({path} + '.' + str(key), 'unexpected field')")
+    out.dedent()
+
+    for name, kind, nullable in fields:
+        value = f"v_{name}_{out.depth}"
+        field_path = f"{path} + {'.' + name!r}"
+        out.line(f"{value} = {var}.get({name!r}, MISSING)")
+        out.line(f"if {value} is MISSING:")
+        out.indent()
+        out.line(f"err({field_path}, 'missing required field')")
+        out.dedent()
+        if nullable:
+            out.line(f"elif {value} is None:")
+            out.indent()
+            out.line("pass")
+            out.dedent()
+        out.line(f"elif not ({_TYPE_TESTS[kind].format(v=value)}):")
+        out.indent()
+        suffix = " or null" if nullable else ""
+        out.line(f"err({field_path}, 'expected {_TYPE_NAMES[kind]}{suffix}, got ' + type({value}).__name__)")
+        out.dedent()
+
+        if kind == "str_list":
+            out.line("else:")
+            out.indent()
+            out.line(f"for j, entry in enumerate({value}):")
+            out.indent()
+            out.line("if type(entry) is not str:")
+            out.indent()
+            out.line(f"err({field_path} + '[' + str(j) + ']', 'expected string, got ' + type(entry).__name__)")
+            out.dedent()
+            out.dedent()
+            out.dedent()
+        elif kind == "list":
+            child = f"row_{out.depth}"
+            index = f"k_{out.depth}"
+            out.line("else:")
+            out.indent()
+            out.line(f"for {index}, {child} in enumerate({value}):")
+            out.indent()
+            _emit_record(out, nested[name], child, f"{field_path} + '[' + str({index}) + ']'", nested)
+            out.dedent()
+            out.dedent()
+
+    out.dedent()
+
+
+def compile_validator() -> Callable[[object], List[Tuple[str, str]]]:
+    """Compile the dataset schema into a single validator function.
+
+    The returned callable takes a decoded items.json payload and returns a
+    list of (json_path, message) tuples; an empty list means the payload is
+    valid.
+    """
+    out = _Emitter()
+    out.line("def validate(payload):")
+    out.indent()
+    out.line("errors = []")
+    out.line("err = lambda path, message: errors.append((path, message))")
+    out.line("if type(payload) is not dict:")
+    out.indent()
+    out.line("err('$', 'expected object')")
+    out.line("return errors")
+    out.dedent()
+
+    # Items: shape checks plus the id index used for referential checks.
+    out.line("item_ids = {}")
+    out.line("items = payload.get('items', MISSING)")
+    out.line("if items is MISSING:")
+    out.indent()
+    out.line("err('$.items', 'missing required field')")
+    out.line("items = ()")
+    out.dedent()
+    out.line("elif type(items) is not list:")
+    out.indent()
+    out.line("err('$.items', 'expected array, got ' + type(items).__name__)")
+    out.line("items = ()")
+    out.dedent()
+    out.line("for i, item in enumerate(items):")
+    out.indent()
+    out.line("path = '$.items[' + str(i) + ']'")
+    _emit_record(out, ITEM_FIELDS, "item", "path", {})
+    out.line("item_id = item.get('id') if type(item) is dict else None")
+    out.line("if type(item_id) is str:")
+    out.indent()
+    out.line("first = item_ids.setdefault(item_id, i)")
+    out.line("if first != i:")
+    out.indent()
+    out.line("err(path + '.id', 'duplicate item id ' + repr(item_id) + ' (first at $.items[' + str(first) + '])')")
+    out.dedent()
+    out.dedent()
+    out.dedent()
+
+    # Recipes: shape checks plus references into the item index.
+    out.line("recipe_ids = {}")
+    out.line("recipes = payload.get('recipes', MISSING)")
+    out.line("if recipes is MISSING:")
+    out.indent()
+    out.line("err('$.recipes', 'missing required field')")
+    out.line("recipes = ()")
+    out.dedent()
+    out.line("elif type(recipes) is not list:")
+    out.indent()
+    out.line("err('$.recipes', 'expected array, got ' + type(recipes).__name__)")
+    out.line("recipes = ()")
+    out.dedent()
+    out.line("for i, recipe in enumerate(recipes):")
+    out.indent()
+    out.line("path = '$.recipes[' + str(i) + ']'")
+    _emit_record(out, RECIPE_FIELDS, "recipe", "path", {"materials": MATERIAL_FIELDS})
+    out.line("if type(recipe) is not dict:")
+    out.indent()
+    out.line("continue")
+    out.dedent()
+    out.line("recipe_id = recipe.get('id')")
+    out.line("if type(recipe_id) is str:")
+    out.indent()
+    out.line("first = recipe_ids.setdefault(recipe_id, i)")
+    out.line("if first != i:")
+    out.indent()
+    out.line("err(path + '.id', 'duplicate recipe id ' + repr(recipe_id) + ' (first at $.recipes[' + str(first) + '])')")
+    out.dedent()
+    out.dedent()
+    out.line("output_id = recipe.get('itemId')")
+    out.line("if type(output_id) is str and output_id not in item_ids:")
+    out.indent()
+    out.line("err(path + '.itemId', 'unknown item id ' + repr(output_id))")
+    out.dedent()
+    out.line("materials = recipe.get('materials')")
+    out.line("if type(materials) is list:")
+    out.indent()
+    out.line("for j, material in enumerate(materials):")
+    out.indent()
+    out.line("material_id = material.get('itemId') if type(material) is dict else None")
+    out.line("if type(material_id) is str and material_id not in item_ids:")
+    out.indent()
+    out.line("err(path + '.materials[' + str(j) + '].itemId', 'unknown item id ' + repr(material_id))")
+    out.dedent()
+    out.dedent()
+    out.dedent()
+    out.dedent()
+
+    # Meta block.
+    out.line("meta = payload.get('meta', MISSING)")
+    out.line("if meta is MISSING:")
+    out.indent()
+    out.line("err('$.meta', 'missing required field')")
+    out.dedent()
+    out.line("else:")
+    out.indent()
+    _emit_record(out, META_FIELDS, "meta", "'$.meta'", {})
+    out.dedent()
+    out.line("return errors")
+
+    namespace = {"MISSING": object()}
+    exec(compile(out.source(), "<items_schema>", "exec"), namespace)
+    return namespace["validate"]
+
+
+_validator = None
+
+
+def validate_payload(payload) -> List[Tuple[str, str]]:
+    """Validate a decoded items.json payload, compiling the validator on first use."""
+    global _validator
+    if _validator is None:
+        _validator = compile_validator()
+    return _validator(payload)
+
+
+def format_errors(errors: Sequence[Tuple[str, str]]) -> List[str]:
+    return [f"{path}: {message}" for path, message in errors]
+
+
+def main(argv: Sequence[str] = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    target = Path(args[0]) if args else DATA_ITEMS
+
+    if not target.exists():
+        print(f"❌ Error: {target} not found")
+        return 1
+
+    payload = json.loads(target.read_text(encoding="utf-8"))
+    errors = validate_payload(payload)
+
+    if not errors:
+        items = payload.get("items") or []
+        recipes = payload.get("recipes") or []
+        print(f"✅ {target.name}: {len(items)} items and {len(recipes)} recipes match the schema")
+        return 0
+
+    print(f"❌ {target.name}: {len(errors)} schema error(s)")
+    for line in format_errors(errors):
+        print(f"  {line}")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Lossless single-pass Luau lexer.
+
+Every byte of the input belongs to exactly one token (whitespace and
+comments are kept as trivia), so joining the token texts reproduces the
+source. Long brackets, quoted and interpolated strings are scanned with
+direct searches rather than backtracking patterns, which keeps the lexer
+linear in the size of the file.
+
+Used by require_graph.py and pack_luau_data.py, and by fix_annotations.py
+and luau_index.py under gold mine of info/docs.
+"""
+
+import re
+from typing import Iterator, List, NamedTuple, Tuple
+
+KEYWORDS = frozenset({
+    "and", "break", "continue", "do", "else", "elseif", "end", "false", "for",
+    "function", "if", "in", "local", "nil", "not", "or", "repeat", "return",
+    "then", "true", "until", "while",
+})
+
+# Token kinds.
+NAME = "name"
+KEYWORD = "keyword"
+NUMBER = "number"
+STRING = "string"
+INTERP = "interp"
+COMMENT = "comment"
+SPACE = "space"
+OP = "op"
+
+TRIVIA = frozenset({SPACE, COMMENT})
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    start: int
+    line: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
+class LexError(ValueError):
+    def __init__(self, message: str, line: int):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+_SPACE = re.compile(r"[ \t\r\n\f\v]+")
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_NUMBER = re.compile(r"0[xX][0-9A-Fa-f_]+|0[bB][01_]+|(?:[0-9][0-9_]*(?:\.[0-9_]*)?|\.[0-9][0-9_]*)(?:[eE][+-]?[0-9_]+)?")
+_LONG_OPEN = re.compile(r"\[(=*)\[")
+_OPS = (
+    "...", "//=", "..=",
+    "..", "::", "->", "==", "~=", "<=", ">=", "+=", "-=", "*=", "/=", "%=", "^=", "//",
+)
+_SINGLE_OPS = frozenset("+-*/%^#&~|<>=(){}[];:,.?@")
+
+
+def _scan_quoted(source: str, pos: int, line: int) -> int:
+    """Return the index just past the closing quote of the string starting at pos."""
+    quote = source[pos]
+    i = pos + 1
+    n = len(source)
+    while i < n:
+        ch = source[i]
+        if ch == "\\":
+            # \z skips following whitespace, including newlines.
+            i += 2
+            continue
+        if ch == quote:
+            return i + 1
+        if ch == "\n":
+            break
+        i += 1
+    raise LexError("unfinished string", line)
+
+
+def _scan_long(source: str, pos: int, level: int, line: int) -> int:
+    close = "]" + "=" * level + "]"
+    end = source.find(close, pos)
+    if end < 0:
+        raise LexError("unfinished long bracket", line)
+    return end + len(close)
+
+
+def _scan_interp(source: str, pos: int, line: int) -> int:
+    """Scan a backtick string, skipping over {expressions} and strings inside them."""
+    i = pos + 1
+    n = len(source)
+    depth = 0
+    while i < n:
+        ch = source[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if depth == 0:
+            if ch == "`":
+                return i + 1
+            if ch == "{":
+                depth = 1
+        else:
+            if ch in "\"'":
+                i = _scan_quoted(source, i, line)
+                continue
+            if ch == "`":
+                i = _scan_interp(source, i, line)
+                continue
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+        i += 1
+    raise LexError("unfinished interpolated string", line)
+
+
+def interp_expressions(text: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of the top-level {expressions} in an INTERP token's text."""
+    spans: List[Tuple[int, int]] = []
+    i = 1
+    n = len(text)
+    depth = 0
+    start = 0
+    while i < n:
+        ch = text[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if depth == 0:
+            if ch == "`":
+                break
+            if ch == "{":
+                depth = 1
+                start = i + 1
+        else:
+            if ch in "\"'":
+                i = _scan_quoted(text, i, 1)
+                continue
+            if ch == "`":
+                i = _scan_interp(text, i, 1)
+                continue
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    spans.append((start, i))
+        i += 1
+    return spans
+
+
+def iter_tokens(source: str) -> Iterator[Token]:
+    pos = 0
+    line = 1
+    n = len(source)
+    while pos < n:
+        ch = source[pos]
+        start = pos
+
+        if ch in " \t\r\n\f\v":
+            pos = _SPACE.match(source, pos).end()
+            kind = SPACE
+        elif ch == "#" and pos == 0:
+            # Shebang line, skipped by the loader like a comment.
+            newline = source.find("\n")
+            pos = n if newline < 0 else newline
+            kind = COMMENT
+        elif ch == "-" and source.startswith("--", pos):
+            match = _LONG_OPEN.match(source, pos + 2)
+            if match:
+                pos = _scan_long(source, match.end(), len(match.group(1)), line)
+            else:
+                newline = source.find("\n", pos)
+                pos = n if newline < 0 else newline
+            kind = COMMENT
+        elif ch == "_" or (ch.isascii() and ch.isalpha()):
+            pos = _NAME.match(source, pos).end()
+            kind = KEYWORD if source[start:pos] in KEYWORDS else NAME
+        elif "0" <= ch <= "9" or (ch == "." and pos + 1 < n and "0" <= source[pos + 1] <= "9"):
+            pos = _NUMBER.match(source, pos).end()
+            kind = NUMBER
+        elif ch in "\"'":
+            pos = _scan_quoted(source, pos, line)
+            kind = STRING
+        elif ch == "`":
+            pos = _scan_interp(source, pos, line)
+            kind = INTERP
+        elif ch == "[" and (match := _LONG_OPEN.match(source, pos)):
+            pos = _scan_long(source, match.end(), len(match.group(1)), line)
+            kind = STRING
+        else:
+            for op in _OPS:
+                if source.startswith(op, pos):
+                    pos += len(op)
+                    break
+            else:
+                if ch not in _SINGLE_OPS:
+                    raise LexError(f"unexpected character {ch!r}", line)
+                pos += 1
+            kind = OP
+
+        text = source[start:pos]
+        yield Token(kind, text, start, line)
+        line += text.count("\n")
+
+
+def tokenize(source: str) -> List[Token]:
+    """Lex a whole file. Raises LexError on unterminated strings or stray characters."""
+    return list(iter_tokens(source))
+
+
+def significant(tokens: List[Token]) -> List[Token]:
+    """Drop whitespace and comments."""
+    return [token for token in tokens if token.kind not in TRIVIA]
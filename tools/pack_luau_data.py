@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Pack generated Luau data modules into a compact, behaviour-identical form.
+
+A data module is a single `return { ... }` table constructor made of
+strings, numbers, booleans, nil and nested tables. Pretty-printed, most of
+its bytes are indentation and the same `["name"] =`-style keys repeated on
+every row. The packed form:
+
+  * interns every string used more than once into a local constant list `S`
+  * stores arrays of records as column arrays (one array per key) plus a row
+    count, and maps of records as an id list plus column arrays; small locals
+    `R` and `M` turn them back into row tables at require time
+  * strips all optional whitespace
+
+Requiring the packed module yields a table with exactly the same keys and
+values as the original (every row is still its own table), so callers do not
+change. Packed files carry a header line and are skipped on later runs.
+
+ItemsData.luau is generated (see build_items_dataset.py, which packs by
+default) and is the default target. SpriteManifest.luau can be packed the same
+way for a release build, but several tools edit it line by line, so keep the
+readable version in the tree.
+
+Usage:
+    python tools/pack_luau_data.py [module.luau ...] [--output PATH] [--check]
+"""
+
+import argparse
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from instrumentation import add_profile_arguments, count, profiled, span
+from luau_lexer import KEYWORD, KEYWORDS, NAME, NUMBER, OP, STRING, LexError, significant, tokenize
+
+ROOT = Path(__file__).resolve().parents[1]
+ITEMS_DATA = ROOT / "src" / "shared" / "data" / "ItemsData.luau"
+
+# A plain comment: `--!` would make Luau read it as an (unknown) directive.
+PACKED_HEADER = "-- packed by tools/pack_luau_data.py; regenerate instead of editing"
+
+# Arrays and maps of records shorter than this stay as plain constructors.
+MIN_COLUMN_ROWS = 4
+
+# Approximate length of an `S[n]` reference, used to decide what to intern.
+INTERN_REFERENCE_COST = 6
+
+# Runtime that rebuilds rows from column arrays: R(keys, rowCount, column1, ...)
+# for arrays of records and M(ids, keys, column1, ...) for maps of records.
+ROW_BUILDER = (
+    "local function R(k,n,...)local c={...}local o=table.create(n)"
+    "for i=1,n do local r={}for j=1,#k do r[k[j]]=c[j][i] end o[i]=r end return o end"
+)
+MAP_BUILDER = (
+    "local function M(d,k,...)local c={...}local o={}"
+    "for i=1,#d do local r={}for j=1,#k do r[k[j]]=c[j][i] end o[d[i]]=r end return o end"
+)
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+_ESCAPES = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "\\": "\\", '"': '"', "'": "'", "\n": "\n"}
+
+
+class PackError(ValueError):
+    pass
+
+
+# -- reading ---------------------------------------------------------------------
+#
+# Tables are read into dicts keyed by str or 1-based int; nil-valued fields are
+# dropped, exactly as Luau drops them from the table.
+
+
+def _unescape(body: str, line: int) -> str:
+    out = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch != "\\":
+            out.append(ch)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt in _ESCAPES:
+            out.append(_ESCAPES[nxt])
+            i += 2
+        elif nxt == "x":
+            out.append(chr(int(body[i + 2:i + 4], 16)))
+            i += 4
+        elif nxt == "u":
+            close = body.index("}", i)
+            out.append(chr(int(body[i + 3:close], 16)))
+            i = close + 1
+        elif nxt == "z":
+            i += 2
+            while i < len(body) and body[i] in " \t\r\n\f\v":
+                i += 1
+        elif nxt.isdigit():
+            digits = re.match(r"\d{1,3}", body[i + 1:]).group(0)
+            out.append(chr(int(digits)))
+            i += 1 + len(digits)
+        else:
+            raise PackError(f"line {line}: invalid escape \\{nxt}")
+    return "".join(out)
+
+
+def _string_value(text: str, line: int) -> str:
+    if text[0] in "\"'":
+        return _unescape(text[1:-1], line)
+    level = text.index("[", 1) - 1
+    body = text[level + 2:-(level + 2)]
+    return body[1:] if body.startswith("\n") else body
+
+
+def _number_value(text: str):
+    text = text.replace("_", "")
+    if text[:2].lower() == "0x":
+        return int(text, 16)
+    if text[:2].lower() == "0b":
+        return int(text[2:], 2)
+    value = float(text)
+    return int(value) if value.is_integer() and not any(c in text for c in ".eE") else value
+
+
+class _Reader:
+    def __init__(self, tokens):
+        self.toks = tokens
+        self.k = 0
+
+    def peek(self, kind: str, text: Optional[str] = None) -> bool:
+        if self.k >= len(self.toks):
+            return False
+        token = self.toks[self.k]
+        return token.kind == kind and (text is None or token.text == text)
+
+    def expect(self, kind: str, text: Optional[str] = None):
+        if not self.peek(kind, text):
+            found = self.toks[self.k].text if self.k < len(self.toks) else "end of file"
+            line = self.toks[min(self.k, len(self.toks) - 1)].line
+            raise PackError(f"line {line}: expected {text or kind}, found {found!r}")
+        self.k += 1
+        return self.toks[self.k - 1]
+
+    def value(self):
+        token = self.toks[self.k] if self.k < len(self.toks) else None
+        if token is None:
+            raise PackError("unexpected end of file")
+        if token.kind == OP and token.text == "{":
+            return self.table()
+        if token.kind == OP and token.text == "-":
+            self.k += 1
+            return -_number_value(self.expect(NUMBER).text)
+        self.k += 1
+        if token.kind == STRING:
+            return _string_value(token.text, token.line)
+        if token.kind == NUMBER:
+            return _number_value(token.text)
+        if token.kind == KEYWORD and token.text in ("true", "false", "nil"):
+            return {"true": True, "false": False, "nil": None}[token.text]
+        raise PackError(f"line {token.line}: {token.text!r} is not a constant (data modules may only hold literals)")
+
+    def table(self) -> Dict:
+        self.expect(OP, "{")
+        result: Dict = {}
+        position = 1
+        while not self.peek(OP, "}"):
+            if self.peek(OP, "["):
+                self.k += 1
+                key = self.value()
+                self.expect(OP, "]")
+                self.expect(OP, "=")
+                value = self.value()
+            elif self.peek(NAME) and self.k + 1 < len(self.toks) and self.toks[self.k + 1].text == "=":
+                key = self.toks[self.k].text
+                self.k += 2
+                value = self.value()
+            else:
+                key, value = position, self.value()
+                position += 1
+            if isinstance(key, float) and key.is_integer():
+                key = int(key)
+            if value is None:
+                result.pop(key, None)
+            else:
+                result[key] = value
+            if not (self.peek(OP, ",") or self.peek(OP, ";")):
+                break
+            self.k += 1
+        self.expect(OP, "}")
+        return result
+
+
+def read_module(source: str):
+    """Parse `return <constant>` into Python values."""
+    try:
+        tokens = significant(tokenize(source))
+    except LexError as exc:
+        raise PackError(str(exc)) from exc
+    reader = _Reader(tokens)
+    reader.expect(KEYWORD, "return")
+    value = reader.value()
+    if reader.k != len(tokens):
+        raise PackError(f"line {tokens[reader.k].line}: unexpected {tokens[reader.k].text!r} after the returned table")
+    return value
+
+
+# -- writing ---------------------------------------------------------------------
+
+
+def _is_array(table: Dict) -> bool:
+    return all(key == index for index, key in enumerate(table, 1))
+
+
+def _record_columns(table: Dict) -> Optional[List[str]]:
+    """Key order for column packing, or None unless `table` is an array or string-keyed map of records."""
+    if len(table) < MIN_COLUMN_ROWS or not (_is_array(table) or all(isinstance(key, str) for key in table)):
+        return None
+    keys: Dict[str, None] = {}
+    for row in table.values():
+        if not isinstance(row, dict) or not row or not all(isinstance(key, str) for key in row):
+            return None
+        keys.update(dict.fromkeys(row))
+    return list(keys)
+
+
+def _is_identifier(key: str) -> bool:
+    return bool(_IDENTIFIER.match(key)) and key not in KEYWORDS
+
+
+def lua_quote(value: str) -> str:
+    out = ['"']
+    for ch in value:
+        if ch in '"\\':
+            out.append("\\" + ch)
+        elif ch == "\n":
+            out.append("\\n")
+        elif ord(ch) < 32 or ord(ch) == 127:
+            out.append(f"\\{ord(ch)}")
+        else:
+            out.append(ch)
+    out.append('"')
+    return "".join(out)
+
+
+def lua_number(value) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "math.huge" if value > 0 else "-math.huge"
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+    return repr(value)
+
+
+class _Packer:
+    def __init__(self, root):
+        counts: Counter = Counter()
+        self._count_strings(root, counts)
+        # Most frequent first, so the common strings get the short indices. A
+        # string is only interned when its references are shorter than repeating it.
+        shared = [
+            text for text, count in counts.most_common()
+            if count > 1 and count * len(lua_quote(text)) > len(lua_quote(text)) + 1 + count * INTERN_REFERENCE_COST
+        ]
+        self.interned = {text: index for index, text in enumerate(shared, 1)}
+        self.uses_rows = False
+        self.uses_maps = False
+
+    def _count_strings(self, value, counts: Counter) -> None:
+        if isinstance(value, str):
+            counts[value] += 1
+        elif isinstance(value, dict):
+            columns = _record_columns(value)
+            for key, item in value.items():
+                # Identifier keys are written bare; column-packed ids and keys go through S.
+                if isinstance(key, str) and (columns is not None or not _is_identifier(key)):
+                    counts[key] += 1
+                self._count_strings(item, counts)
+            for key in columns or ():
+                counts[key] += 1
+
+    def string(self, text: str) -> str:
+        index = self.interned.get(text)
+        return f"S[{index}]" if index else lua_quote(text)
+
+    def key(self, key) -> str:
+        if isinstance(key, str) and _is_identifier(key):
+            return key + "="
+        return f"[{self.value(key)}]="
+
+    def value(self, value) -> str:
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, str):
+            return self.string(value)
+        if isinstance(value, (int, float)):
+            return lua_number(value)
+        if value is None:
+            return "nil"
+        return self.table(value)
+
+    def table(self, table: Dict) -> str:
+        columns = _record_columns(table)
+        if columns is not None:
+            rows = list(table.values())
+            keys = "{" + ",".join(self.string(key) for key in columns) + "}"
+            if _is_array(table):
+                self.uses_rows = True
+                builder, parts = "R", [keys, str(len(rows))]
+            else:
+                self.uses_maps = True
+                builder, parts = "M", ["{" + ",".join(self.string(key) for key in table) + "}", keys]
+            for key in columns:
+                cells = [self.value(row.get(key)) for row in rows]
+                while cells and cells[-1] == "nil":
+                    cells.pop()
+                parts.append("{" + ",".join(cells) + "}")
+            return builder + "(" + ",".join(parts) + ")"
+
+        fields = []
+        position = 1
+        for key, value in table.items():
+            if key == position:
+                fields.append(self.value(value))
+                position += 1
+            else:
+                fields.append(self.key(key) + self.value(value))
+        return "{" + ",".join(fields) + "}"
+
+
+def as_table(value):
+    """Convert JSON-style values (lists, None fields) to the reader's table form."""
+    if isinstance(value, list):
+        value = dict(enumerate(value, 1))
+    if isinstance(value, dict):
+        return {key: as_table(item) for key, item in value.items() if item is not None}
+    return value
+
+
+def pack_value(value) -> str:
+    """Return the packed module source for a data value (read_module output or JSON-style data)."""
+    value = as_table(value)
+    packer = _Packer(value)
+    body = packer.value(value)
+    lines = [PACKED_HEADER]
+    if packer.interned:
+        strings = sorted(packer.interned, key=packer.interned.get)
+        lines.append("local S={" + ",".join(lua_quote(text) for text in strings) + "}")
+    if packer.uses_rows:
+        lines.append(ROW_BUILDER)
+    if packer.uses_maps:
+        lines.append(MAP_BUILDER)
+    lines.append("return " + body)
+    return "\n".join(lines) + "\n"
+
+
+def is_packed(source: str) -> bool:
+    """True when the first line is exactly PACKED_HEADER."""
+    return source.split("\n", 1)[0].rstrip("\r") == PACKED_HEADER
+
+
+def pack_file(path: Path, output: Optional[Path] = None, check: bool = False) -> Tuple[int, int]:
+    """Pack one module; returns (original bytes, packed bytes)."""
+    with span("load"):
+        source = path.read_text(encoding="utf-8")
+    if is_packed(source):
+        return len(source.encode("utf-8")), len(source.encode("utf-8"))
+    with span("parse"):
+        value = read_module(source)
+    with span("serialize"):
+        packed = pack_value(value)
+    count("modules_packed")
+    if not check:
+        with span("write"):
+            (output or path).write_text(packed, encoding="utf-8")
+    return len(source.encode("utf-8")), len(packed.encode("utf-8"))
+
+
+@profiled("pack_luau_data")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pack generated Luau data modules into column arrays with interned strings.")
+    parser.add_argument("modules", nargs="*", type=Path, default=[ITEMS_DATA], help="Data modules to pack in place (default: ItemsData.luau).")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write the packed module here instead (single input only).")
+    parser.add_argument("--check", action="store_true", help="Report sizes without writing anything.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.output and len(args.modules) != 1:
+        parser.error("--output needs exactly one module")
+
+    failed = 0
+    for path in args.modules:
+        try:
+            before, after = pack_file(path, args.output, args.check)
+        except (OSError, PackError) as exc:
+            print(f"❌ {path}: {exc}")
+            failed += 1
+            continue
+        if before == after:
+            print(f"✅ {path.name}: already packed")
+            continue
+        verb = "would pack" if args.check else "packed"
+        print(f"{'📋' if args.check else '💾'} {path.name}: {verb} {before:,} -> {after:,} bytes ({100 * after / before:.0f}%)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
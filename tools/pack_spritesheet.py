@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Sprite Sheet Packer
+Builds the item or DIY atlas from a directory of individual icon PNGs.
+
+Every icon is resampled to an exact integer tile size (aspect preserved,
+centred), surrounded by edge-extruded bleed pixels so bilinear sampling never
+picks up a neighbour, and laid out either on the uniform grid that
+SpriteConfig indexes into or with a MaxRects bin packer. The atlas PNG,
+SpriteManifest.luau indices and the SpriteConfig constants are written
+together, and SpriteUVs.luau is rebuilt from them, so they can never drift
+apart.
+
+Resampling runs on whole batches of same-sized icons at once: a separable
+tent filter is expressed as two small weight matrices and applied with a
+single einsum over premultiplied RGBA.
+
+With --mip-levels N the packer also writes ½, ¼, ... atlases. Each level
+downsamples every tile on its own (never the assembled sheet) and re-extrudes
+its bleed, so small hotbar icons get properly filtered pixels with no
+neighbour bleeding. The level table is written to SpriteConfig so the client
+can bind the smallest sheet that still covers the on-screen size.
+
+Usage:
+    python tools/pack_spritesheet.py ICON_DIR [--sheet items|diy]
+        [--layout grid|maxrects] [--tile 64] [--padding 8] [--bleed 2]
+        [--margin 4] [--columns N] [--mip-levels 3] [--output atlas.png]
+        [--dry-run]
+
+Icons are matched by file stem: SpriteManifest keys for the item sheet,
+recipe ids for the DIY sheet. Item icons missing from the manifest are given
+free cells and appended to it. DIY cells belong to the recipe registry
+(tools/diy_icon_registry.json), so a DIY icon whose recipe has no index yet
+is refused: add the recipe to data/items.json and run
+generate_diy_icon_mapping.py first.
+"""
+
+import argparse
+import math
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from generate_diy_icon_mapping import build_mapping, load_registry
+from instrumentation import add_profile_arguments, count, profiled, span
+
+ROOT = Path(__file__).resolve().parents[1]
+SPRITE_CONFIG = ROOT / "src" / "shared" / "SpriteConfig.luau"
+SPRITE_MANIFEST = ROOT / "src" / "shared" / "SpriteManifest.luau"
+OUTPUT_DIR = ROOT / "build" / "sprites"
+
+SHEET_PREFIX = {"items": "", "diy": "DIY_"}
+
+MANIFEST_ENTRY = re.compile(
+    r'^(\s+)(\w+)\s*=\s*\{\s*name\s*=\s*"([^"]*)",\s*spriteIndex\s*=\s*(\d+)(?:,\s*rect\s*=\s*\{([^}]*)\})?\s*\},',
+    re.MULTILINE,
+)
+
+
+# ---------------------------------------------------------------------------
+# SpriteConfig / SpriteManifest I/O
+# ---------------------------------------------------------------------------
+
+def read_sprite_config(path: Path = SPRITE_CONFIG) -> Dict[str, object]:
+    """Read the top-level `KEY = value,` constants from SpriteConfig.luau."""
+    values: Dict[str, object] = {}
+    for match in re.finditer(r'^\s+([A-Z_]+)\s*=\s*([^,\n]+),', path.read_text(encoding="utf-8"), re.MULTILINE):
+        key, raw = match.group(1), match.group(2).strip()
+        if raw.startswith('"'):
+            values[key] = raw.strip('"')
+        else:
+            try:
+                values[key] = float(raw) if "." in raw else int(raw)
+            except ValueError:
+                continue
+    return values
+
+
+def format_lua_number(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, float):
+        return f"{value:.4f}".rstrip("0").rstrip(".")
+    return str(value)
+
+
+def update_sprite_config(values: Dict[str, object], path: Path = SPRITE_CONFIG) -> List[str]:
+    """Rewrite constants in the SpriteConfig table in place.
+
+    Keys that already exist keep their position (any stale trailing comment
+    is dropped); missing keys are inserted just before the table closes.
+    Returns the keys that were inserted.
+    """
+    content = path.read_text(encoding="utf-8")
+    table_end = content.index("\n}\n")
+    head, tail = content[:table_end], content[table_end:]
+    inserted = []
+
+    for key, value in values.items():
+        literal = f'"{value}"' if isinstance(value, str) else format_lua_number(value)
+        pattern = re.compile(rf'^(\s+){re.escape(key)}\s*=\s*[^,\n]+,[^\n]*$', re.MULTILINE)
+        if pattern.search(head):
+            head = pattern.sub(lambda m: f"{m.group(1)}{key} = {literal},", head, count=1)
+        else:
+            head += f"\n    {key} = {literal},"
+            inserted.append(key)
+
+    path.write_text(head + tail, encoding="utf-8")
+    return inserted
+
+
+def read_level_assets(key: str, path: Path = SPRITE_CONFIG) -> Dict[float, str]:
+    """Asset ids already recorded per scale in a SpriteConfig level table."""
+    block = re.search(rf'^    {re.escape(key)} = \{{\n(.*?)^    \}},', path.read_text(encoding="utf-8"), re.MULTILINE | re.DOTALL)
+    if not block:
+        return {}
+    return {
+        float(scale): asset
+        for scale, asset in re.findall(r'scale\s*=\s*([\d.]+),\s*asset\s*=\s*"([^"]*)"', block.group(1))
+    }
+
+
+def update_sprite_levels(key: str, levels: Sequence[Dict[str, object]], path: Path = SPRITE_CONFIG) -> None:
+    """Replace (or insert) the per-level sheet table `key` inside SpriteConfig."""
+    lines = [f"    {key} = {{"]
+    for level in levels:
+        fields = ", ".join(
+            f'{name} = "{value}"' if isinstance(value, str) else f"{name} = {format_lua_number(value)}"
+            for name, value in level.items()
+        )
+        lines.append(f"        {{ {fields} }},")
+    lines.append("    },")
+    block = "\n".join(lines)
+
+    content = path.read_text(encoding="utf-8")
+    pattern = re.compile(rf'^    {re.escape(key)} = \{{\n.*?^    \}},', re.MULTILINE | re.DOTALL)
+    if pattern.search(content):
+        content = pattern.sub(lambda _: block, content, count=1)
+    else:
+        table_end = content.index("\n}\n")
+        content = content[:table_end] + "\n" + block + content[table_end:]
+    path.write_text(content, encoding="utf-8")
+
+
+def parse_manifest(content: str) -> List[Dict]:
+    entries = []
+    for m in MANIFEST_ENTRY.finditer(content):
+        entry = {"key": m.group(2), "name": m.group(3), "spriteIndex": int(m.group(4))}
+        if m.group(5):
+            entry["rect"] = tuple(int(v) for v in m.group(5).split(","))
+        entries.append(entry)
+    return entries
+
+
+def write_manifest(entries: Dict[str, Dict], path: Path = SPRITE_MANIFEST) -> None:
+    """Update manifest lines in place and append entries that are new to it."""
+    content = path.read_text(encoding="utf-8")
+    seen = set()
+
+    def render(indent: str, key: str) -> str:
+        entry = entries[key]
+        rect = entry.get("rect")
+        rect_part = f", rect = {{ {', '.join(str(v) for v in rect)} }}" if rect else ""
+        return f'{indent}{key} = {{ name = "{entry["name"]}", spriteIndex = {entry["spriteIndex"]}{rect_part} }},'
+
+    def replace(match):
+        key = match.group(2)
+        if key not in entries:
+            return match.group(0)
+        seen.add(key)
+        return render(match.group(1), key)
+
+    content = MANIFEST_ENTRY.sub(replace, content)
+
+    added = [key for key in entries if key not in seen]
+    if added:
+        closing = content.rstrip().rfind("}")
+        block = ["", "    -- Packed"] + [render("    ", key) for key in sorted(added, key=lambda k: entries[k]["spriteIndex"])]
+        content = content[:closing].rstrip("\n") + "\n" + "\n".join(block) + "\n}\n"
+
+    path.write_text(content, encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Vectorized resampling
+# ---------------------------------------------------------------------------
+
+def resample_weights(src: int, dst: int) -> np.ndarray:
+    """Tent-filter weights (dst × src); widened when minifying so it anti-aliases."""
+    scale = src / dst
+    support = max(scale, 1.0)
+    centers = (np.arange(dst, dtype=np.float64) + 0.5) * scale
+    taps = np.arange(src, dtype=np.float64) + 0.5
+    weights = np.clip(1.0 - np.abs(taps[None, :] - centers[:, None]) / support, 0.0, None)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights.astype(np.float32)
+
+
+def premultiply(batch: np.ndarray) -> np.ndarray:
+    out = batch.astype(np.float32) / 255.0
+    out[..., :3] *= out[..., 3:4]
+    return out
+
+
+def unpremultiply(batch: np.ndarray) -> np.ndarray:
+    alpha = batch[..., 3:4]
+    rgb = np.divide(batch[..., :3], alpha, out=np.zeros_like(batch[..., :3]), where=alpha > 1e-6)
+    out = np.concatenate([rgb, alpha], axis=-1)
+    return np.clip(np.rint(out * 255.0), 0, 255).astype(np.uint8)
+
+
+def resample_batch(batch: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Resample N×H×W×4 premultiplied float icons to N×height×width×4."""
+    _, src_h, src_w, _ = batch.shape
+    if (src_h, src_w) == (height, width):
+        return batch
+    rows = resample_weights(src_h, height)
+    cols = resample_weights(src_w, width)
+    return np.einsum("yh,nhwc,xw->nyxc", rows, batch, cols, optimize=True)
+
+
+def fit_size(src_h: int, src_w: int, tile: int) -> Tuple[int, int]:
+    scale = tile / max(src_h, src_w)
+    return max(1, round(src_h * scale)), max(1, round(src_w * scale))
+
+
+def load_and_fit(paths: Sequence[Path], tile: int) -> Dict[Path, np.ndarray]:
+    """Load icons and fit each into a tile×tile square, batching identical source sizes."""
+    by_shape: Dict[Tuple[int, int], List[Tuple[Path, np.ndarray]]] = defaultdict(list)
+    for path in paths:
+        with Image.open(path) as img:
+            pixels = np.asarray(img.convert("RGBA"))
+        by_shape[pixels.shape[:2]].append((path, pixels))
+
+    fitted: Dict[Path, np.ndarray] = {}
+    for (src_h, src_w), group in by_shape.items():
+        dst_h, dst_w = fit_size(src_h, src_w, tile)
+        batch = premultiply(np.stack([pixels for _, pixels in group]))
+        resized = resample_batch(batch, dst_h, dst_w)
+
+        canvas = np.zeros((len(group), tile, tile, 4), dtype=np.float32)
+        top, left = (tile - dst_h) // 2, (tile - dst_w) // 2
+        canvas[:, top:top + dst_h, left:left + dst_w] = resized
+        for (path, _), tile_pixels in zip(group, canvas):
+            fitted[path] = tile_pixels
+    return fitted
+
+
+def extrude(tiles: np.ndarray, bleed: int) -> np.ndarray:
+    """Repeat the outermost pixels `bleed` times around every tile in the batch."""
+    if bleed <= 0:
+        return tiles
+    return np.pad(tiles, ((0, 0), (bleed, bleed), (bleed, bleed), (0, 0)), mode="edge")
+
+
+def trim_alpha(tile: np.ndarray, align: int = 1) -> Tuple[int, int, int, int]:
+    """Bounding box (top, left, height, width) of the non-transparent pixels.
+
+    The box is grown to a multiple of `align` (staying inside the tile) so
+    every mip level can halve it exactly.
+    """
+    mask = tile[..., 3] > 1e-3
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0:
+        return 0, 0, align, align
+
+    def aligned(start: int, length: int, limit: int) -> Tuple[int, int]:
+        length = min(limit, -(-length // align) * align)
+        return min(start, limit - length), length
+
+    top, height = aligned(int(rows[0]), int(rows[-1] - rows[0] + 1), tile.shape[0])
+    left, width = aligned(int(cols[0]), int(cols[-1] - cols[0] + 1), tile.shape[1])
+    return top, left, height, width
+
+
+def compose_atlas(pixels: Dict[str, np.ndarray], rects: Dict[str, Tuple[int, int, int, int]], width: int, height: int, bleed: int) -> np.ndarray:
+    """Blit premultiplied tiles at their rects, each wrapped in its own bleed ring."""
+    atlas = np.zeros((height, width, 4), dtype=np.float32)
+    for key, (x, y, _, _) in rects.items():
+        padded = extrude(pixels[key][None], bleed)[0]
+        # Clip the bleed ring at the atlas edge when the margin is thinner than the bleed.
+        x0, y0 = x - bleed, y - bleed
+        sx, sy = max(0, -x0), max(0, -y0)
+        ex = min(padded.shape[1], width - x0)
+        ey = min(padded.shape[0], height - y0)
+        atlas[y0 + sy:y0 + ey, x0 + sx:x0 + ex] = padded[sy:ey, sx:ex]
+    return atlas
+
+
+def downsample_tiles(pixels: Dict[str, np.ndarray], factor: int) -> Dict[str, np.ndarray]:
+    """Downsample every tile independently, batching tiles that share a shape."""
+    by_shape: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+    for key, tile in pixels.items():
+        by_shape[tile.shape[:2]].append(key)
+
+    result: Dict[str, np.ndarray] = {}
+    for (h, w), keys in by_shape.items():
+        batch = resample_batch(np.stack([pixels[key] for key in keys]), h // factor, w // factor)
+        for key, tile in zip(keys, batch):
+            result[key] = tile
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Layouts
+# ---------------------------------------------------------------------------
+
+def grid_layout(indices: Dict[str, int], columns: int, tile: int, padding: int, margin: int) -> Tuple[Dict[str, Tuple[int, int]], int, int, int]:
+    """Place every key at its 1-based grid index. Returns positions, rows, width, height."""
+    rows = max(1, math.ceil(max(indices.values(), default=1) / columns))
+    pitch = tile + padding
+    positions = {}
+    for key, index in indices.items():
+        zero_based = index - 1
+        positions[key] = (margin + (zero_based % columns) * pitch, margin + (zero_based // columns) * pitch)
+    width = 2 * margin + columns * tile + (columns - 1) * padding
+    height = 2 * margin + rows * tile + (rows - 1) * padding
+    return positions, rows, width, height
+
+
+class MaxRectsPacker:
+    """MaxRects bin packer using the best-short-side-fit heuristic."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.free: List[Tuple[int, int, int, int]] = [(0, 0, width, height)]
+
+    def insert(self, w: int, h: int) -> Optional[Tuple[int, int]]:
+        best = None
+        best_score = (math.inf, math.inf)
+        for fx, fy, fw, fh in self.free:
+            if w <= fw and h <= fh:
+                leftover_w, leftover_h = fw - w, fh - h
+                score = (min(leftover_w, leftover_h), max(leftover_w, leftover_h))
+                if score < best_score:
+                    best_score = score
+                    best = (fx, fy)
+        if best is None:
+            return None
+        self._split(best[0], best[1], w, h)
+        return best
+
+    def _split(self, x: int, y: int, w: int, h: int) -> None:
+        remaining = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                remaining.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                remaining.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                remaining.append((x + w, fy, fx + fw - (x + w), fh))
+            if y > fy:
+                remaining.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                remaining.append((fx, y + h, fw, fy + fh - (y + h)))
+        self.free = [
+            rect for i, rect in enumerate(remaining)
+            if not any(i != j and self._contains(other, rect) for j, other in enumerate(remaining))
+        ]
+
+    @staticmethod
+    def _contains(outer, inner) -> bool:
+        return (inner[0] >= outer[0] and inner[1] >= outer[1]
+                and inner[0] + inner[2] <= outer[0] + outer[2]
+                and inner[1] + inner[3] <= outer[1] + outer[3])
+
+
+def maxrects_layout(sizes: Dict[str, Tuple[int, int]], padding: int, margin: int) -> Tuple[Dict[str, Tuple[int, int]], int, int]:
+    """Pack (w, h) boxes; returns top-left positions and the cropped atlas size."""
+    area = sum((w + padding) * (h + padding) for w, h in sizes.values())
+    widest = max((w for w, _ in sizes.values()), default=1)
+    width = max(widest + padding, int(math.ceil(math.sqrt(area) * 1.15)))
+    packer = MaxRectsPacker(width, sum(h + padding for _, h in sizes.values()))
+
+    positions = {}
+    # Largest first packs tighter and keeps the result deterministic.
+    for key in sorted(sizes, key=lambda k: (-max(sizes[k]), -min(sizes[k]), k)):
+        w, h = sizes[key]
+        spot = packer.insert(w + padding, h + padding)
+        if spot is None:
+            raise RuntimeError(f"MaxRects packer ran out of space for {key}")
+        positions[key] = (margin + spot[0], margin + spot[1])
+
+    used_w = max((x + sizes[k][0] for k, (x, _) in positions.items()), default=0)
+    used_h = max((y + sizes[k][1] for k, (_, y) in positions.items()), default=0)
+    return positions, used_w + margin, used_h + margin
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def resolve_indices(sheet: str, icon_keys: Sequence[str]) -> Tuple[Dict[str, int], Dict[str, Dict]]:
+    """Map icon keys to grid indices.
+
+    Item keys the manifest lacks get the next free cells. DIY indices come only
+    from the recipe registry; unknown recipe keys raise ValueError, since a cell
+    picked here would never reach the registry or DIYIconIndex.luau.
+    """
+    manifest: Dict[str, Dict] = {}
+    if sheet == "items":
+        for entry in parse_manifest(SPRITE_MANIFEST.read_text(encoding="utf-8")):
+            manifest.setdefault(entry["key"], entry)
+        known = {key: entry["spriteIndex"] for key, entry in manifest.items()}
+    else:
+        known = build_mapping(load_registry())
+        unknown = sorted(key for key in icon_keys if key not in known)
+        if unknown:
+            raise ValueError(
+                f"{len(unknown)} DIY icon(s) have no registry index: {', '.join(unknown)}. "
+                "Add the recipes to data/items.json and run tools/generate_diy_icon_mapping.py."
+            )
+
+    indices: Dict[str, int] = {}
+    owners: Dict[int, str] = {}
+    for key in icon_keys:
+        if key in known:
+            index = known[key]
+            if index in owners:
+                print(f"⚠️  {key} shares grid cell {index} with {owners[index]}; keeping {owners[index]}")
+                continue
+            indices[key] = index
+            owners[index] = key
+
+    taken = set(known.values())
+    next_free = 1
+    for key in icon_keys:
+        if key in known:
+            continue
+        while next_free in taken:
+            next_free += 1
+        indices[key] = next_free
+        taken.add(next_free)
+        owners[next_free] = key
+        name = key.replace("_", " ").replace("-", " ").title()
+        manifest[key] = {"key": key, "name": name, "spriteIndex": next_free}
+
+    return indices, manifest
+
+
+def pack(args) -> int:
+    icon_dir: Path = args.icon_dir
+    if not icon_dir.is_dir():
+        print(f"❌ Error: {icon_dir} is not a directory")
+        return 1
+    if args.sheet == "diy" and args.layout == "maxrects":
+        print("❌ Error: DIY icons are addressed by grid index; use --layout grid")
+        return 1
+    if args.bleed * 2 > args.padding:
+        print(f"❌ Error: bleed ({args.bleed}) must fit inside half the padding ({args.padding})")
+        return 1
+    if args.mip_levels < 1:
+        print("❌ Error: --mip-levels must be at least 1")
+        return 1
+    align = 2 ** (args.mip_levels - 1)
+    for name in ("tile", "padding", "margin"):
+        if getattr(args, name) % align:
+            print(f"❌ Error: --{name} must be divisible by {align} to build {args.mip_levels} mip levels")
+            return 1
+
+    icon_paths = sorted(icon_dir.glob("*.png"))
+    if not icon_paths:
+        print(f"❌ Error: no PNG icons found in {icon_dir}")
+        return 1
+
+    prefix = SHEET_PREFIX[args.sheet]
+    config = read_sprite_config()
+    columns = args.columns or int(config.get(f"{prefix}COLUMNS", 21))
+    by_key = {path.stem: path for path in icon_paths}
+
+    print(f"📦 Packing {len(icon_paths)} icons into the {args.sheet} sheet ({args.layout})")
+    with span("load"):
+        fitted = load_and_fit(icon_paths, args.tile)
+    count("icons", len(icon_paths))
+    keys = list(by_key)
+    with span("parse"):
+        try:
+            indices, manifest = resolve_indices(args.sheet, keys)
+        except ValueError as exc:
+            print(f"❌ Error: {exc}")
+            return 1
+    keys = [key for key in keys if key in indices]
+
+    rects: Dict[str, Tuple[int, int, int, int]] = {}
+    with span("transform"):
+        if args.layout == "grid":
+            positions, rows, width, height = grid_layout(indices, columns, args.tile, args.padding, args.margin)
+            pixels = {key: fitted[by_key[key]] for key in keys}
+            for key in keys:
+                x, y = positions[key]
+                rects[key] = (x, y, args.tile, args.tile)
+        else:
+            pixels = {}
+            for key in keys:
+                top, left, h, w = trim_alpha(fitted[by_key[key]], align)
+                pixels[key] = fitted[by_key[key]][top:top + h, left:left + w]
+            positions, width, height = maxrects_layout({k: (p.shape[1], p.shape[0]) for k, p in pixels.items()}, args.padding, args.margin)
+            rows = 0
+            for key in keys:
+                x, y = positions[key]
+                rects[key] = (x, y, pixels[key].shape[1], pixels[key].shape[0])
+
+    output = args.output or OUTPUT_DIR / f"{args.sheet}_atlas.png"
+    levels = []
+    for level in range(args.mip_levels):
+        factor = 2 ** level
+        level_padding = args.padding // factor
+        levels.append({
+            "factor": factor,
+            "path": output if level == 0 else output.with_name(f"{output.stem}_mip{level}{output.suffix}"),
+            "width": width // factor,
+            "height": height // factor,
+            "bleed": min(args.bleed, level_padding // 2, args.margin // factor),
+        })
+        print(f"   Level {level} (1/{factor}): {width // factor}×{height // factor}px, tile {args.tile // factor}px, bleed {levels[-1]['bleed']}px")
+
+    if args.dry_run:
+        print("   Dry run: nothing written")
+        return 0
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    level_pixels = pixels
+    for level in levels:
+        factor = level["factor"]
+        with span("serialize"):
+            if factor > 1:
+                # Always filter from full resolution so errors do not compound between levels.
+                level_pixels = downsample_tiles(pixels, factor)
+            level_rects = {key: tuple(v // factor for v in rect) for key, rect in rects.items()}
+            atlas = compose_atlas(level_pixels, level_rects, level["width"], level["height"], level["bleed"])
+            image = Image.fromarray(unpremultiply(atlas[None])[0], "RGBA")
+        with span("write"):
+            image.save(level["path"])
+        print(f"💾 Atlas saved to: {level['path']}")
+
+    config_values: Dict[str, object] = {
+        f"{prefix}SPRITE_SIZE": args.tile,
+        f"{prefix}PADDING": args.padding,
+        f"{prefix}OUTER_PADDING_LEFT": args.margin,
+        f"{prefix}OUTER_PADDING_RIGHT": args.margin,
+        f"{prefix}OUTER_PADDING_TOP": args.margin,
+        f"{prefix}OUTER_PADDING_BOTTOM": args.margin,
+        f"{prefix}SHEET_WIDTH": width,
+        f"{prefix}SHEET_HEIGHT": height,
+    }
+    if args.layout == "grid":
+        config_values[f"{prefix}COLUMNS"] = columns
+        config_values[f"{prefix}ROWS"] = max(rows, int(config.get(f"{prefix}ROWS", 0)) if args.keep_rows else rows)
+    with span("write"):
+        update_sprite_config(config_values)
+
+        known_assets = read_level_assets(f"{prefix}LEVELS")
+        known_assets.setdefault(1.0, str(config.get(f"{prefix}SHEET_ASSET", "")))
+        update_sprite_levels(f"{prefix}LEVELS", [
+            {
+                "scale": 1 / level["factor"],
+                "asset": known_assets.get(1 / level["factor"], ""),
+                "width": level["width"],
+                "height": level["height"],
+            }
+            for level in levels
+        ])
+    print(f"💾 SpriteConfig constants updated: {SPRITE_CONFIG}")
+
+    if args.sheet == "items":
+        for key in keys:
+            entry = manifest[key]
+            entry["spriteIndex"] = indices[key]
+            if args.layout == "maxrects":
+                entry["rect"] = rects[key]
+            else:
+                entry.pop("rect", None)
+        with span("write"):
+            write_manifest({key: manifest[key] for key in keys})
+        print(f"💾 SpriteManifest updated: {SPRITE_MANIFEST}")
+
+    # Imported here: build_sprite_uvs reads the SpriteConfig/manifest helpers above.
+    import build_sprite_uvs
+    with span("build_sprite_uvs"):
+        if build_sprite_uvs.main([]):
+            return 1
+
+    print(f"\n⬆️  Upload {output.name} and set {prefix}SHEET_ASSET in SpriteConfig.luau to the new asset id.")
+    if len(levels) > 1:
+        print(f"   Upload the _mip atlases too and fill in each asset in {prefix}LEVELS.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Pack individual icon PNGs into a sprite atlas.")
+    parser.add_argument("icon_dir", type=Path, help="Directory containing <key>.png icons.")
+    parser.add_argument("--sheet", choices=sorted(SHEET_PREFIX), default="items")
+    parser.add_argument("--layout", choices=("grid", "maxrects"), default="grid")
+    parser.add_argument("--tile", type=int, default=64, help="Integer tile size in pixels.")
+    parser.add_argument("--padding", type=int, default=8, help="Gap between tiles in pixels.")
+    parser.add_argument("--bleed", type=int, default=2, help="Edge-extrusion pixels around each tile.")
+    parser.add_argument("--margin", type=int, default=4, help="Outer margin of the atlas in pixels.")
+    parser.add_argument("--columns", type=int, help="Grid columns (defaults to SpriteConfig).")
+    parser.add_argument("--keep-rows", action="store_true", help="Never shrink ROWS below the current SpriteConfig value.")
+    parser.add_argument("--mip-levels", type=int, default=3, help="Number of atlases to emit (1×, ½, ¼, ...).")
+    parser.add_argument("--output", type=Path, help="Atlas PNG path (mip levels get a _mipN suffix).")
+    parser.add_argument("--dry-run", action="store_true", help="Compute the layout without writing anything.")
+    add_profile_arguments(parser)
+    return parser
+
+
+@profiled("pack_spritesheet")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return pack(build_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
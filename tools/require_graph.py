@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Static require graph and cold-start report for the Rojo tree.
+
+Maps every Luau file to its DataModel path (sourcemap.json, or the same
+mapping derived from default.project.json when the sourcemap is stale),
+then resolves `require(...)` arguments built from `script`, `.Parent`,
+`game:GetService`, `:WaitForChild`/`:FindFirstChild`, `[...]` and locals
+or `self.` fields holding such paths.
+
+Each module is annotated with its byte size and constant-table size
+(string/number literals and table-constructor fields). For every client and
+server entry script the report lists the modules reached at startup, the
+critical path (the heaviest require chain, by bytes) and top-level requires
+whose binding is only used inside functions and could be required lazily.
+
+Requires at the top level of a chunk are "eager"; requires inside a function
+body are "deferred" (they run when that function is first called, which for
+constructors is usually still during startup).
+
+Usage:
+    python tools/require_graph.py [--json build/require_graph.json] [--sourcemap sourcemap.json]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from instrumentation import add_profile_arguments, count, profiled, span
+from luau_lexer import KEYWORD, NAME, NUMBER, OP, STRING, LexError, significant, tokenize
+
+ROOT = Path(__file__).resolve().parents[1]
+PROJECT_PATH = ROOT / "default.project.json"
+SOURCEMAP_PATH = ROOT / "sourcemap.json"
+
+LUAU_EXTENSIONS = (".luau", ".lua")
+ENTRY_CLASSES = ("Script", "LocalScript")
+
+# Modules at least this large that sit on a startup path are worth deferring.
+LAZY_BYTES_THRESHOLD = 16 * 1024
+
+DataModelPath = Tuple[str, ...]
+
+
+# -- DataModel mapping -----------------------------------------------------------
+
+
+def _script_class(filename: str) -> Optional[Tuple[str, str]]:
+    """Return (instance name, class) for a Rojo script file, or None."""
+    for ext in LUAU_EXTENSIONS:
+        if filename.endswith(".server" + ext):
+            return filename[: -len(".server" + ext)], "Script"
+        if filename.endswith(".client" + ext):
+            return filename[: -len(".client" + ext)], "LocalScript"
+        if filename.endswith(ext):
+            return filename[: -len(ext)], "ModuleScript"
+    return None
+
+
+def _derive_directory(name: str, directory: Path) -> Dict:
+    node = {"name": name, "className": "Folder", "children": []}
+    for entry in sorted(directory.iterdir()):
+        if entry.is_dir():
+            node["children"].append(_derive_directory(entry.name, entry))
+            continue
+        script = _script_class(entry.name)
+        if script is None:
+            continue
+        child_name, class_name = script
+        if child_name == "init":
+            node["className"] = class_name
+            node["filePaths"] = [str(entry.relative_to(ROOT))]
+        else:
+            node["children"].append({"name": child_name, "className": class_name, "filePaths": [str(entry.relative_to(ROOT))]})
+    return node
+
+
+def _derive_project_node(name: str, spec: Dict) -> Dict:
+    if "$path" in spec:
+        path = ROOT / spec["$path"]
+        if path.is_dir():
+            node = _derive_directory(name, path)
+        else:
+            script = _script_class(path.name)
+            node = {"name": name, "className": script[1] if script else "Folder", "filePaths": [spec["$path"]]}
+    else:
+        node = {"name": name, "className": spec.get("$className", name), "children": []}
+    for key, value in spec.items():
+        if not key.startswith("$") and isinstance(value, dict):
+            node.setdefault("children", []).append(_derive_project_node(key, value))
+    return node
+
+
+def derive_sourcemap(project_path: Path = PROJECT_PATH) -> Dict:
+    """Build a sourcemap-shaped tree from default.project.json using Rojo's file rules."""
+    project = json.loads(project_path.read_text(encoding="utf-8"))
+    return _derive_project_node(project.get("name", "DataModel"), project["tree"])
+
+
+def _index_tree(tree: Dict) -> Dict[str, Tuple[DataModelPath, str]]:
+    """file path -> (DataModel path, class name)."""
+    files: Dict[str, Tuple[DataModelPath, str]] = {}
+
+    def walk(node: Dict, path: DataModelPath) -> None:
+        for file_path in node.get("filePaths", []):
+            if file_path.endswith(LUAU_EXTENSIONS):
+                files[file_path] = (path, node["className"])
+        for child in node.get("children", []):
+            walk(child, path + (child["name"],))
+
+    walk(tree, ())
+    return files
+
+
+def load_tree(sourcemap_path: Path) -> Tuple[Dict[str, Tuple[DataModelPath, str]], List[str]]:
+    """Return the file index and any files missing from a stale sourcemap."""
+    derived = _index_tree(derive_sourcemap())
+    if not sourcemap_path.exists():
+        return derived, []
+    mapped = _index_tree(json.loads(sourcemap_path.read_text(encoding="utf-8")))
+    missing = sorted(set(derived) - set(mapped))
+    return (derived if missing else mapped), missing
+
+
+# -- per-module analysis ---------------------------------------------------------
+
+
+class Require:
+    __slots__ = ("line", "target", "eager", "binding", "text")
+
+    def __init__(self, line: int, target: Optional[DataModelPath], eager: bool, binding: Optional[str], text: str):
+        self.line = line
+        self.target = target
+        self.eager = eager
+        self.binding = binding
+        self.text = text
+
+
+class Module:
+    def __init__(self, file_path: str, path: DataModelPath, class_name: str):
+        self.file_path = file_path
+        self.path = path
+        self.class_name = class_name
+        self.bytes = (ROOT / file_path).stat().st_size
+        self.strings = 0
+        self.unique_strings = 0
+        self.numbers = 0
+        self.table_fields = 0
+        self.requires: List[Require] = []
+        self.top_level_uses: Dict[str, int] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def dotted(self) -> str:
+        return ".".join(self.path)
+
+
+class _Analyzer:
+    """Single pass over one module's tokens: constants, requires and binding uses."""
+
+    PATH_METHODS = ("WaitForChild", "FindFirstChild")
+
+    def __init__(self, module: Module, tokens):
+        self.module = module
+        self.toks = tokens
+        self.env: Dict[str, Optional[DataModelPath]] = {"game": (), "script": module.path}
+
+    def tok(self, k: int):
+        return self.toks[k] if k < len(self.toks) else None
+
+    def is_op(self, k: int, text: str) -> bool:
+        token = self.tok(k)
+        return token is not None and token.kind == OP and token.text == text
+
+    def skip_group(self, k: int) -> int:
+        depth = 0
+        while k < len(self.toks):
+            token = self.toks[k]
+            if token.kind == OP and token.text in ("(", "[", "{"):
+                depth += 1
+            elif token.kind == OP and token.text in (")", "]", "}"):
+                depth -= 1
+                if depth == 0:
+                    return k + 1
+            k += 1
+        return k
+
+    def path_expr(self, k: int) -> Tuple[Optional[DataModelPath], int]:
+        """Evaluate an Instance path expression starting at k."""
+        token = self.tok(k)
+        if token is None or token.kind != NAME:
+            return None, k
+        name = token.text
+        k += 1
+        # `self.field` style locals are tracked by their dotted name.
+        while self.is_op(k, ".") and self.tok(k + 1) is not None and f"{name}.{self.toks[k + 1].text}" in self.env:
+            name = f"{name}.{self.toks[k + 1].text}"
+            k += 2
+        if name not in self.env:
+            return None, k
+        path = self.env[name]
+
+        while True:
+            if self.is_op(k, ".") and self.tok(k + 1) is not None and self.toks[k + 1].kind == NAME:
+                member = self.toks[k + 1].text
+                if path is not None:
+                    path = path[:-1] if member == "Parent" else path + (member,)
+                k += 2
+            elif self.is_op(k, ":") and self.tok(k + 1) is not None and self.is_op(k + 2, "("):
+                method = self.toks[k + 1].text
+                argument = self.tok(k + 3)
+                end = self.skip_group(k + 2)
+                literal = argument.text[1:-1] if argument is not None and argument.kind == STRING else None
+                if path is not None and literal is not None and method in self.PATH_METHODS:
+                    path = path + (literal,)
+                elif path == () and literal is not None and method == "GetService":
+                    path = (literal,)
+                else:
+                    path = None
+                k = end
+            elif self.is_op(k, "[") and self.tok(k + 1) is not None and self.toks[k + 1].kind == STRING and self.is_op(k + 2, "]"):
+                if path is not None:
+                    path = path + (self.toks[k + 1].text[1:-1],)
+                k += 3
+            else:
+                return path, k
+
+    def assignment_target(self, k: int) -> Tuple[Optional[str], int]:
+        """If `a.b.c =` starts at k, return ("a.b.c", index of the expression)."""
+        token = self.tok(k)
+        if token is None or token.kind != NAME:
+            return None, k
+        name = token.text
+        j = k + 1
+        while self.is_op(j, ".") and self.tok(j + 1) is not None and self.toks[j + 1].kind == NAME:
+            name = f"{name}.{self.toks[j + 1].text}"
+            j += 2
+        if self.is_op(j, "="):
+            return name, j + 1
+        return None, k
+
+    def run(self) -> None:
+        module = self.module
+        toks = self.toks
+        blocks: List[str] = []
+        function_depth = 0
+        strings = set()
+        bindings: Dict[str, int] = {}
+        table_stack: List[List[int]] = []  # [separators, tokens seen, trailing separator]
+
+        k = 0
+        while k < len(toks):
+            token = toks[k]
+
+            # Constants and table constructors.
+            if token.kind == STRING:
+                module.strings += 1
+                strings.add(token.text)
+            elif token.kind == NUMBER:
+                module.numbers += 1
+            if token.kind == OP and token.text in ("(", "[", "{"):
+                table_stack.append([0, 0, 0] if token.text == "{" else [-1, 0, 0])
+            elif token.kind == OP and token.text in (")", "]", "}"):
+                if table_stack:
+                    seps, seen, trailing = table_stack.pop()
+                    if seps >= 0 and seen:
+                        module.table_fields += seps + 1 - trailing
+                if table_stack:
+                    table_stack[-1][1] += 1
+                    table_stack[-1][2] = 0
+            elif table_stack:
+                frame = table_stack[-1]
+                if frame[0] >= 0 and token.kind == OP and token.text in (",", ";"):
+                    frame[0] += 1
+                    frame[2] = 1
+                else:
+                    frame[1] += 1
+                    frame[2] = 0
+
+            # Block structure, to tell top-level code from function bodies.
+            if token.kind == KEYWORD:
+                if token.text in ("function", "do", "if", "repeat"):
+                    blocks.append(token.text)
+                    function_depth += token.text == "function"
+                elif token.text in ("end", "until") and blocks:
+                    function_depth -= blocks.pop() == "function"
+
+            if token.kind == NAME:
+                if token.text == "require" and self.is_op(k + 1, "("):
+                    target, after = self.path_expr(k + 2)
+                    end = self.skip_group(k + 1)
+                    binding = None
+                    if k >= 3 and toks[k - 3].kind == KEYWORD and toks[k - 3].text == "local" and toks[k - 2].kind == NAME and self.is_op(k - 1, "="):
+                        binding = toks[k - 2].text
+                        if function_depth == 0:
+                            bindings[binding] = k
+                    text = " ".join(t.text for t in toks[k + 2:end - 1])
+                    module.requires.append(Require(token.line, target if after == end - 1 else None, function_depth == 0, binding, text))
+                    k = end
+                    continue
+
+                prev = toks[k - 1] if k else None
+                is_member = prev is not None and prev.kind == OP and prev.text in (".", ":")
+                if not is_member and token.text in bindings and function_depth == 0:
+                    module.top_level_uses[token.text] = module.top_level_uses.get(token.text, 0) + 1
+
+                if not is_member:
+                    local = prev is not None and prev.kind == KEYWORD and prev.text == "local"
+                    target, expr = self.assignment_target(k)
+                    if target is not None and (local or "." in target or target in self.env):
+                        path, after = self.path_expr(expr)
+                        # Only a bare path expression binds a path; `x = a.b + 1` does not.
+                        following = self.tok(after)
+                        complete = following is None or following.kind != OP or following.text in (",", ";", ")")
+                        self.env[target] = path if complete else None
+
+            k += 1
+
+        module.unique_strings = len(strings)
+        for name in bindings:
+            module.top_level_uses.setdefault(name, 0)
+
+
+def analyze_module(module: Module) -> None:
+    try:
+        source = (ROOT / module.file_path).read_text(encoding="utf-8")
+        tokens = significant(tokenize(source))
+    except (LexError, UnicodeDecodeError) as exc:
+        module.error = str(exc)
+        return
+    _Analyzer(module, tokens).run()
+
+
+# -- graph -------------------------------------------------------------------------
+
+
+class RequireGraph:
+    def __init__(self, modules: Sequence[Module]):
+        self.modules = list(modules)
+        self.by_path: Dict[DataModelPath, Module] = {module.path: module for module in modules}
+
+    def edges(self, module: Module, eager_only: bool = False) -> List[Tuple[Require, Module]]:
+        out = []
+        for require in module.requires:
+            target = self.by_path.get(require.target) if require.target is not None else None
+            if target is not None and (require.eager or not eager_only):
+                out.append((require, target))
+        return out
+
+    def reachable(self, entry: Module, eager_only: bool = False) -> List[Module]:
+        seen = {entry.path}
+        order = [entry]
+        stack = [entry]
+        while stack:
+            for _, target in self.edges(stack.pop(), eager_only):
+                if target.path not in seen:
+                    seen.add(target.path)
+                    order.append(target)
+                    stack.append(target)
+        return order
+
+    def critical_path(self, entry: Module) -> Tuple[int, List[Tuple[Module, Optional[Require]]]]:
+        """Heaviest require chain from `entry` by cumulative bytes (cycles are cut)."""
+        memo: Dict[DataModelPath, Tuple[int, List[Tuple[Module, Optional[Require]]]]] = {}
+
+        def visit(module: Module, via: Optional[Require], active: set) -> Tuple[int, List]:
+            if module.path in memo and via is None:
+                return memo[module.path]
+            best = (0, [])
+            active.add(module.path)
+            for require, target in self.edges(module):
+                if target.path in active:
+                    continue
+                cost, chain = visit(target, None, active)
+                if cost > best[0]:
+                    best = (cost, [(target, require)] + chain[1:])
+            active.discard(module.path)
+            result = (module.bytes + best[0], [(module, via)] + best[1])
+            memo[module.path] = result
+            return result
+
+        return visit(entry, None, set())
+
+    def lazy_candidates(self, entry: Module) -> List[Tuple[Module, Require, Module, int]]:
+        """Top-level requires on the startup path whose binding is only used in functions."""
+        candidates = []
+        for module in self.reachable(entry):
+            for require, target in self.edges(module, eager_only=True):
+                if require.binding and module.top_level_uses.get(require.binding, 0) == 0:
+                    closure = sum(m.bytes for m in self.reachable(target, eager_only=True))
+                    candidates.append((module, require, target, closure))
+        candidates.sort(key=lambda item: -item[3])
+        return candidates
+
+
+def build_graph(sourcemap_path: Path = SOURCEMAP_PATH) -> Tuple[RequireGraph, List[str]]:
+    with span("load"):
+        files, stale = load_tree(sourcemap_path)
+        modules = [Module(file_path, path, class_name) for file_path, (path, class_name) in sorted(files.items())]
+    with span("parse"):
+        for module in modules:
+            analyze_module(module)
+    count("modules", len(modules))
+    return RequireGraph(modules), stale
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def report(graph: RequireGraph) -> Dict:
+    entries = [module for module in graph.modules if module.class_name in ENTRY_CLASSES]
+    payload = {"modules": [], "entries": [], "unresolved": []}
+
+    print(f"📦 Modules ({len(graph.modules)})")
+    print(f"  {'Module':<72} {'Size':>9} {'Strings':>8} {'Unique':>7} {'Fields':>7} {'Requires':>8}")
+    for module in sorted(graph.modules, key=lambda m: -m.bytes):
+        print(f"  {module.dotted:<72} {_kb(module.bytes):>9} {module.strings:>8} {module.unique_strings:>7} {module.table_fields:>7} {len(module.requires):>8}")
+        payload["modules"].append({
+            "path": module.dotted,
+            "file": module.file_path,
+            "class": module.class_name,
+            "bytes": module.bytes,
+            "strings": module.strings,
+            "uniqueStrings": module.unique_strings,
+            "numbers": module.numbers,
+            "tableFields": module.table_fields,
+            "requires": [
+                {"line": r.line, "target": ".".join(r.target) if r.target is not None else None, "eager": r.eager}
+                for r in module.requires
+            ],
+            "error": module.error,
+        })
+
+    for entry in entries:
+        side = "client" if entry.class_name == "LocalScript" else "server"
+        reachable = graph.reachable(entry)
+        eager = graph.reachable(entry, eager_only=True)
+        cost, chain = graph.critical_path(entry)
+        print(f"\n🚀 {side.title()} startup: {entry.dotted}")
+        print(f"  Reachable: {len(reachable)} modules, {_kb(sum(m.bytes for m in reachable))}")
+        print(f"  Eager at load: {len(eager)} modules, {_kb(sum(m.bytes for m in eager))}")
+        print(f"  Critical path ({_kb(cost)}):")
+        for module, via in chain:
+            kind = "" if via is None else (" [eager]" if via.eager else " [deferred]")
+            print(f"    -> {module.dotted} ({_kb(module.bytes)}){kind}")
+
+        lazy = graph.lazy_candidates(entry)
+        if lazy:
+            print("  💤 Lazy-require candidates (binding only used inside functions):")
+            for module, require, target, closure in lazy:
+                flag = " ⚠️" if closure >= LAZY_BYTES_THRESHOLD else ""
+                print(f"    {module.file_path}:{require.line} {require.binding} -> {target.dotted} ({_kb(closure)} eager closure){flag}")
+
+        payload["entries"].append({
+            "entry": entry.dotted,
+            "side": side,
+            "reachable": [m.dotted for m in reachable],
+            "reachableBytes": sum(m.bytes for m in reachable),
+            "eager": [m.dotted for m in eager],
+            "eagerBytes": sum(m.bytes for m in eager),
+            "criticalPath": [m.dotted for m, _ in chain],
+            "criticalPathBytes": cost,
+            "lazyCandidates": [
+                {"module": m.dotted, "line": r.line, "binding": r.binding, "target": t.dotted, "closureBytes": c}
+                for m, r, t, c in lazy
+            ],
+        })
+
+    unresolved = [(module, require) for module in graph.modules for require in module.requires
+                  if require.target is None or require.target not in graph.by_path]
+    if unresolved:
+        print("\n❓ Unresolved requires:")
+        for module, require in unresolved:
+            print(f"  {module.file_path}:{require.line} require({require.text})")
+            payload["unresolved"].append({"file": module.file_path, "line": require.line, "expression": require.text})
+    return payload
+
+
+@profiled("require_graph")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the static require graph and startup cost of the Rojo tree.")
+    parser.add_argument("--sourcemap", type=Path, default=SOURCEMAP_PATH, help="Rojo sourcemap.json (derived from default.project.json if stale).")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the report as JSON.")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    graph, stale = build_graph(args.sourcemap)
+    if stale:
+        print(f"⚠️  {args.sourcemap.name} is missing {len(stale)} file(s); using the tree derived from {PROJECT_PATH.name}:")
+        for file_path in stale:
+            print(f"  - {file_path}")
+        print()
+
+    # Reachability and critical paths are computed while the report prints.
+    with span("transform"):
+        payload = report(graph)
+    if args.json:
+        with span("serialize"):
+            text = json.dumps(payload, indent=2) + "\n"
+        with span("write"):
+            args.json.parent.mkdir(parents=True, exist_ok=True)
+            args.json.write_text(text, encoding="utf-8")
+        print(f"\n💾 Report saved to: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())